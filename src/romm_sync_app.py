@@ -8,6 +8,8 @@ import shutil
 import threading
 import pickle
 import time
+import hashlib
+import weakref
 import logging
 from pathlib import Path
 from urllib.parse import urljoin, quote
@@ -25,7 +27,35 @@ import re
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
 import queue
-from collections import defaultdict
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from dataclasses import dataclass
+
+# orjson is optional: much faster (de)serialization of the on-disk caches
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# numpy is optional: used to sort very large libraries in C (np.lexsort)
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Libraries at least this large take the numpy sort path when numpy is available
+NUMPY_SORT_MIN_GAMES = 200
+
+# PlatformItem.sync_status_text values that show a collection sync dot; each
+# is also the dot's CSS class (.sync-dot.<status> in the window stylesheet)
+_SYNC_DOT_STATUSES = frozenset(('synced', 'syncing', 'disabled'))
+
+# Download progress reaches the tree rows at most this often (~30 Hz)
+PROGRESS_UI_INTERVAL_MS = 33
+
+# Per-step timing logs in the collection auto-sync toggle (ROMM_DEBUG_TOGGLE=1)
+_DEBUG_TOGGLE = os.environ.get('ROMM_DEBUG_TOGGLE') == '1'
 
 # Fix SSL certificate path for AppImage environment
 # Use system certificates instead of bundled certifi
@@ -506,6 +536,375 @@ except ValueError:
 
 from romm_sync_engine.sync_core import *
 
+@dataclass(slots=True)
+class SyncEvent:
+    """A UI update posted by a sync worker thread, dispatched on the main loop by kind"""
+    kind: str
+    payload: tuple
+
+def iter_selected_positions(selection_model):
+    """Yield the selected row positions of a Gtk.SelectionModel via its bitset
+
+    Only the set bits are visited, so the cost scales with the selection
+    size rather than with the number of rows in the model.
+    """
+    bitset = selection_model.get_selection()
+    valid, bitset_iter, position = Gtk.BitsetIter.init_first(bitset)
+    while valid:
+        yield position
+        valid, position = bitset_iter.next()
+
+def single_selected_position(selection_model):
+    """The selected row position when exactly one row is selected, else None
+
+    Answered from the selection bitset's size, without visiting the selection.
+    """
+    bitset = selection_model.get_selection()
+    if bitset.get_size() == 1:
+        return bitset.get_minimum()
+    return None
+
+def load_json_cache(path):
+    """Read a JSON cache file, using orjson when it is installed"""
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r') as f:
+        return json.load(f)
+
+def serialize_json_cache(obj):
+    """Serialize a cache object to JSON bytes, using orjson when it is installed
+
+    orjson writes standard JSON, so files stay readable by either code path.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj).encode('utf-8')
+
+def _write_bytes_atomic(path, data):
+    """Write via a temp file + os.replace so readers never see a partial file"""
+    tmp_path = f'{path}.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+def dump_json_cache(path, obj):
+    """Write a JSON cache file"""
+    _write_bytes_atomic(path, serialize_json_cache(obj))
+
+def dump_json_cache_if_changed(path, obj):
+    """Write a JSON cache file unless its content is unchanged
+
+    A blake2b digest of the last write is kept in a '.hash' sidecar. When it
+    matches, only the mtime is refreshed (cache age checks rely on it).
+    Returns True if the file was rewritten.
+    """
+    path = Path(path)
+    data = serialize_json_cache(obj)
+    digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+    hash_file = path.with_name(path.name + '.hash')
+    try:
+        if path.exists() and hash_file.read_text() == digest:
+            os.utime(path)
+            return False
+    except OSError:
+        pass
+    _write_bytes_atomic(path, data)
+    hash_file.write_text(digest)
+    return True
+
+def numpy_sort_games(games, downloaded_first=False):
+    """Sort games by (platform, [not downloaded], lowercase name) with np.lexsort
+
+    Keys are gathered into arrays once and compared in C; np.lexsort is
+    stable, so ties keep their input order exactly like sorted().
+    Expects _name_lc to be present on every game (see ensure_search_keys).
+    """
+    n = len(games)
+    # Platforms are few: intern them as int codes in sorted order so the
+    # primary key compares integers instead of fixed-width unicode
+    platform_list = [game.get('platform', 'ZZZ_Unknown') for game in games]
+    platform_code = {platform: code for code, platform in enumerate(sorted(set(platform_list)))}
+    platforms = np.fromiter((platform_code[p] for p in platform_list), dtype=np.int32, count=n)
+    names = np.array([game['_name_lc'] for game in games], dtype=str)
+    if downloaded_first:
+        not_downloaded = np.fromiter((not game.get('is_downloaded', False) for game in games),
+                                     dtype=bool, count=n)
+        order = np.lexsort((names, not_downloaded, platforms))  # last key is primary
+    else:
+        order = np.lexsort((names, platforms))
+    return [games[i] for i in order.tolist()]
+
+def downloaded_games_of(games):
+    """The downloaded subset of games"""
+    return [g for g in games if g.get('is_downloaded', False)]
+
+def ensure_search_keys(game):
+    """Cache lowercase name/platform on a game dict so search filtering doesn't re-lower them"""
+    if '_name_lc' not in game:
+        game['_name_lc'] = (game.get('name') or '').lower()
+        game['_platform_lc'] = (game.get('platform') or '').lower()
+    return game
+
+# Keys cached on game dicts from their name/platform (search keys and
+# game_key_of). They survive dict.copy(), so drop them whenever name or
+# platform is reassigned, and never persist them.
+_DERIVED_GAME_KEYS = ('_name_lc', '_platform_lc', '_game_key')
+
+def drop_derived_keys(game):
+    """Forget the keys derived from game's name/platform after either changed"""
+    for key in _DERIVED_GAME_KEYS:
+        game.pop(key, None)
+    return game
+
+def games_for_cache(games):
+    """games without the derived keys, copying only the dicts that carry them"""
+    return [drop_derived_keys(game.copy()) if any(key in game for key in _DERIVED_GAME_KEYS) else game
+            for game in games]
+
+def notify_items(items, *props):
+    """Notify props on every item with all of them frozen, so the row handlers
+    run once the whole batch is consistent instead of item by item"""
+    items = list(items)
+    for item in items:
+        item.freeze_notify()
+    try:
+        for item in items:
+            for prop in props:
+                item.notify(prop)
+    finally:
+        for item in items:
+            item.thaw_notify()
+
+def disc_key_for(disc_item):
+    """'rom_id:disc_name' key into disc_progress, computed once and kept on the item"""
+    try:
+        return disc_item._disc_key
+    except AttributeError:
+        rom_id = disc_item.parent_game.get('rom_id') if disc_item.parent_game else None
+        disc_name = disc_item.disc_data.get('name')
+        disc_item._disc_key = f"{rom_id}:{disc_name}" if rom_id and disc_name else None
+        return disc_item._disc_key
+
+def game_key_of(game):
+    """name|platform identifier (for games without a rom_id), cached on the game dict"""
+    game_key = game.get('_game_key')
+    if game_key is None:
+        game_key = game['_game_key'] = f"{game.get('name', '')}|{game.get('platform', '')}"
+    return game_key
+
+def is_custom_collection(collection):
+    """True for user-made collections; the result is tagged on the dict so it is classified once"""
+    is_custom = collection.get('_is_custom')
+    if is_custom is None:
+        is_custom = collection['_is_custom'] = (
+            not collection.get('is_auto_generated', False) and
+            collection.get('type') != 'auto' and
+            'auto' not in collection.get('name', '').lower()
+        )
+    return is_custom
+
+_KB, _MB, _GB = 1000, 1000**2, 1000**3
+
+def format_size_compact(bytes_val):
+    """Short decimal size for the size column while downloading (e.g. 512K, 40M, 1.2G)"""
+    if bytes_val >= _GB:
+        return f"{bytes_val / _GB:.1f}G"
+    elif bytes_val >= _MB:
+        return f"{bytes_val / _MB:.0f}M"
+    else:
+        return f"{bytes_val / _KB:.0f}K"
+
+def format_progress_compact(downloaded, total, speed):
+    """Size column text for an in-progress download"""
+    # One format per case, no intermediate size string
+    if total > 0:
+        if speed > 0:
+            return f"{format_size_compact(downloaded)}/{format_size_compact(total)} @{format_size_compact(speed)}/s"
+        return f"{format_size_compact(downloaded)}/{format_size_compact(total)} ..."
+    if speed > 0:
+        return f"{format_size_compact(downloaded)} @{format_size_compact(speed)}/s"
+    return f"{format_size_compact(downloaded)} ..."
+
+def set_label_text(label, text):
+    """label.set_text, skipped when the label already shows text (no relayout)
+
+    Tracked in label._last_text; a bind must reset that to None, since a
+    property binding may have changed the label behind it.
+    """
+    if label._last_text != text:
+        label._last_text = text
+        label.set_text(text)
+
+def set_sync_dot_status(dot, status):
+    """Show status on a .sync-dot box by swapping its status class (no dot for other values)"""
+    status = status if status in _SYNC_DOT_STATUSES else None
+    if dot._status_class == status:
+        return
+    if dot._status_class:
+        dot.remove_css_class(dot._status_class)
+    if status:
+        dot.add_css_class(status)
+    dot._status_class = status
+
+def _status_stroke(cr, rgb):
+    cr.set_source_rgb(*rgb)
+    cr.set_line_width(2.0)
+    cr.set_line_cap(1)  # Round caps
+    cr.set_line_join(1)  # Round joins
+
+def _draw_status_check(area, cr, width, height):
+    """Green checkmark ('downloaded' / 'completed')"""
+    center_x, center_y = width / 2.0, height / 2.0
+    _status_stroke(cr, (0.29, 0.86, 0.50))  # Green #4ade80
+    cr.move_to(center_x - 4, center_y)
+    cr.line_to(center_x - 1, center_y + 3)
+    cr.line_to(center_x + 4, center_y - 3)
+    cr.stroke()
+
+def _draw_status_arrow(area, cr, width, height):
+    """Blue down arrow ('not_downloaded')"""
+    center_x, center_y = width / 2.0, height / 2.0
+    _status_stroke(cr, (0.37, 0.51, 0.98))  # Blue #5e82fa
+    # Arrow shaft
+    cr.move_to(center_x, center_y - 4)
+    cr.line_to(center_x, center_y + 3)
+    cr.stroke()
+    # Arrow head
+    cr.move_to(center_x - 3, center_y)
+    cr.line_to(center_x, center_y + 3)
+    cr.line_to(center_x + 3, center_y)
+    cr.stroke()
+
+def _draw_status_cross(area, cr, width, height):
+    """Red X ('failed')"""
+    center_x, center_y = width / 2.0, height / 2.0
+    _status_stroke(cr, (0.97, 0.44, 0.44))  # Red #f87171
+    cr.move_to(center_x - 4, center_y - 4)
+    cr.line_to(center_x + 4, center_y + 4)
+    cr.stroke()
+    cr.move_to(center_x + 4, center_y - 4)
+    cr.line_to(center_x - 4, center_y + 4)
+    cr.stroke()
+
+def _draw_status_percent(area, cr, width, height):
+    """Orange percentage text ('downloading'), read from area._status_percent"""
+    if area._status_percent is None:
+        return
+    cr.set_source_rgb(0.98, 0.57, 0.24)  # Orange #fb923c
+    percentage_text = f"{area._status_percent}%"
+    cr.select_font_face("Sans", 0, 0)  # Normal, Non Bold
+    cr.set_font_size(15)
+
+    # Get text extents to center it
+    extents = cr.text_extents(percentage_text)
+    cr.move_to(width / 2.0 - extents.width / 2 - extents.x_bearing,
+               height / 2.0 - extents.height / 2 - extents.y_bearing)
+    cr.show_text(percentage_text)
+
+def _draw_status_nothing(area, cr, width, height):
+    pass
+
+# One shared draw func per download status, so status cells never build closures
+_STATUS_DRAW_FUNCS = {
+    'downloaded': _draw_status_check,
+    'completed': _draw_status_check,
+    'not_downloaded': _draw_status_arrow,
+    'failed': _draw_status_cross,
+    'downloading': _draw_status_percent,
+}
+
+@lru_cache(maxsize=None)
+def find_romm_icon_path():
+    """Location of romm_icon.png (or None), probed once per process"""
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+
+    # Try multiple icon locations for AppImage compatibility
+    icon_locations = [
+        os.path.join(script_dir, 'romm_icon.png'),  # AppImage location
+        os.path.join(script_dir, '..', 'assets', 'icons', 'romm_icon.png'),  # Regular install
+        'romm_icon.png'  # Fallback
+    ]
+    for location in icon_locations:
+        if os.path.exists(location):
+            return location
+    return None
+
+def dir_has_content(path):
+    """Whether the directory at path has any entries (stops at the first one)"""
+    try:
+        with os.scandir(path) as entries:
+            return next(entries, None) is not None
+    except OSError:
+        return False
+
+def _notify_sync_complete(parent, name, total):
+    """idle_add callback: desktop notification for a fully synced collection"""
+    parent.send_desktop_notification(
+        f"✅ {name} - Sync Complete",
+        f"{total}/{total} ROMs synced"
+    )
+    return False
+
+class DownloadProgressMap(dict):
+    """rom_id -> progress dict that signals idle_event whenever it becomes empty
+
+    Also tracks which entries have 'downloading' set, so the number of
+    active downloads is available without walking the values.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._lock = threading.Lock()
+        self._active = set()  # keys whose progress has 'downloading': True
+        self.idle_event = threading.Event()
+        self.idle_event.set()  # No downloads yet
+
+    @property
+    def active_count(self):
+        return len(self._active)
+
+    def active_keys(self):
+        """Snapshot of the keys currently downloading"""
+        with self._lock:
+            return frozenset(self._active)
+
+    def __setitem__(self, key, value):
+        with self._lock:
+            super().__setitem__(key, value)
+            if value.get('downloading', False):
+                self._active.add(key)
+            else:
+                self._active.discard(key)
+            self.idle_event.clear()
+
+    def __delitem__(self, key):
+        with self._lock:
+            super().__delitem__(key)
+            self._active.discard(key)
+            if not self:
+                self.idle_event.set()
+
+    def pop(self, key, *default):
+        with self._lock:
+            value = super().pop(key, *default)
+            self._active.discard(key)
+            if not self:
+                self.idle_event.set()
+            return value
+
+    def set_downloading(self, key, downloading):
+        """Flip the 'downloading' flag of an existing entry in place"""
+        with self._lock:
+            progress = self.get(key)
+            if progress is None:
+                return
+            progress['downloading'] = downloading
+            if downloading:
+                self._active.add(key)
+            else:
+                self._active.discard(key)
+
 class TrayIcon:
     """Cross-desktop tray icon using subprocess for AppIndicator"""
     
@@ -660,12 +1059,47 @@ if __name__ == "__main__":
             self.tray_process.terminate()
             print("✅ Tray icon cleaned up")
         
+class ItemRegistry:
+    """key -> live tree items, held by weak reference
+
+    Items register themselves on construction and drop out once the stores
+    holding them are rebuilt and they are collected, so lookups never need to
+    walk the tree.  A list per key (not a WeakSet) because GameItem equality
+    is by rom_id and the same ROM can appear once per collection.
+    """
+
+    def __init__(self):
+        self._refs = defaultdict(list)
+        # One shared callback; each KeyedRef (a __slots__ weakref) carries its key
+        self._drop_callback = self._drop
+
+    def add(self, key, item):
+        if key is None:
+            return
+        self._refs[key].append(weakref.KeyedRef(item, self._drop_callback, key))
+
+    def _drop(self, ref):
+        refs = self._refs
+        bucket = refs.get(ref.key)
+        if bucket is not None:
+            try:
+                bucket.remove(ref)
+            except ValueError:
+                pass
+            if not bucket:
+                refs.pop(ref.key, None)
+
+    def get(self, key):
+        return [item for ref in self._refs.get(key, ()) if (item := ref()) is not None]
+
 class GameItem(GObject.Object):
     def __init__(self, game_data):
         super().__init__()
         self.game_data = game_data
-        # Initialize child store for multi-disc games
-        self.child_store = Gio.ListStore()
+        game_items_by_rom_id.add(game_data.get('rom_id'), self)
+        # Child store for multi-disc/multi-regional games, created on first
+        # use so the (far more common) single-file rows don't each carry one
+        self.child_store = None
         self.rebuild_children()
 
     def __eq__(self, other):
@@ -681,10 +1115,9 @@ class GameItem(GObject.Object):
     def rebuild_children(self):
         """Rebuild child items (discs or regional variants) if this is a multi-disc/multi-regional game"""
         old_items = []
-        for i in range(self.child_store.get_n_items()):
-            old_items.append(self.child_store.get_item(i))
-
-        self.child_store.remove_all()
+        if self.child_store is not None:
+            for i in range(self.child_store.get_n_items()):
+                old_items.append(self.child_store.get_item(i))
 
         new_items = []
 
@@ -738,20 +1171,13 @@ class GameItem(GObject.Object):
                 variant_item = DiscItem(sibling_data, parent_game=self.game_data)
                 new_items.append(variant_item)
 
-        if new_items:
-            self.child_store.splice(0, 0, new_items)
-
-        for old_item in old_items:
-            if isinstance(old_item, DiscItem):
-                old_item.notify('is-downloaded')
-                old_item.notify('size-text')
-                old_item.notify('name')
+        if new_items and self.child_store is None:
+            self.child_store = Gio.ListStore()
+        if self.child_store is not None:
+            self.child_store.splice(0, self.child_store.get_n_items(), new_items)
 
-        for new_item in new_items:
-            if isinstance(new_item, DiscItem):
-                new_item.notify('is-downloaded')
-                new_item.notify('size-text')
-                new_item.notify('name')
+        notify_items((it for it in (*old_items, *new_items) if isinstance(it, DiscItem)),
+                     'is-downloaded', 'size-text', 'name')
 
     @GObject.Property(type=str, default='Unknown')
     def name(self):
@@ -868,6 +1294,10 @@ class DiscItem(GObject.Object):
         super().__init__()
         self.disc_data = disc_data
         self.parent_game = parent_game  # Reference to parent game data
+        # Regional variants carry their own rom_id; discs are addressed via the parent
+        disc_items_by_rom_id.add(disc_data.get('rom_id'), self)
+        if parent_game:
+            disc_items_by_key.add((parent_game.get('rom_id'), disc_data.get('name')), self)
 
     @GObject.Property(type=str, default='Unknown')
     def name(self):
@@ -915,37 +1345,82 @@ class DiscItem(GObject.Object):
             return f"{size} bytes"
         return "Not downloaded"
 
+# Lookup tables for progress/status updates (see ItemRegistry)
+game_items_by_rom_id = ItemRegistry()
+disc_items_by_rom_id = ItemRegistry()   # regional variant rom_id -> DiscItems
+disc_items_by_key = ItemRegistry()      # (parent rom_id, disc name) -> DiscItems
+
 class PlatformItem(GObject.Object):
-    def __init__(self, platform_name, games, loading=False, sync_status=None):
+    def __init__(self, platform_name, games, sync_status=None):
         super().__init__()
         self.platform_name = platform_name
         self.games = games
-        self.loading = loading  # Flag to show loading state
         self.sync_status = sync_status  # Sync status for collections: 'synced', 'syncing', 'disabled'
         self.child_store = Gio.ListStore()
         self.rebuild_children()
     
-    def update_games(self, new_games, loading=False, sync_status=None):
+    def update_games(self, new_games, sync_status=None):
         self.games = new_games
-        self.loading = loading  # Update loading state
         if sync_status is not None:
             self.sync_status = sync_status
         self.rebuild_children()
-        # Notify all properties changed
+        # Notify all properties changed (delivered together on thaw)
+        self.freeze_notify()
         self.notify('name')
         self.notify('status-text')
         self.notify('size-text')
         self.notify('sync-status-text')
+        self.thaw_notify()
     
     def rebuild_children(self):
         """Optimized: Batch append game items instead of one-by-one"""
-        self.child_store.remove_all()
-
         # Batch create GameItems for better performance
-        if self.games:
-            game_items = [GameItem(game) for game in self.games]
-            # Use splice for batched insertion (much faster than individual appends)
-            self.child_store.splice(0, 0, game_items)
+        game_items = [GameItem(game) for game in self.games] if self.games else []
+        # Remember the wrappers so filter/sort toggles can reuse them
+        self._game_items = {id(item.game_data): item for item in game_items}
+        # One splice replaces the old items and inserts the new ones in a
+        # single items-changed emission (no separate remove_all)
+        self.child_store.splice(0, self.child_store.get_n_items(), game_items)
+
+    def show_games(self, games):
+        """Replace the rows with games (a reordered/filtered view of self.games) in one splice"""
+        new_items = self.game_items_for(games)
+        self.child_store.splice(0, self.child_store.get_n_items(), new_items)
+
+    def game_items_for(self, games):
+        """GameItems for games (a reordered/filtered view of self.games), reusing existing wrappers"""
+        cache = self._game_items
+        items = []
+        for game in games:
+            item = cache.get(id(game))
+            if item is None or item.game_data is not game:
+                item = cache[id(game)] = GameItem(game)
+            elif game.get('is_multi_disc') or game.get('_sibling_files'):
+                # Disc/variant rows are built from the game data at
+                # construction time; refresh them
+                item.rebuild_children()
+            items.append(item)
+        return items
+
+    def sorted_games(self, downloaded_first=False, downloaded_only=False):
+        """Return games sorted by name (optionally downloaded first / downloaded only)
+
+        Sort and filter work on index arrays built in one pass over the game
+        dicts. They are rebuilt per call because games are updated in place as
+        downloads finish.
+        """
+        games = self.games
+        names_lc = [ensure_search_keys(g)['_name_lc'] for g in games]
+        downloaded = bytearray(bool(g.get('is_downloaded', False)) for g in games)
+
+        indices = range(len(games))
+        if downloaded_only:
+            indices = [i for i in indices if downloaded[i]]
+        if downloaded_first:
+            order = sorted(indices, key=lambda i: (not downloaded[i], names_lc[i]))
+        else:
+            order = sorted(indices, key=names_lc.__getitem__)
+        return [games[i] for i in order]
 
 
     @GObject.Property(type=str, default='Unknown Platform')
@@ -955,9 +1430,6 @@ class PlatformItem(GObject.Object):
     
     @GObject.Property(type=str, default='0/0')
     def status_text(self):
-        if self.loading:
-            return "..."
-        
         # Count games OR individual regional variants
         total_count = 0
         downloaded_count = 0
@@ -1004,8 +1476,6 @@ class PlatformItem(GObject.Object):
     
     @GObject.Property(type=str, default='0 KB')
     def size_text(self):
-        if self.loading:
-            return "Loading..."
         # Calculate downloaded size (local files)
         downloaded_size = sum(g.get('local_size', 0) for g in self.games if g.get('is_downloaded'))
         
@@ -1056,8 +1526,6 @@ class PlatformItem(GObject.Object):
     @GObject.Property(type=str, default='')
     def sync_status_text(self):
         """Return sync status indicator for collections"""
-        if self.loading:
-            return "loading"
         if self.sync_status is None:
             return ""  # Platforms don't have sync status
 
@@ -1114,62 +1582,51 @@ class LibraryTreeModel:
             # Check if this game has children (multi-disc game OR regional variants)
             is_multi = item.game_data.get('is_multi_disc', False)
             has_siblings = bool(item.game_data.get('_sibling_files'))
-            child_count = len(item.child_store)
+            child_store = item.child_store
 
-            if child_count > 0 and (is_multi or has_siblings):
-                return item.child_store
+            if child_store is not None and child_store.get_n_items() > 0 and (is_multi or has_siblings):
+                return child_store
         return None
 
+    def _platform_rows(self):
+        """(PlatformItem, TreeListRow) for each top-level item, without walking expanded children"""
+        for i in range(self.root_store.get_n_items()):
+            row = self.tree_model.get_child_row(i)
+            if row:
+                yield self.root_store.get_item(i), row
+
+    def expand_platforms(self, platform_names):
+        """Expand the named top-level rows"""
+        names = set(platform_names)
+        for platform, row in self._platform_rows():
+            if platform.platform_name in names:
+                row.set_expanded(True)
+
     def _get_current_expansion_state(self):
         """Get the current expansion state of all platform items"""
-        expansion_state = {}
-        for i in range(self.tree_model.get_n_items()):
-            item = self.tree_model.get_item(i)
-            if item and item.get_depth() == 0:
-                platform = item.get_item()
-                if isinstance(platform, PlatformItem):
-                    expansion_state[platform.platform_name] = item.get_expanded()
-        return expansion_state
+        return {platform.platform_name: row.get_expanded()
+                for platform, row in self._platform_rows()}
 
     def _restore_expansion_from_state(self, expansion_state):
         """Restore expansion state for all platform items"""
-        for i in range(self.tree_model.get_n_items()):
-            item = self.tree_model.get_item(i)
-            if item and item.get_depth() == 0:
-                platform = item.get_item()
-                if isinstance(platform, PlatformItem):
-                    should_expand = expansion_state.get(platform.platform_name, False)
-                    if should_expand:
-                        item.set_expanded(True)
-                    else:
-                        item.set_expanded(False)
+        for platform, row in self._platform_rows():
+            row.set_expanded(expansion_state.get(platform.platform_name, False))
 
     def _restore_expansion_immediate(self, expansion_state):
         """Restore expansion state immediately (used by search)"""
         self._restore_expansion_from_state(expansion_state)
 
-    def update_library(self, games, group_by='platform', loading=False, sync_status_map=None):
-        overall_start = time.time()
-
-        # Save expansion state before update
-        save_exp_start = time.time()
-        expansion_state = {}
-        for i in range(self.tree_model.get_n_items()):
-            item = self.tree_model.get_item(i)
-            if item and item.get_depth() == 0:
-                platform = item.get_item()
-                if isinstance(platform, PlatformItem):
-                    expansion_state[platform.platform_name] = item.get_expanded()
+    def update_library(self, games, group_by='platform', sync_status_map=None):
+        # Save expansion state before update (top-level rows only)
+        expansion_state = self._get_current_expansion_state()
 
         # Group games
-        group_start = time.time()
         groups = {}
         for game in games:
             key = game.get(group_by, 'Unknown')
             groups.setdefault(key, []).append(game)
 
         # Build a map of existing platform items to reuse them
-        map_start = time.time()
         existing_platforms = {}
         for i in range(self.root_store.get_n_items()):
             platform_item = self.root_store.get_item(i)
@@ -1181,15 +1638,13 @@ class LibraryTreeModel:
             # Get sync status for this collection/platform
             sync_status = sync_status_map.get(name) if sync_status_map else None
 
-            # Debug: check for multi-disc games in this group
-            multi_count = sum(1 for g in game_list if g.get('is_multi_disc', False))
             if name in existing_platforms:
                 # Reuse existing platform item (preserves state)
                 platform = existing_platforms[name]
-                platform.update_games(game_list, loading=loading, sync_status=sync_status)
+                platform.update_games(game_list, sync_status=sync_status)
             else:
                 # Create new platform item
-                platform = PlatformItem(name, game_list, loading=loading, sync_status=sync_status)
+                platform = PlatformItem(name, game_list, sync_status=sync_status)
             new_platform_items.append(platform)
 
         # Use splice to update the store in-place (preserves tree item expansion state)
@@ -1202,13 +1657,7 @@ class LibraryTreeModel:
         # Restore expansion state IMMEDIATELY (no timer delay to prevent visual glitch)
         # The TreeListRow objects are recreated by splice(), so we must restore state now
         if expansion_state:
-            for i in range(self.tree_model.get_n_items()):
-                item = self.tree_model.get_item(i)
-                if item and item.get_depth() == 0:
-                    platform = item.get_item()
-                    if isinstance(platform, PlatformItem):
-                        if expansion_state.get(platform.platform_name, False):
-                            item.set_expanded(True)
+            self.expand_platforms(name for name, expanded in expansion_state.items() if expanded)
 
 class EnhancedLibrarySection:
     """Enhanced library section with tree view"""
@@ -1222,10 +1671,42 @@ class EnhancedLibrarySection:
         self.selected_checkboxes = set()  # Keep this for compatibility
         self.selected_rom_ids = set()     # Add this new tracking
         self.selected_game_keys = set()   # Add this for non-ROM ID games
+        self.column_view = None  # Created by setup_library_ui
+        self.platform_filter = None  # Created by create_toolbar
+        self.sync_status_column = None  # Created by create_tree_view
+        # Row type -> per-type helper for each column's bind callback
+        # (an exact type() lookup instead of an isinstance chain per bind)
+        self._bind_name_dispatch = {
+            PlatformItem: self._bind_name_platform,
+            DiscItem: self._bind_name_disc,
+            GameItem: self._bind_name_game,
+        }
+        self._bind_status_dispatch = {
+            PlatformItem: self._bind_status_platform,
+            DiscItem: self._bind_status_disc,
+            GameItem: self._bind_status_game,
+        }
+        self._bind_size_dispatch = {
+            PlatformItem: self._bind_size_platform,
+            DiscItem: self._bind_size_disc,
+            GameItem: self._bind_size_game,
+        }
+        self._bind_sync_status_dispatch = {
+            PlatformItem: self._bind_sync_status_platform,
+        }
         self.setup_library_ui()
         self.filtered_games = []
         self.search_text = ""
         self.game_progress = {}  # rom_id -> progress_info
+        # Row refreshes queued by progress ticks, drained together at most
+        # every PROGRESS_UI_INTERVAL_MS
+        self._pending_progress_updates = set()  # rom_ids
+        self._pending_disc_updates = set()      # (rom_id, disc name)
+        self._progress_update_lock = threading.Lock()
+        self._progress_update_scheduled = False
+        self.disc_progress = {}  # "rom_id:disc_name" -> progress_info
+        self._redraw_scheduled = False
+        self._ui_refresh_pending = False  # selection label/action buttons refresh queued
         self.show_downloaded_only = False # Filter state
         self.sort_downloaded_first = False  # Sort mode state
         self.current_view_mode = 'platform'
@@ -1255,8 +1736,54 @@ class EnhancedLibrarySection:
         self.collection_auto_sync_enabled = False
         self.collection_sync_thread = None
         self.collection_sync_interval = 30
+        self._caches_ready = threading.Event()  # Set once collection ROM caches are initialized
+        self._collection_rom_ids = {}  # collection name -> set of ROM IDs seen on last check
+        self._collection_meta = {}  # collection name -> (rom_count, updated_at) seen on last check
+        # Collection status refreshes queued for the next idle flush
+        self._pending_status_updates = set()
+        self._status_update_lock = threading.Lock()
+        self._status_update_scheduled = False
+        # Worker -> main loop event bus (drained in one idle callback)
+        self._sync_events = deque()
+        self._sync_events_lock = threading.Lock()
+        self._sync_events_scheduled = False
+        self._sync_event_handlers = {
+            'log': self.parent.log_message,
+            'notify': self.parent.send_desktop_notification,
+            'tree_add': self._add_synced_game_to_tree,
+            'game_done': self._on_synced_game_downloaded,
+        }
+        # Bumped when the library or collections are reloaded; part of the
+        # autosync rom_id index key
+        self._library_version = 0
+        # is_game_in_autosync_collection index (see _get_autosync_rom_ids)
+        self._autosync_rom_ids = set()
+        self._autosync_index_key = None
         self.load_selected_collections()
 
+    def _post_sync_event(self, kind, *payload):
+        """Queue a UI event from a worker thread; one idle callback drains the queue"""
+        with self._sync_events_lock:
+            self._sync_events.append(SyncEvent(kind, payload))
+            if self._sync_events_scheduled:
+                return
+            self._sync_events_scheduled = True
+        GLib.idle_add(self._drain_sync_events)
+
+    def _drain_sync_events(self):
+        """Dispatch all queued sync events on the main loop"""
+        with self._sync_events_lock:
+            events = list(self._sync_events)
+            self._sync_events.clear()
+            self._sync_events_scheduled = False
+
+        for event in events:
+            try:
+                self._sync_event_handlers[event.kind](*event.payload)
+            except Exception as e:
+                print(f"⚠️ Sync event '{event.kind}' failed: {e}")
+        return False
+
     def is_path_validly_downloaded(self, path):
         """Check if a path (file or folder) is validly downloaded
 
@@ -1267,21 +1794,27 @@ class EnhancedLibrarySection:
             bool: True if path is validly downloaded (folder with content or file with size > 1024)
         """
         path = Path(path)
-        if not path.exists():
+        # One stat answers exists/is_dir/is_file/size
+        st = self._stat_or_none(path)
+        if st is None:
             return False
 
-        if path.is_dir():
+        if stat.S_ISDIR(st.st_mode):
             # For folders, check if directory has content
-            try:
-                return any(path.iterdir())
-            except (PermissionError, OSError):
-                return False
-        elif path.is_file():
+            return dir_has_content(path)
+        elif stat.S_ISREG(st.st_mode):
             # For files, check if file has reasonable size
-            return path.stat().st_size > 1024
+            return st.st_size > 1024
 
         return False
 
+    def _stat_or_none(self, path):
+        """os.stat() result for path, or None if it doesn't exist / can't be read"""
+        try:
+            return os.stat(path)
+        except (OSError, ValueError):
+            return None
+
     def get_actual_file_size(self, path):
         """Get actual size - sum all files for directories, file size for files"""
         path = Path(path)
@@ -1293,6 +1826,48 @@ class EnhancedLibrarySection:
         else:
             return 0
 
+    def _index_download_dir(self, platform_dir):
+        """Scan a platform directory once
+
+        Returns:
+            tuple: ({name: DirEntry} for platform_dir, {name: [DirEntry, ...]} for
+                   files one level down in its subdirectories, where variant files
+                   land; every candidate is kept, in scan order)
+        """
+        top = {}
+        nested = defaultdict(list)
+        try:
+            with os.scandir(platform_dir) as it:
+                for entry in it:
+                    top[entry.name] = entry
+        except OSError:
+            return top, nested
+
+        for entry in top.values():
+            try:
+                if entry.is_dir():
+                    with os.scandir(entry.path) as it:
+                        for sub_entry in it:
+                            nested[sub_entry.name].append(sub_entry)
+            except OSError:
+                pass
+        return top, nested
+
+    def _entry_download_state(self, entry):
+        """(is_downloaded, local_size) for a DirEntry, using the same rules as is_path_validly_downloaded"""
+        if entry is None:
+            return False, 0
+        try:
+            if entry.is_file():
+                size = entry.stat().st_size
+                return size > 1024, size
+            if entry.is_dir():
+                if self.is_path_validly_downloaded(entry.path):
+                    return True, self.get_actual_file_size(entry.path)
+        except OSError:
+            pass
+        return False, 0
+
     def get_collections_for_autosync(self):
         """Get collections selected for auto-sync (either checked or row-selected)"""
         collections_for_sync = set()
@@ -1304,13 +1879,12 @@ class EnhancedLibrarySection:
         if hasattr(self, 'current_view_mode') and self.current_view_mode == 'collection':
             selection_model = self.column_view.get_model()
             if selection_model:
-                for i in range(selection_model.get_n_items()):
-                    if selection_model.is_selected(i):
-                        tree_item = selection_model.get_item(i)
-                        if tree_item and tree_item.get_depth() == 0:  # Collection level
-                            item = tree_item.get_item()
-                            if isinstance(item, PlatformItem):
-                                collections_for_sync.add(item.platform_name)
+                for position in iter_selected_positions(selection_model):
+                    tree_item = selection_model.get_item(position)
+                    if tree_item and tree_item.get_depth() == 0:  # Collection level
+                        item = tree_item.get_item()
+                        if isinstance(item, PlatformItem):
+                            collections_for_sync.add(item.platform_name)
         
         return collections_for_sync
 
@@ -1351,16 +1925,15 @@ class EnhancedLibrarySection:
                         # by checking if it has collection metadata
                         if game.get('collection'):
                             # This game WAS in a synced collection but is no longer
-                            GLib.idle_add(lambda g=game: self.parent.delete_game_file(g, is_bulk_operation=True))
+                            GLib.idle_add(partial(self.parent.delete_game_file, game, is_bulk_operation=True))
                             removed_count += 1
                 
                 if removed_count > 0:
-                    GLib.idle_add(lambda count=removed_count: 
-                                self.parent.log_message(f"🗑️ Auto-sync startup: removed {count} orphaned games"))
+                    GLib.idle_add(self.parent.log_message,
+                                  f"🗑️ Auto-sync startup: removed {removed_count} orphaned games")
                 
             except Exception as e:
-                GLib.idle_add(lambda err=str(e): 
-                            self.parent.log_message(f"❌ Startup cleanup error: {err}"))
+                GLib.idle_add(self.parent.log_message, f"❌ Startup cleanup error: {e}")
         
         threading.Thread(target=check_and_remove, daemon=True).start()
 
@@ -1425,111 +1998,126 @@ class EnhancedLibrarySection:
                         # Mark this collection as currently downloading
                         self.currently_downloading_collections.add(collection_name)
 
-                        GLib.idle_add(lambda name=collection_name, count=len(games_to_download):
-                                    self.parent.log_message(f"⬇️ Auto-sync: downloading {count} games from '{name}'"))
+                        GLib.idle_add(self.parent.log_message,
+                                      f"⬇️ Auto-sync: downloading {len(games_to_download)} games from '{collection_name}'")
 
                         # Update UI to show orange indicator
-                        GLib.idle_add(lambda name=collection_name: self.update_collection_sync_status(name))
+                        self._queue_status_update(collection_name)
 
                         for game in games_to_download:
-                            GLib.idle_add(lambda g=game:
-                                        self.parent.download_game(g, is_bulk_operation=True))
+                            GLib.idle_add(partial(self.parent.download_game, game, is_bulk_operation=True))
 
                 if total_to_download > 0:
-                    GLib.idle_add(lambda count=total_to_download:
-                                self.parent.log_message(f"🎯 Auto-sync restored: started download of {count} total games"))
+                    GLib.idle_add(self.parent.log_message,
+                                  f"🎯 Auto-sync restored: started download of {total_to_download} total games")
 
                     # Wait for downloads to complete, then update UI
                     def wait_and_update():
                         time.sleep(5)  # Wait for downloads to start
                         while self.parent.download_progress:
-                            time.sleep(2)  # Check every 2 seconds
+                            # Woken as soon as the last download entry is removed;
+                            # the timeout is only a safety net
+                            self.parent.downloads_idle_event.wait(timeout=10)
 
                         # All downloads complete - remove downloading status
                         for collection_name in collections_with_downloads:
                             self.currently_downloading_collections.discard(collection_name)
-                            GLib.idle_add(lambda name=collection_name: self.update_collection_sync_status(name))
+                            self._queue_status_update(collection_name)
 
                     threading.Thread(target=wait_and_update, daemon=True).start()
                 else:
-                    GLib.idle_add(lambda:
-                                self.parent.log_message(f"✅ Auto-sync restored: all collections already complete"))
+                    GLib.idle_add(self.parent.log_message, "✅ Auto-sync restored: all collections already complete")
 
             except Exception as e:
-                GLib.idle_add(lambda err=str(e):
-                            self.parent.log_message(f"❌ Auto-sync restore error: {err}"))
+                GLib.idle_add(self.parent.log_message, f"❌ Auto-sync restore error: {e}")
 
         threading.Thread(target=download_all, daemon=True).start()
 
     def update_collection_sync_status(self, collection_name):
         """Update the visual indicator for a collection's sync status"""
-        import time
-        entry_time = time.time()
         self.parent.log_message(f"[DEBUG] update_collection_sync_status called for {collection_name}")
 
         if not hasattr(self, 'library_model') or not self.library_model.tree_model:
             self.parent.log_message(f"[DEBUG] No library_model, returning")
             return
 
-        def update_ui():
-            update_start = time.time()
-            self.parent.log_message(f"[DEBUG] update_ui callback started ({update_start - entry_time:.3f}s after call)")
-            model = self.library_model.tree_model
-            for i in range(model.get_n_items() if model else 0):
-                tree_item = model.get_item(i)
-                if tree_item and tree_item.get_depth() == 0:  # Collection/Platform level
-                    item = tree_item.get_item()
-                    if isinstance(item, PlatformItem) and item.platform_name == collection_name:
-                        # Determine the new sync status
-                        # First check if collection is marked as completed
-                        if hasattr(self, 'completed_sync_collections') and collection_name in self.completed_sync_collections:
-                            new_status = 'synced'  # Green dot - collection sync complete
-                        elif collection_name in self.currently_downloading_collections:
-                            new_status = 'syncing'  # Orange dot - currently downloading
-                        elif collection_name in self.actively_syncing_collections:
-                            # Re-check download state from disk.  item.games may have
-                            # stale is_downloaded=False flags if files were downloaded
-                            # during this session (process_single_rom isn't re-run).
-                            all_downloaded = True
-                            for g in item.games:
-                                local_path_str = g.get('local_path', '')
-                                if not local_path_str:
-                                    all_downloaded = False
+        self._queue_status_update(collection_name)
+
+    def _queue_status_update(self, collection_name):
+        """Coalesce collection status refreshes into a single idle callback"""
+        with self._status_update_lock:
+            self._pending_status_updates.add(collection_name)
+            if self._status_update_scheduled:
+                return
+            self._status_update_scheduled = True
+        # Use HIGH priority to execute ASAP
+        GLib.idle_add(self._flush_status_updates, priority=GLib.PRIORITY_HIGH)
+
+    def _flush_status_updates(self):
+        """Apply all pending collection status refreshes in one pass over the tree"""
+        with self._status_update_lock:
+            pending = self._pending_status_updates
+            self._pending_status_updates = set()
+            self._status_update_scheduled = False
+
+        # Collection/Platform rows live in root_store; no need to walk expanded children
+        root_store = self.library_model.root_store
+        for i in range(root_store.get_n_items()):
+            if not pending:
+                break
+            item = root_store.get_item(i)
+            if isinstance(item, PlatformItem) and item.platform_name in pending:
+                pending.discard(item.platform_name)
+                self._apply_collection_sync_status(item)
+        return False
+
+    def _apply_collection_sync_status(self, item):
+        """Recompute and publish the sync status of one collection row"""
+        collection_name = item.platform_name
+        # Determine the new sync status
+        # First check if collection is marked as completed
+        if hasattr(self, 'completed_sync_collections') and collection_name in self.completed_sync_collections:
+            new_status = 'synced'  # Green dot - collection sync complete
+        elif collection_name in self.currently_downloading_collections:
+            new_status = 'syncing'  # Orange dot - currently downloading
+        elif collection_name in self.actively_syncing_collections:
+            # Re-check download state from disk.  item.games may have
+            # stale is_downloaded=False flags if files were downloaded
+            # during this session (process_single_rom isn't re-run).
+            all_downloaded = True
+            for g in item.games:
+                local_path_str = g.get('local_path', '')
+                if not local_path_str:
+                    all_downloaded = False
+                    break
+                lp = Path(local_path_str)
+                if not self.is_path_validly_downloaded(lp):
+                    # Variant files land inside a parent-named subdir;
+                    # scan one level of subdirectories as a fallback.
+                    found_in_sub = False
+                    parent_dir = lp.parent
+                    fname = lp.name
+                    if parent_dir.exists():
+                        try:
+                            for sub in parent_dir.iterdir():
+                                if sub.is_dir() and self.is_path_validly_downloaded(sub / fname):
+                                    found_in_sub = True
                                     break
-                                lp = Path(local_path_str)
-                                if not self.is_path_validly_downloaded(lp):
-                                    # Variant files land inside a parent-named subdir;
-                                    # scan one level of subdirectories as a fallback.
-                                    found_in_sub = False
-                                    parent_dir = lp.parent
-                                    fname = lp.name
-                                    if parent_dir.exists():
-                                        try:
-                                            for sub in parent_dir.iterdir():
-                                                if sub.is_dir() and self.is_path_validly_downloaded(sub / fname):
-                                                    found_in_sub = True
-                                                    break
-                                        except (OSError, PermissionError):
-                                            pass
-                                    if not found_in_sub:
-                                        all_downloaded = False
-                                        break
-                            new_status = 'synced' if all_downloaded else 'disabled'  # Green if synced, grey if not
-                        else:
-                            new_status = 'disabled'  # Grey dot (not enabled)
-
-                        self.parent.log_message(f"[DEBUG] Setting status to {new_status} for {collection_name}")
-                        # Update the sync_status and notify
-                        old_status = item.sync_status
-                        item.sync_status = new_status
-                        item.notify('sync-status-text')
-                        item.notify('name')
-                        self.parent.log_message(f"[DEBUG] Status changed from {old_status} to {new_status} ({time.time() - entry_time:.3f}s total)")
+                        except (OSError, PermissionError):
+                            pass
+                    if not found_in_sub:
+                        all_downloaded = False
                         break
-            return False
+            new_status = 'synced' if all_downloaded else 'disabled'  # Green if synced, grey if not
+        else:
+            new_status = 'disabled'  # Grey dot (not enabled)
 
-        # Use HIGH priority to execute ASAP
-        GLib.idle_add(update_ui, priority=GLib.PRIORITY_HIGH)
+        # Update the sync_status and notify
+        old_status = item.sync_status
+        item.sync_status = new_status
+        item.notify('sync-status-text')
+        item.notify('name')
+        self.parent.log_message(f"[DEBUG] Status for {collection_name} changed from {old_status} to {new_status}")
 
     def download_game_directly(self, game):
         """Download game directly WITH progress tracking"""
@@ -1664,21 +2252,6 @@ class EnhancedLibrarySection:
         except Exception as e:
             self.parent.log_message(f"⚠️ Failed to restore collection auto-sync: {e}")
 
-    def get_collection_sync_status(self, collection_name, games):
-        """Determine sync status of a collection"""
-        if not games:
-            return 'empty'
-        
-        downloaded_count = sum(1 for game in games if game.get('is_downloaded', False))
-        total_count = len(games)
-        
-        if downloaded_count == 0:
-            return 'none'
-        elif downloaded_count == total_count:
-            return 'complete'
-        else:
-            return 'partial'
-        
     def refresh_collection_checkboxes(self, specific_collection=None):
         """Refresh collection display after auto-sync state changes
         
@@ -1691,6 +2264,7 @@ class EnhancedLibrarySection:
             if model:
                 # Only trigger property notifications, not items_changed
                 # This prevents affecting other collections' expansion states
+                platforms = []
                 for i in range(model.get_n_items()):
                     tree_item = model.get_item(i)
                     if tree_item and tree_item.get_depth() == 0:
@@ -1698,10 +2272,10 @@ class EnhancedLibrarySection:
                         if isinstance(platform, PlatformItem):
                             # If specific_collection is provided, only update that one
                             if specific_collection is None or platform.platform_name == specific_collection:
-                                # Trigger property notifications to refresh the UI
-                                # without affecting the tree structure or other collections
-                                platform.notify('name')
-                                platform.notify('sync-status-text')
+                                platforms.append(platform)
+                # Trigger property notifications to refresh the UI
+                # without affecting the tree structure or other collections
+                notify_items(platforms, 'name', 'sync-status-text')
 
     def save_selected_collections(self):
         """Save both UI selection and active sync states"""
@@ -1759,6 +2333,8 @@ class EnhancedLibrarySection:
             
             def sync_worker():
                 self.parent.log_message(f"🚀 Collection sync worker thread started")
+                # Block until the ROM caches are ready so the first tick does real work
+                self._caches_ready.wait(timeout=60)
                 while self.collection_auto_sync_enabled:
                     try:
                         self.check_actively_syncing_collections()
@@ -1833,30 +2409,20 @@ class EnhancedLibrarySection:
 
                 if total_to_download > 0:
                     # Use bulk download method with collection tracking
-                    GLib.idle_add(lambda games=all_games_to_download, cdata=collections_data:
-                                self.parent.download_multiple_games_with_collection_tracking(games, cdata))
+                    GLib.idle_add(self.parent.download_multiple_games_with_collection_tracking,
+                                  all_games_to_download, collections_data)
                 else:
                     # All collections are already synced - update their status to green
-                    def update_all_collection_statuses():
-                        for collection_name in collections_data.keys():
-                            self.update_collection_sync_status(collection_name)
-                        return False
-                    GLib.idle_add(update_all_collection_statuses)
+                    for collection_name in collections_data.keys():
+                        self._queue_status_update(collection_name)
 
                     # Send per-collection notifications (only if requested)
                     if send_notifications:
                         for collection_name, data in collections_data.items():
-                            def send_collection_synced_notification(name=collection_name, total=data['total']):
-                                self.parent.send_desktop_notification(
-                                    f"✅ {name} - Sync Complete",
-                                    f"{total}/{total} ROMs synced"
-                                )
-                                return False
-                            GLib.idle_add(send_collection_synced_notification)
+                            GLib.idle_add(_notify_sync_complete, self.parent, collection_name, data['total'])
 
             except Exception as e:
-                GLib.idle_add(lambda err=str(e):
-                            self.parent.log_message(f"❌ Collection download error: {err}"))
+                GLib.idle_add(self.parent.log_message, f"❌ Collection download error: {e}")
 
         threading.Thread(target=download_all, daemon=True).start()
 
@@ -1865,8 +2431,8 @@ class EnhancedLibrarySection:
         if not (self.parent.romm_client and self.parent.romm_client.authenticated):
             return
 
-        # Set a flag to indicate caches are being initialized
-        self._cache_initialization_complete = False
+        # Caches are being (re)initialized - block sync checks until done
+        self._caches_ready.clear()
 
         def init_caches():
             try:
@@ -1879,24 +2445,37 @@ class EnhancedLibrarySection:
                         collection_roms = self.parent.romm_client.get_collection_roms(collection_id)
 
                         # Store current ROM IDs
-                        current_rom_ids = {rom.get('id') for rom in collection_roms if rom.get('id')}
-                        cache_key = f'_collection_roms_{collection_name}'
-                        setattr(self, cache_key, current_rom_ids)
+                        current_rom_ids = {rom_id for rom in collection_roms if (rom_id := rom.get('id'))}
+                        self._collection_rom_ids[collection_name] = current_rom_ids
 
-                        GLib.idle_add(lambda name=collection_name, count=len(current_rom_ids):
-                                    self.parent.log_message(f"🔋 Initialized cache for '{name}': {count} games"))
+                        GLib.idle_add(self.parent.log_message,
+                                      f"🔋 Initialized cache for '{collection_name}': {len(current_rom_ids)} games")
 
-                # Mark initialization as complete
-                self._cache_initialization_complete = True
-                GLib.idle_add(lambda: self.parent.log_message(f"✅ Collection cache initialization complete"))
+                GLib.idle_add(self.parent.log_message, "✅ Collection cache initialization complete")
 
             except Exception as e:
-                self._cache_initialization_complete = True  # Set to True even on error to avoid blocking
-                GLib.idle_add(lambda err=str(e):
-                            self.parent.log_message(f"❌ Cache initialization error: {err}"))
+                GLib.idle_add(self.parent.log_message, f"❌ Cache initialization error: {e}")
+            finally:
+                # Mark initialization as complete, even on error to avoid blocking
+                self._caches_ready.set()
 
         threading.Thread(target=init_caches, daemon=True).start()
 
+    def _get_collection_meta(self, collection):
+        """Cheap change marker for a collection: (rom_count, updated_at), or None if unknown"""
+        romm_client = self.parent.romm_client
+        if hasattr(romm_client, 'get_collection_meta'):
+            try:
+                return romm_client.get_collection_meta(collection.get('id'))
+            except Exception:
+                return None
+        # The collections listing already carries these fields on RomM servers that expose them
+        rom_count = collection.get('rom_count')
+        updated_at = collection.get('updated_at')
+        if rom_count is None or not updated_at:
+            return None
+        return (rom_count, updated_at)
+
     def stop_collection_auto_sync(self):
         """Stop background collection sync"""
         self.collection_auto_sync_enabled = False
@@ -1909,7 +2488,7 @@ class EnhancedLibrarySection:
             return
 
         # Wait for cache initialization to complete before checking
-        if not getattr(self, '_cache_initialization_complete', False):
+        if not self._caches_ready.is_set():
             self.parent.log_message(f"⏳ Waiting for cache initialization to complete...")
             return
 
@@ -1935,14 +2514,20 @@ class EnhancedLibrarySection:
                     continue
                     
                 collection_id = collection.get('id')
+
+                # Skip the full ROM fetch when the collection's count/timestamp is unchanged
+                meta = self._get_collection_meta(collection)
+                if (meta is not None and self._collection_meta.get(collection_name) == meta
+                        and collection_name in self._collection_rom_ids):
+                    continue
+
                 collection_roms = self.parent.romm_client.get_collection_roms(collection_id)
                 
                 # Get current ROM IDs in this collection
-                current_rom_ids = {rom.get('id') for rom in collection_roms if rom.get('id')}
+                current_rom_ids = {rom_id for rom in collection_roms if (rom_id := rom.get('id'))}
                 
                 # Get previously stored ROM IDs
-                cache_key = f'_collection_roms_{collection_name}'
-                previous_rom_ids = getattr(self, cache_key, set())
+                previous_rom_ids = self._collection_rom_ids.get(collection_name, set())
                 
                 if previous_rom_ids != current_rom_ids:
                     changes_detected = True
@@ -1956,8 +2541,8 @@ class EnhancedLibrarySection:
                         self.handle_added_games(collection_roms, added_rom_ids, collection_name)
 
                     if removed_rom_ids:
-                        GLib.idle_add(lambda name=collection_name, count=len(removed_rom_ids):
-                            self.parent.log_message(f"🗑️ Collection '{name}': {count} games removed"))
+                        GLib.idle_add(self.parent.log_message,
+                                      f"🗑️ Collection '{collection_name}': {len(removed_rom_ids)} games removed")
                         self.handle_removed_games(removed_rom_ids, collection_name)
 
                     # Sync Steam shortcuts if enabled for this collection
@@ -1976,7 +2561,11 @@ class EnhancedLibrarySection:
                                 logging.debug(f"Steam sync error for '{collection_name}': {e}")
                     
                 # MAKE SURE THIS LINE IS OUTSIDE THE IF BLOCKS AND ALWAYS EXECUTES:
-                setattr(self, cache_key, current_rom_ids)  # This must happen after handling changes
+                self._collection_rom_ids[collection_name] = current_rom_ids  # This must happen after handling changes
+                if meta is not None:
+                    self._collection_meta[collection_name] = meta
+                else:
+                    self._collection_meta.pop(collection_name, None)
             
             # At the end of the method, after the for loop
             if not changes_detected and len(self.actively_syncing_collections) > 0:
@@ -2010,27 +2599,29 @@ class EnhancedLibrarySection:
                             if _fname:
                                 _parent_by_filename[_fname] = _r
 
-                # First pass: check how many are already downloaded
+                # First pass: process each added ROM once and count how many are
+                # already downloaded.  The results are reused by the download pass
+                # below, so process_single_rom (stat/scan heavy) runs once per ROM.
+                processed_by_rom_id = {}
                 for rom in collection_roms:
-                    if rom.get('id') not in added_rom_ids:
+                    rom_id = rom.get('id')
+                    if rom_id not in added_rom_ids:
                         continue
                     processed_game = self.parent.process_single_rom(rom, download_dir)
-                    if processed_game.get('is_downloaded'):
+                    processed_by_rom_id[rom_id] = processed_game
+                    if processed_game['is_downloaded']:
                         already_downloaded_count += 1
 
                 # Only log the "games added" message if not all are already downloaded
                 total_added = len(added_rom_ids)
                 if already_downloaded_count < total_added:
-                    GLib.idle_add(lambda name=current_collection, count=total_added:
-                        self.parent.log_message(f"�� Collection '{name}': {count} games added"))
+                    self._post_sync_event('log', f"�� Collection '{current_collection}': {total_added} games added")
 
                 for rom in collection_roms:
-                    if rom.get('id') not in added_rom_ids:
+                    processed_game = processed_by_rom_id.get(rom.get('id'))
+                    if processed_game is None:
                         continue
 
-                    # Process the new ROM
-                    processed_game = self.parent.process_single_rom(rom, download_dir)
-
                     # Inject parent-ROM reference for 404-fallback downloads.
                     _rom_fs_name = rom.get('fs_name', '')
                     if _rom_fs_name and _rom_fs_name in _parent_by_filename:
@@ -2038,75 +2629,22 @@ class EnhancedLibrarySection:
                         processed_game['_fs_extension'] = rom.get('fs_extension', '')
 
                     # Skip if already downloaded (already counted in first pass)
-                    if processed_game.get('is_downloaded'):
+                    if processed_game['is_downloaded']:
                         continue
 
                     # Log with stable collection reference
-                    game_name = processed_game.get('name')
+                    game_name = processed_game['name']
                     current_rom_id = rom.get('id')
                     processed_game['collection'] = current_collection
 
                     # ADD GAME TO TREE BEFORE DOWNLOADING so user can see it appear
-                    def add_game_to_tree():
-                        # Update available_games.
-                        # Regional variant files (has _parent_rom) belong inside the parent
-                        # ROM's _sibling_files — adding them as standalone entries would
-                        # create duplicate rows in the platform view.  Only update/append
-                        # if there is no parent-folder ROM already tracked.
-                        _parent_rom_data = processed_game.get('_parent_rom')
-                        _parent_already_tracked = (
-                            _parent_rom_data and
-                            any(g.get('rom_id') == _parent_rom_data.get('id')
-                                for g in self.parent.available_games)
-                        )
-                        if not _parent_already_tracked:
-                            for i, game in enumerate(self.parent.available_games):
-                                if game.get('rom_id') == current_rom_id:
-                                    self.parent.available_games[i] = processed_game
-                                    break
-                            else:
-                                self.parent.available_games.append(processed_game)
-
-                        # Update collections_games cache
-                        if hasattr(self, 'collections_games'):
-                            found = False
-                            for i, collection_game in enumerate(self.collections_games):
-                                if collection_game.get('rom_id') == current_rom_id:
-                                    self.collections_games[i] = processed_game
-                                    found = True
-                                    break
-                            if not found:
-                                self.collections_games.append(processed_game)
-
-                        # Add to tree view
-                        if self.current_view_mode == 'collection':
-                            for i in range(self.library_model.root_store.get_n_items()):
-                                platform_item = self.library_model.root_store.get_item(i)
-                                if platform_item.platform_name == current_collection:
-                                    game_exists = any(g.get('rom_id') == current_rom_id for g in platform_item.games)
-                                    if not game_exists:
-                                        platform_item.games.append(processed_game)
-                                        # Sort games alphabetically
-                                        if self.sort_downloaded_first:
-                                            platform_item.games.sort(key=lambda g: (not g.get('is_downloaded', False), g.get('name', '').lower()))
-                                        else:
-                                            platform_item.games.sort(key=lambda g: g.get('name', '').lower())
-                                        platform_item.rebuild_children()
-                                        platform_item.notify('status-text')
-                                        platform_item.notify('size-text')
-                                    break
-                        return False
-
-                    GLib.idle_add(add_game_to_tree)
+                    self._post_sync_event('tree_add', processed_game, current_rom_id, current_collection)
 
                     self.parent.log_message(f"  ⬇️ Auto-downloading {game_name} from '{current_collection}'...")
 
                     # Respect concurrent download limit for auto-sync
                     max_concurrent = int(self.parent.settings.get('Download', 'max_concurrent', '3'))
-                    # Snapshot: a download worker thread may add/remove keys
-                    # concurrently, which would crash a live iteration.
-                    active_downloads = sum(1 for p in list(self.parent.download_progress.values())
-                                        if p.get('downloading', False))
+                    active_downloads = self.parent.download_progress.active_count
 
                     if active_downloads < max_concurrent:
                         # Use direct download if under limit
@@ -2172,13 +2710,7 @@ class EnhancedLibrarySection:
                                         break
 
                             # Update UI to show download completed (game already exists in tree)
-                            def update_download_status():
-                                self.update_single_game(processed_game)
-                                # Also update the collection's sync status to reflect the new download
-                                self.update_collection_sync_status(current_collection)
-                                return False
-
-                            GLib.idle_add(update_download_status)
+                            self._post_sync_event('game_done', processed_game, current_collection)
                     else:
                         self.parent.log_message(f"  ❌ Failed to download {game_name} from '{current_collection}'")
                 
@@ -2196,19 +2728,16 @@ class EnhancedLibrarySection:
                                 self.parent.retroarch.send_notification(f"'{current_collection}': {total_added} added ({downloaded_count} downloaded)")
 
                         # Send desktop notification
-                        def send_desktop_notif():
-                            if downloaded_count == total_added:
-                                self.parent.send_desktop_notification(
-                                    "Collection Synced",
-                                    f"'{current_collection}': Downloaded {downloaded_count} new game{'s' if downloaded_count != 1 else ''}"
-                                )
-                            else:
-                                self.parent.send_desktop_notification(
-                                    "Collection Synced",
-                                    f"'{current_collection}': {total_added} game{'s' if total_added != 1 else ''} added, {downloaded_count} downloaded"
-                                )
-                            return False
-                        GLib.idle_add(send_desktop_notif)
+                        if downloaded_count == total_added:
+                            self._post_sync_event(
+                                'notify', "Collection Synced",
+                                f"'{current_collection}': Downloaded {downloaded_count} new game{'s' if downloaded_count != 1 else ''}"
+                            )
+                        else:
+                            self._post_sync_event(
+                                'notify', "Collection Synced",
+                                f"'{current_collection}': {total_added} game{'s' if total_added != 1 else ''} added, {downloaded_count} downloaded"
+                            )
                     elif already_downloaded_count > 0 and already_downloaded_count < total_added:
                         # Some games were already downloaded, but not all
                         self.parent.log_message(f"  ℹ️ {already_downloaded_count} of {total_added} games already downloaded")
@@ -2216,13 +2745,10 @@ class EnhancedLibrarySection:
                         if self.parent.retroarch:
                             self.parent.retroarch.send_notification(f"'{current_collection}': {total_added} game{'s' if total_added != 1 else ''} added ({already_downloaded_count} already downloaded)")
 
-                        def send_desktop_notif_partial():
-                            self.parent.send_desktop_notification(
-                                "Collection Updated",
-                                f"'{current_collection}': {total_added} game{'s' if total_added != 1 else ''} added ({already_downloaded_count} already downloaded)"
-                            )
-                            return False
-                        GLib.idle_add(send_desktop_notif_partial)
+                        self._post_sync_event(
+                            'notify', "Collection Updated",
+                            f"'{current_collection}': {total_added} game{'s' if total_added != 1 else ''} added ({already_downloaded_count} already downloaded)"
+                        )
                     # If all games were already downloaded (already_downloaded_count == total_added),
                     # don't send any notification - this is likely cache initialization
 
@@ -2232,6 +2758,62 @@ class EnhancedLibrarySection:
         # Run downloads in background
         threading.Thread(target=download_new_games, daemon=True).start()
 
+    def _add_synced_game_to_tree(self, processed_game, current_rom_id, current_collection):
+        """Show a game added by collection auto-sync before its download starts"""
+        # Update available_games.
+        # Regional variant files (has _parent_rom) belong inside the parent
+        # ROM's _sibling_files — adding them as standalone entries would
+        # create duplicate rows in the platform view.  Only update/append
+        # if there is no parent-folder ROM already tracked.
+        _parent_rom_data = processed_game.get('_parent_rom')
+        _parent_already_tracked = (
+            _parent_rom_data and
+            any(g.get('rom_id') == _parent_rom_data.get('id')
+                for g in self.parent.available_games)
+        )
+        if not _parent_already_tracked:
+            for i, game in enumerate(self.parent.available_games):
+                if game.get('rom_id') == current_rom_id:
+                    self.parent.available_games[i] = processed_game
+                    break
+            else:
+                self.parent.available_games.append(processed_game)
+
+        # Update collections_games cache
+        if hasattr(self, 'collections_games'):
+            found = False
+            for i, collection_game in enumerate(self.collections_games):
+                if collection_game.get('rom_id') == current_rom_id:
+                    self.collections_games[i] = processed_game
+                    found = True
+                    break
+            if not found:
+                self.collections_games.append(processed_game)
+
+        # Add to tree view
+        if self.current_view_mode == 'collection':
+            for i in range(self.library_model.root_store.get_n_items()):
+                platform_item = self.library_model.root_store.get_item(i)
+                if platform_item.platform_name == current_collection:
+                    game_exists = any(g.get('rom_id') == current_rom_id for g in platform_item.games)
+                    if not game_exists:
+                        platform_item.games.append(processed_game)
+                        # Sort games alphabetically
+                        if self.sort_downloaded_first:
+                            platform_item.games.sort(key=lambda g: (not g.get('is_downloaded', False), g.get('name', '').lower()))
+                        else:
+                            platform_item.games.sort(key=lambda g: g.get('name', '').lower())
+                        platform_item.rebuild_children()
+                        platform_item.notify('status-text')
+                        platform_item.notify('size-text')
+                    break
+
+    def _on_synced_game_downloaded(self, processed_game, current_collection):
+        """Refresh the tree row and collection status after an auto-sync download"""
+        self.update_single_game(processed_game)
+        # Also update the collection's sync status to reflect the new download
+        self.update_collection_sync_status(current_collection)
+
     def handle_removed_games(self, removed_rom_ids, collection_name):
         """Handle removed games - always delete if not in other synced collections"""
         download_dir = Path(self.parent.rom_dir_row.get_text())
@@ -2245,7 +2827,7 @@ class EnhancedLibrarySection:
                 for other_collection in self.actively_syncing_collections:
                     if other_collection != collection_name:
                         # Check if ROM ID exists in other collection's cache
-                        other_cache = getattr(self, f'_collection_roms_{other_collection}', set())
+                        other_cache = self._collection_rom_ids.get(other_collection, ())
                         if game.get('rom_id') in other_cache:
                             found_in_other = True
                             break
@@ -2358,11 +2940,11 @@ class EnhancedLibrarySection:
                         # Mark this collection as currently downloading
                         self.currently_downloading_collections.add(collection_name)
 
-                        GLib.idle_add(lambda: self.parent.log_message(
-                            f"📥 Starting download of {len(games_to_download)} games from '{collection_name}'"))
+                        GLib.idle_add(self.parent.log_message,
+                                      f"📥 Starting download of {len(games_to_download)} games from '{collection_name}'")
 
                         # Update UI to show orange indicator
-                        GLib.idle_add(lambda name=collection_name: self.update_collection_sync_status(name))
+                        self._queue_status_update(collection_name)
 
                         # Tag games with collection name for tracking
                         for game in games_to_download:
@@ -2378,41 +2960,36 @@ class EnhancedLibrarySection:
                         }
 
                         # Use bulk download method with collection tracking
-                        GLib.idle_add(lambda games=games_to_download, cdata=collections_data:
-                                    self.parent.download_multiple_games_with_collection_tracking(games, cdata))
+                        GLib.idle_add(self.parent.download_multiple_games_with_collection_tracking,
+                                      games_to_download, collections_data)
 
                         # Wait for downloads to complete, then update UI
                         def wait_and_update():
                             time.sleep(5)  # Wait for downloads to start
                             while self.parent.download_progress:
-                                time.sleep(2)  # Check every 2 seconds
+                                # Woken as soon as the last download entry is removed;
+                                # the timeout is only a safety net
+                                self.parent.downloads_idle_event.wait(timeout=10)
 
                             # All downloads complete - remove downloading status
                             self.currently_downloading_collections.discard(collection_name)
-                            GLib.idle_add(lambda name=collection_name: self.update_collection_sync_status(name))
+                            self._queue_status_update(collection_name)
 
                         threading.Thread(target=wait_and_update, daemon=True).start()
                     else:
                         # Remove from currently_downloading since no downloads are needed
                         self.currently_downloading_collections.discard(collection_name)
                         
-                        GLib.idle_add(lambda: self.parent.log_message(
-                            f"✅ Collection '{collection_name}': all games already downloaded"))
+                        GLib.idle_add(self.parent.log_message,
+                                      f"✅ Collection '{collection_name}': all games already downloaded")
                         # Update status to 'synced' (green) since all games are already downloaded
-                        GLib.idle_add(lambda name=collection_name: self.update_collection_sync_status(name) or False)
+                        self._queue_status_update(collection_name)
                         # Send notification that collection is already synced
-                        total_games = len(collection_roms)
-                        def send_sync_complete_notif(name=collection_name, total=total_games):
-                            self.parent.send_desktop_notification(
-                                f"✅ {name} - Sync Complete",
-                                f"{total}/{total} ROMs synced"
-                            )
-                            return False
-                        GLib.idle_add(send_sync_complete_notif)
+                        GLib.idle_add(_notify_sync_complete, self.parent, collection_name, len(collection_roms))
                     break
 
             except Exception as e:
-                GLib.idle_add(lambda: self.parent.log_message(f"❌ Error: {e}"))
+                GLib.idle_add(self.parent.log_message, f"❌ Error: {e}")
 
         threading.Thread(target=queue_downloads, daemon=True).start()
 
@@ -2420,53 +2997,65 @@ class EnhancedLibrarySection:
         """Toggle collection auto-sync on/off"""
         import time
         start_time = time.time()
-        self.parent.log_message(f"[DEBUG] Toggle activated at {start_time}")
+        if _DEBUG_TOGGLE:
+            self.parent.log_message(f"[DEBUG] Toggle activated at {start_time}")
 
         if toggle_button.get_active():
-            # Check both checkbox selections AND row selection
-            selected_collections = self.selected_collections_for_sync.copy()
-            self.parent.log_message(f"[DEBUG] Got selected collections ({time.time() - start_time:.3f}s)")
+            # Check both checkbox selections AND row selection.  The checkbox set is
+            # used by reference; a new set is only built if selected rows add to it.
+            selected_collections = self.selected_collections_for_sync
+            if _DEBUG_TOGGLE:
+                self.parent.log_message(f"[DEBUG] Got selected collections ({time.time() - start_time:.3f}s)")
 
             # Add currently selected row if in collections view
             if hasattr(self, 'current_view_mode') and self.current_view_mode == 'collection':
                 selection_model = self.column_view.get_model()
-                for i in range(selection_model.get_n_items()):
-                    if selection_model.is_selected(i):
-                        tree_item = selection_model.get_item(i)
-                        item = tree_item.get_item()
-                        if isinstance(item, PlatformItem):
-                            selected_collections.add(item.platform_name)
-            self.parent.log_message(f"[DEBUG] Checked row selection ({time.time() - start_time:.3f}s)")
+                row_collections = set()
+                for position in iter_selected_positions(selection_model):
+                    tree_item = selection_model.get_item(position)
+                    item = tree_item.get_item()
+                    if isinstance(item, PlatformItem):
+                        row_collections.add(item.platform_name)
+                if not row_collections <= selected_collections:
+                    selected_collections = selected_collections | row_collections
+            if _DEBUG_TOGGLE:
+                self.parent.log_message(f"[DEBUG] Checked row selection ({time.time() - start_time:.3f}s)")
 
             if selected_collections:
                 self.actively_syncing_collections = selected_collections
-                self.parent.log_message(f"[DEBUG] Set actively_syncing_collections ({time.time() - start_time:.3f}s)")
+                if _DEBUG_TOGGLE:
+                    self.parent.log_message(f"[DEBUG] Set actively_syncing_collections ({time.time() - start_time:.3f}s)")
 
                 # Update collection labels to show sync status BEFORE starting sync thread
                 for collection_name in selected_collections:
                     # Add to currently_downloading_collections to show orange status immediately
                     self.currently_downloading_collections.add(collection_name)
-                    self.parent.log_message(f"[DEBUG] Added {collection_name} to currently_downloading ({time.time() - start_time:.3f}s)")
+                    if _DEBUG_TOGGLE:
+                        self.parent.log_message(f"[DEBUG] Added {collection_name} to currently_downloading ({time.time() - start_time:.3f}s)")
                     self.update_collection_sync_status(collection_name)
-                    self.parent.log_message(f"[DEBUG] Updated status for {collection_name} ({time.time() - start_time:.3f}s)")
+                    if _DEBUG_TOGGLE:
+                        self.parent.log_message(f"[DEBUG] Updated status for {collection_name} ({time.time() - start_time:.3f}s)")
 
                 self.start_collection_auto_sync()
-                self.parent.log_message(f"[DEBUG] Started auto sync ({time.time() - start_time:.3f}s)")
+                if _DEBUG_TOGGLE:
+                    self.parent.log_message(f"[DEBUG] Started auto sync ({time.time() - start_time:.3f}s)")
                 toggle_button.set_label("Auto-Sync: ON")
                 self.parent.log_message(f"🟡 Collection auto-sync enabled for {len(selected_collections)} collections")
-                self.parent.log_message(f"[DEBUG] TOTAL TIME: {time.time() - start_time:.3f}s")
+                if _DEBUG_TOGGLE:
+                    self.parent.log_message(f"[DEBUG] TOTAL TIME: {time.time() - start_time:.3f}s")
 
-                # Clear UI selections after enabling
-                self.selected_collections_for_sync.clear()
+                # Clear UI selections after enabling.  Rebind rather than clear():
+                # actively_syncing_collections may be the very same set object.
+                self.selected_collections_for_sync = set()
                 self.save_selected_collections()
                 self.refresh_collection_checkboxes()
                 
         else:
-            # Save collections to update before clearing
-            collections_to_update = self.actively_syncing_collections.copy()
+            # Keep the old set for the status refresh and start a fresh one
+            collections_to_update = self.actively_syncing_collections
 
             self.stop_collection_auto_sync()
-            self.actively_syncing_collections.clear()
+            self.actively_syncing_collections = set()
             self.currently_downloading_collections.clear()
 
             # Update collection labels to remove sync indicators
@@ -2531,21 +3120,6 @@ class EnhancedLibrarySection:
                 # Platform view - existing logic
                 pass
 
-    def get_collection_sync_status(self, collection_name, games):
-        """Determine sync status of a collection"""
-        if not games:
-            return 'empty'
-        
-        downloaded_count = sum(1 for game in games if game.get('is_downloaded', False))
-        total_count = len(games)
-        
-        if downloaded_count == 0:
-            return 'none'
-        elif downloaded_count == total_count:
-            return 'complete'
-        else:
-            return 'partial'
-
     def update_sync_button_state(self):
         """Update sync state - now using toggle switches instead of button"""
         # Also restore UI state on collections view load
@@ -2581,35 +3155,38 @@ class EnhancedLibrarySection:
 
     def apply_filters(self, games):
         """Apply both platform and search filters to games list"""
-        # Debug: count multi-disc games before filtering
-        multi_before = sum(1 for g in games if g.get('is_multi_disc', False))
-
-        filtered_games = games
-
-        # Apply platform filter
+        # Resolve the filter constants once, then evaluate every predicate in a single pass
+        plat_filter = None
         selected_index = self.platform_filter.get_selected()
         if selected_index != Gtk.INVALID_LIST_POSITION:
             string_list = self.platform_filter.get_model()
             if string_list:
                 selected_platform = string_list.get_string(selected_index)
                 if selected_platform != "All Platforms":
-                    filtered_games = [game for game in filtered_games
-                                    if game.get('platform', 'Unknown') == selected_platform]
+                    plat_filter = selected_platform
+
+        needle = self.search_text or None
+        downloaded_only = self.show_downloaded_only
 
-        # Apply search filter
-        if self.search_text:
-            filtered_games = [game for game in filtered_games
-                            if self.search_text in game.get('name', '').lower() or
-                                self.search_text in game.get('platform', '').lower()]
+        if plat_filter is None and needle is None and not downloaded_only:
+            return games
 
-        # Apply downloaded filter
-        if self.show_downloaded_only:
-            filtered_games = [game for game in filtered_games if game.get('is_downloaded', False)]
+        if plat_filter is not None:
+            # Only the selected platform's games need the remaining predicates.
+            # Bucketed on every call: download paths replace entries in place
+            games = [g for g in games if g.get('platform', 'Unknown') == plat_filter]
+            if needle is None and not downloaded_only:
+                return games
 
-        # Debug: count multi-disc games after filtering
-        multi_after = sum(1 for g in filtered_games if g.get('is_multi_disc', False))
+        if needle is not None:
+            # Games from older caches or other producers may not carry the keys yet
+            for g in games:
+                if '_name_lc' not in g:
+                    ensure_search_keys(g)
 
-        return filtered_games
+        return [g for g in games
+                if (needle is None or needle in g['_name_lc'] or needle in g['_platform_lc'])
+                and (not downloaded_only or g.get('is_downloaded', False))]
 
     def on_toggle_selected_collection_auto_sync(self, button):
         """Toggle auto-sync and then clear selections"""
@@ -2619,12 +3196,14 @@ class EnhancedLibrarySection:
             self.parent.log_message("Please select collections first")
             return
         
-        # Check if selected collections are actively syncing
-        actively_syncing = current_selections.intersection(self.actively_syncing_collections)
+        # Check if selected collections are actively syncing (the overlap is
+        # exactly what a STOP has to remove; on START it is empty, so every
+        # selected collection is new)
+        actively_syncing = self.actively_syncing_collections & current_selections
         
         if actively_syncing:
             # STOP: Remove selected collections from active sync
-            self.actively_syncing_collections -= current_selections
+            self.actively_syncing_collections.difference_update(actively_syncing)
 
             # Stop global sync if no collections left
             if not self.actively_syncing_collections:
@@ -2655,8 +3234,8 @@ class EnhancedLibrarySection:
                         if collection.get('name') in current_selections:
                             collection_id = collection.get('id')
                             collection_roms = self.parent.romm_client.get_collection_roms(collection_id)
-                            cache_key = f'_collection_roms_{collection.get("name")}'
-                            setattr(self, cache_key, {rom.get('id') for rom in collection_roms if rom.get('id')})
+                            self._collection_rom_ids[collection.get('name')] = {
+                                rom_id for rom in collection_roms if (rom_id := rom.get('id'))}
                 except Exception as e:
                     print(f"Error initializing collection cache: {e}")
             
@@ -2674,7 +3253,7 @@ class EnhancedLibrarySection:
             # Update collection status indicators with a delay to ensure data is loaded
             def update_new_collection_statuses():
                 for collection_name in current_selections:
-                    self.update_collection_sync_status(collection_name)
+                    self._queue_status_update(collection_name)
                 return False
             GLib.timeout_add(1000, update_new_collection_statuses)
         
@@ -2739,36 +3318,22 @@ class EnhancedLibrarySection:
                 button.set_icon_name("view-sort-ascending-symbolic")
                 button.set_tooltip_text("Sort: Downloaded")
 
-            # 4. Apply sorting to all platform items
+            # 4. Apply sorting to all platform items, collecting filtered_games as we go
+            all_filtered_games = []
             for i in range(self.library_model.root_store.get_n_items()):
                 platform_item = self.library_model.root_store.get_item(i)
                 if isinstance(platform_item, PlatformItem):
-                    # Get filtered games (respect current filter state)
-                    if self.show_downloaded_only:
-                        filtered_games = [g for g in platform_item.games if g.get('is_downloaded', False)]
-                    else:
-                        filtered_games = platform_item.games.copy()  # Make a copy to avoid modifying original
+                    # Get filtered games (respect current filter state), sorted
+                    filtered_games = platform_item.sorted_games(
+                        downloaded_first=self.sort_downloaded_first,
+                        downloaded_only=self.show_downloaded_only)
 
-                    # Sort the filtered games
-                    if self.sort_downloaded_first:
-                        filtered_games.sort(key=lambda g: (not g.get('is_downloaded', False), g.get('name', '').lower()))
-                    else:
-                        filtered_games.sort(key=lambda g: g.get('name', '').lower())
+                    # Replace all items in the child store with one splice
+                    # (a single items-changed signal instead of one per game)
+                    platform_item.show_games(filtered_games)
+                    all_filtered_games.extend(filtered_games)
 
-                    # Replace all items in the child store
-                    platform_item.child_store.remove_all()
-                    for game in filtered_games:
-                        platform_item.child_store.append(GameItem(game))
-
-            # Update filtered_games
-            self.filtered_games = []
-            for i in range(self.library_model.root_store.get_n_items()):
-                platform_item = self.library_model.root_store.get_item(i)
-                if isinstance(platform_item, PlatformItem):
-                    if self.show_downloaded_only:
-                        self.filtered_games.extend([g for g in platform_item.games if g.get('is_downloaded', False)])
-                    else:
-                        self.filtered_games.extend(platform_item.games)
+            self.filtered_games = all_filtered_games
 
         finally:
             # 5. Thaw notifications - triggers a single batched UI update
@@ -2792,13 +3357,8 @@ class EnhancedLibrarySection:
 
     def has_active_downloads(self):
         """Check if any downloads are currently in progress"""
-        if not hasattr(self.parent, 'download_progress'):
-            return False
-        # Snapshot: a download worker thread may mutate the dict concurrently.
-        return any(
-            progress.get('downloading', False)
-            for progress in list(self.parent.download_progress.values())
-        )
+        # download_progress is created in SyncWindow.__init__ before this section exists
+        return self.parent.download_progress.active_count > 0
 
     def should_cache_collections_at_startup(self):
         """Determine if collections should be cached at startup based on usage patterns"""
@@ -2821,20 +3381,46 @@ class EnhancedLibrarySection:
         if not (self.parent.romm_client and self.parent.romm_client.authenticated):
             return
 
+        def in_memory_cache_valid():
+            return (not force_refresh and self.collections_games and
+                    time.time() - self.collections_cache_time < self.collections_cache_duration)
+
+        # Nothing to do while the in-memory collections are still fresh
+        if in_memory_cache_valid():
+            return
+
         def load_collections_optimized():
             try:
                 import time, json
                 start_time = time.time()
 
+                # Another load may have filled the cache since this one was queued
+                if in_memory_cache_valid():
+                    return
+
                 # Cache file paths
                 cache_dir = Path.home() / '.cache' / 'romm_launcher'
                 cache_dir.mkdir(parents=True, exist_ok=True)
-                server_hash = self.parent.romm_client.base_url.replace('http://', '').replace('https://', '').replace(':', '_').replace('/', '_')
+                base_url = self.parent.romm_client.base_url
+                server_hash = hashlib.blake2b(base_url.encode('utf-8'), digest_size=8).hexdigest()
 
                 roms_cache_file = cache_dir / f'collections_{server_hash}.json'
                 games_cache_file = cache_dir / f'games_{server_hash}.json'
                 collections_meta_file = cache_dir / f'collections_meta_{server_hash}.json'
 
+                # One-time migration from the old URL-mangled file names so the
+                # cache stays warm across the upgrade
+                legacy_hash = base_url.replace('http://', '').replace('https://', '').replace(':', '_').replace('/', '_')
+                for prefix, cache_file in (('collections', roms_cache_file),
+                                           ('games', games_cache_file),
+                                           ('collections_meta', collections_meta_file)):
+                    legacy_file = cache_dir / f'{prefix}_{legacy_hash}.json'
+                    if legacy_file.exists() and not cache_file.exists():
+                        try:
+                            os.replace(legacy_file, cache_file)
+                        except OSError:
+                            pass
+
                 # Try to load processed games cache first (fastest path)
                 if not force_refresh and games_cache_file.exists():
                     try:
@@ -2848,12 +3434,11 @@ class EnhancedLibrarySection:
                                 current_collection_ids = set(str(c.get('id')) for c in custom_collections)
                                 
                                 if collections_meta_file.exists():
-                                    with open(collections_meta_file, 'r') as f:
-                                        cached_meta = json.load(f)
-                                        cached_collection_ids = set(cached_meta.get('collection_ids', []))
-                                        if current_collection_ids != cached_collection_ids:
-                                            collections_changed = True
-                                            print(f"🔄 Collection list changed, invalidating cache (cached: {len(cached_collection_ids)}, current: {len(current_collection_ids)})")
+                                    cached_meta = load_json_cache(collections_meta_file)
+                                    cached_collection_ids = set(cached_meta.get('collection_ids', []))
+                                    if current_collection_ids != cached_collection_ids:
+                                        collections_changed = True
+                                        print(f"🔄 Collection list changed, invalidating cache (cached: {len(cached_collection_ids)}, current: {len(current_collection_ids)})")
                                 else:
                                     # No meta file exists, need to check collections
                                     collections_changed = True
@@ -2863,8 +3448,7 @@ class EnhancedLibrarySection:
                                 collections_changed = False
                             
                             if not collections_changed:
-                                with open(games_cache_file, 'r') as f:
-                                    cache_data = json.load(f)
+                                cache_data = load_json_cache(games_cache_file)
 
                                 # Version check: old cache is a plain list; new cache
                                 # is {"v": 2, "games": [...]} with folder ROMs excluded.
@@ -2878,28 +3462,32 @@ class EnhancedLibrarySection:
                                 # Update download status by checking filesystem.
                                 # Variant files land inside a parent-named subdirectory,
                                 # so scan one level deep when the flat path misses.
+                                # Each platform directory is scanned once (os.scandir) and
+                                # games are looked up in memory instead of stat'ing per game.
                                 download_dir = Path(self.parent.rom_dir_row.get_text())
                                 downloaded_count = 0
+                                dir_index = {}
                                 for game in cached_games:
                                     platform_slug = game.get('platform_slug') or game.get('platform', 'Unknown')
                                     file_name = game.get('file_name')
                                     if file_name:
                                         platform_dir = download_dir / platform_slug
+                                        index = dir_index.get(platform_slug)
+                                        if index is None:
+                                            index = dir_index[platform_slug] = self._index_download_dir(platform_dir)
+                                        top_entries, nested_entries = index
                                         local_path = platform_dir / file_name
-                                        is_downloaded = self.is_path_validly_downloaded(local_path)
-                                        if not is_downloaded and platform_dir.exists():
-                                            try:
-                                                for _sub in platform_dir.iterdir():
-                                                    if _sub.is_dir() and self.is_path_validly_downloaded(_sub / file_name):
-                                                        local_path = _sub / file_name
-                                                        is_downloaded = True
-                                                        break
-                                            except (OSError, PermissionError):
-                                                pass
+                                        is_downloaded, local_size = self._entry_download_state(top_entries.get(file_name))
+                                        if not is_downloaded:
+                                            for nested_entry in nested_entries.get(file_name, ()):
+                                                is_downloaded, local_size = self._entry_download_state(nested_entry)
+                                                if is_downloaded:
+                                                    local_path = Path(nested_entry.path)
+                                                    break
                                         game['is_downloaded'] = is_downloaded
                                         game['local_path'] = str(local_path) if is_downloaded else None
                                         if is_downloaded:
-                                            game['local_size'] = self.get_actual_file_size(local_path)
+                                            game['local_size'] = local_size
                                             downloaded_count += 1
                                         elif 'local_size' not in game:
                                             game['local_size'] = 0
@@ -2912,17 +3500,20 @@ class EnhancedLibrarySection:
                                             game['local_size'] = 0
                                         if 'romm_data' not in game:
                                             game['romm_data'] = {'fs_size_bytes': 0}
+                                    ensure_search_keys(game)
 
                                 print(f"📊 Updated download status: {downloaded_count}/{len(cached_games)} games downloaded")
                                 self.collections_games = cached_games
+                                self._library_version += 1
                                 self.collections_cache_time = time.time()
                                 print(f"⚡ Loaded {len(self.collections_games)} games from cache in {time.time()-start_time:.2f}s")
                                 print(f"✅ Collections ready for instant loading (cache valid for {self.collections_cache_duration}s)")
                                 return
                             else:
                                 print(f"🔄 Collections changed, fetching fresh data from server")
-                    except Exception:
-                        pass
+                    except (OSError, ValueError, KeyError, TypeError) as e:
+                        # Unreadable, stale or malformed cache: rebuild below
+                        print(f"⚠️ Games cache read failed: {e}")
                 
                 # Load ROM cache if no games cache
                 if force_refresh:
@@ -2930,10 +3521,10 @@ class EnhancedLibrarySection:
                     print(f"🔄 Force refresh: bypassing ROM cache")
                 elif roms_cache_file.exists():
                     try:
-                        with open(roms_cache_file, 'r') as f:
-                            self._collections_rom_cache = json.load(f)
+                        self._collections_rom_cache = load_json_cache(roms_cache_file)
                         print(f"📁 Loaded {len(self._collections_rom_cache)} collections from disk")
-                    except Exception:
+                    except (OSError, ValueError) as e:
+                        print(f"⚠️ Collection ROM cache read failed: {e}")
                         self._collections_rom_cache = {}
                 else:
                     self._collections_rom_cache = {}
@@ -2951,18 +3542,25 @@ class EnhancedLibrarySection:
                 
                 if collections_to_fetch:
                     print(f"⚡ Fetching {len(collections_to_fetch)} new collections")
-                    for collection in collections_to_fetch:
-                        roms = self.parent.romm_client.get_collection_roms(collection.get('id'))
+                    # Network-bound: fetch the ROM lists in parallel, then store them
+                    # from this thread once all requests have completed
+                    with ThreadPoolExecutor(max_workers=8) as executor:
+                        fetched = list(executor.map(
+                            lambda c: (c, self.parent.romm_client.get_collection_roms(c.get('id'))),
+                            collections_to_fetch))
+                    for collection, roms in fetched:
                         cache_key = f"{collection.get('id')}:{collection.get('name')}"
                         self._collections_rom_cache[cache_key] = roms
                     
                     # Save ROM cache
-                    with open(roms_cache_file, 'w') as f:
-                        json.dump(self._collections_rom_cache, f)
+                    dump_json_cache(roms_cache_file, self._collections_rom_cache)
                 
-                # Build games list with download status check
+                # Build games list with download status check.  Platform
+                # directories are scanned once and reused for every ROM, so the
+                # DirEntry stat doubles as the existence check and the size.
                 all_collection_games = []
                 download_dir = Path(self.parent.rom_dir_row.get_text())
+                dir_index = {}
 
                 for collection in custom_collections:
                     cache_key = f"{collection.get('id')}:{collection.get('name')}"
@@ -2987,25 +3585,26 @@ class EnhancedLibrarySection:
                         file_name = rom.get('fs_name')
                         platform_dir = download_dir / platform_slug
                         local_path = platform_dir / file_name if file_name else None
-                        is_downloaded = local_path and self.is_path_validly_downloaded(local_path)
-
-                        # Variant files land in a parent-named subdirectory; scan one level.
-                        if not is_downloaded and file_name and platform_dir.exists():
-                            try:
-                                for _sub in platform_dir.iterdir():
-                                    if _sub.is_dir() and self.is_path_validly_downloaded(_sub / file_name):
-                                        local_path = _sub / file_name
-                                        is_downloaded = True
+                        is_downloaded = False
+                        local_size = 0
+                        if file_name:
+                            index = dir_index.get(platform_slug)
+                            if index is None:
+                                index = dir_index[platform_slug] = self._index_download_dir(platform_dir)
+                            top_entries, nested_entries = index
+                            is_downloaded, local_size = self._entry_download_state(top_entries.get(file_name))
+
+                            # Variant files land in a parent-named subdirectory; scan one level.
+                            if not is_downloaded:
+                                for nested_entry in nested_entries.get(file_name, ()):
+                                    is_downloaded, local_size = self._entry_download_state(nested_entry)
+                                    if is_downloaded:
+                                        local_path = Path(nested_entry.path)
                                         break
-                            except (OSError, PermissionError):
-                                pass
 
-                        # Get file size from local file if downloaded, otherwise from ROM metadata
-                        local_size = 0
-                        if is_downloaded and local_path:
-                            local_size = self.get_actual_file_size(local_path)
-                        elif rom.get('fs_size_bytes'):
-                            local_size = rom.get('fs_size_bytes')
+                        # Not downloaded: fall back to the size from ROM metadata
+                        if not is_downloaded:
+                            local_size = rom.get('fs_size_bytes') or 0
 
                         # Store romm_data for total size calculation (used by size_text property)
                         romm_data = {
@@ -3024,6 +3623,7 @@ class EnhancedLibrarySection:
                             'romm_data': romm_data,
                             'collection': collection.get('name')
                         }
+                        ensure_search_keys(game)
 
                         # Inject parent-ROM reference for 404-fallback downloads.
                         if file_name and file_name in _parent_by_filename:
@@ -3035,16 +3635,16 @@ class EnhancedLibrarySection:
                 # Save processed games cache (versioned format — v3 excludes folder ROMs,
                 # has _parent_rom on child variants, and was built from ungrouped ROM data)
                 try:
-                    with open(games_cache_file, 'w') as f:
-                        json.dump({'v': 4, 'games': all_collection_games}, f)
+                    if not dump_json_cache_if_changed(games_cache_file, {'v': 4, 'games': all_collection_games}):
+                        print("💾 Games cache unchanged, skipped rewrite")
                     # Save collection metadata for cache validation
                     collection_ids = [str(c.get('id')) for c in custom_collections]
-                    with open(collections_meta_file, 'w') as f:
-                        json.dump({'collection_ids': collection_ids}, f)
-                except Exception:
-                    pass
+                    dump_json_cache(collections_meta_file, {'collection_ids': collection_ids})
+                except (OSError, TypeError, ValueError) as e:
+                    print(f"⚠️ Games cache write failed: {e}")
                 
                 self.collections_games = all_collection_games
+                self._library_version += 1
                 self.collections_cache_time = time.time()  # Mark cache as valid
                 print(f"✅ Collections ready: {len(all_collection_games)} games loaded in {time.time()-start_time:.2f}s (cache valid for {self.collections_cache_duration}s)")
 
@@ -3085,34 +3685,21 @@ class EnhancedLibrarySection:
                     button.set_icon_name("folder-symbolic") # Use an "outline" icon for inactive
                     button.set_tooltip_text("Show downloaded only")
                 
-                # Work directly with existing platform items (no redundant filtering)
-                for i in range(self.library_model.root_store.get_n_items()):
-                    platform_item = self.library_model.root_store.get_item(i)
-                    if isinstance(platform_item, PlatformItem):
-                        # Apply download filter only
-                        if self.show_downloaded_only:
-                            filtered_platform_games = [g for g in platform_item.games if g.get('is_downloaded', False)]
-                        else:
-                            filtered_platform_games = platform_item.games.copy()  # Make a copy to avoid modifying original
-
-                        # Apply current sort
-                        if self.sort_downloaded_first:
-                            filtered_platform_games.sort(key=lambda g: (not g.get('is_downloaded', False), g.get('name', '').lower()))
-                        else:
-                            filtered_platform_games.sort(key=lambda g: g.get('name', '').lower())
-
-                        # Update child store by removing all and re-adding
-                        platform_item.child_store.remove_all()
-                        for game in filtered_platform_games:
-                            platform_item.child_store.append(GameItem(game))
-
-                # Update filtered_games for other components
+                # Work directly with existing platform items (no redundant filtering),
+                # collecting filtered_games for other components in the same pass
                 self.filtered_games = []
                 for i in range(self.library_model.root_store.get_n_items()):
                     platform_item = self.library_model.root_store.get_item(i)
                     if isinstance(platform_item, PlatformItem):
-                        self.filtered_games.extend(platform_item.games if not self.show_downloaded_only 
-                                                else [g for g in platform_item.games if g.get('is_downloaded', False)])
+                        # Apply download filter and current sort (returns a new list,
+                        # platform_item.games is left untouched)
+                        filtered_platform_games = platform_item.sorted_games(
+                            downloaded_first=self.sort_downloaded_first,
+                            downloaded_only=self.show_downloaded_only)
+
+                        # Replace the child store contents with one splice
+                        platform_item.show_games(filtered_platform_games)
+                        self.filtered_games.extend(filtered_platform_games)
                 
             finally:
                 # 4. Thaw notifications. This triggers a single, batched UI update.
@@ -3145,48 +3732,23 @@ class EnhancedLibrarySection:
         # Check if we should sort by download status first
         sort_downloaded_first = getattr(self, 'sort_downloaded_first', False)
 
-        game_count = len(games)
-
-        # For small lists, use simple sorting
-        if game_count < 200:
-            start_time = time.time()
-            if sort_downloaded_first:
-                result = sorted(games, key=lambda game: (
-                    game.get('platform', 'ZZZ_Unknown'),
-                    not game.get('is_downloaded', False),  # Downloaded first (False sorts before True)
-                    game.get('name', '').lower()
-                ))
-            else:
-                result = sorted(games, key=lambda game: (
-                    game.get('platform', 'ZZZ_Unknown'),
-                    game.get('name', '').lower()
-                ))
-            return result
-
-        # For large lists, use optimized sorting with download status
-        start_time = time.time()
-
-        keyed_games = []
+        # Lowercase names are cached on the game dicts (_name_lc), so each
+        # refresh only pays for the lowering once per game.  is_downloaded is
+        # read fresh: it changes in place as downloads complete.
         for game in games:
-            platform = game.get('platform', 'ZZZ_Unknown')
-            name = game.get('name', '')
-            name_lower = name.lower() if name else ''
+            if '_name_lc' not in game:
+                ensure_search_keys(game)
 
-            if sort_downloaded_first:
-                is_downloaded = game.get('is_downloaded', False)
-                sort_key = (platform, not is_downloaded, name_lower)  # Downloaded first
-            else:
-                sort_key = (platform, name_lower)
-
-            keyed_games.append((sort_key, game))
-
-        # Sort using pre-computed keys
-        keyed_games.sort(key=lambda x: x[0])
-        sorted_games = [game for sort_key, game in keyed_games]
+        if np is not None and len(games) >= NUMPY_SORT_MIN_GAMES:
+            return numpy_sort_games(games, sort_downloaded_first)
 
-        elapsed = time.time() - start_time
-
-        return sorted_games
+        if sort_downloaded_first:
+            return sorted(games, key=lambda game: (
+                game.get('platform', 'ZZZ_Unknown'),
+                not game.get('is_downloaded', False),  # Downloaded first (False sorts before True)
+                game['_name_lc']
+            ))
+        return sorted(games, key=lambda game: (game.get('platform', 'ZZZ_Unknown'), game['_name_lc']))
 
     def update_game_progress(self, rom_id, progress_info):
         """Update progress for a specific game"""
@@ -3199,79 +3761,64 @@ class EnhancedLibrarySection:
         self._update_game_status_display(rom_id)
         
     def _update_game_status_display(self, rom_id):
-        """Update game status display by directly updating cells"""
-
-        # Find and update the GameItem cells directly
-        def update_cells():
-            model = self.library_model.tree_model
-            updated_any = False
-            selected_collection = None
-
-            # In collections view, try to determine which collection is currently selected
-            if hasattr(self, 'current_view_mode') and self.current_view_mode == 'collection':
-                if self.selected_game and self.selected_game.get('rom_id') == rom_id:
-                    selected_collection = self.selected_game.get('collection')
-
-            games_found = 0
-            for i in range(model.get_n_items() if model else 0):
-                tree_item = model.get_item(i)
-                if tree_item and tree_item.get_depth() == 1:  # Game level
-                    item = tree_item.get_item()
-                    if isinstance(item, GameItem):
-                        games_found += 1
-                        if item.game_data.get('rom_id') == rom_id:
-                            # In collections view, prioritize the selected collection
-                            if selected_collection and item.game_data.get('collection') != selected_collection:
-                                continue
+        """Update game status display by directly updating cells
 
-                            item.notify('is-downloaded')
-                            item.notify('status-text')
-                            item.notify('size-text')
-                            item.notify('name')
-                            updated_any = True
+        Progress ticks arrive many times per second per download, so rom_ids
+        are collected and refreshed together by _drain_progress_updates.
+        """
+        with self._progress_update_lock:
+            self._pending_progress_updates.add(rom_id)
+            self._schedule_progress_drain()
 
-                            # If we found the selected collection, stop here
-                            if selected_collection:
-                                break
+    def _schedule_progress_drain(self):
+        """Queue one drain for all pending row refreshes (call with _progress_update_lock held)"""
+        if self._progress_update_scheduled:
+            return
+        self._progress_update_scheduled = True
+        # Ticks landing within one interval share a single refresh
+        GLib.timeout_add(PROGRESS_UI_INTERVAL_MS, self._drain_progress_updates)
+
+    def _drain_progress_updates(self):
+        """Refresh the game and disc rows queued since the last drain"""
+        with self._progress_update_lock:
+            pending = self._pending_progress_updates
+            self._pending_progress_updates = set()
+            pending_discs = self._pending_disc_updates
+            self._pending_disc_updates = set()
+            self._progress_update_scheduled = False
+
+        # Find the GameItem cells directly (rom_id index, no tree walk).
+        # Every row of a ROM (one per collection in collections view) shows
+        # the same download state, so all of them are refreshed.
+        game_items, variant_items = [], []
+        for rom_id in pending:
+            game_items += game_items_by_rom_id.get(rom_id)
+            # Also update child items (regional variants) with this rom_id
+            variant_items += disc_items_by_rom_id.get(rom_id)
+        notify_items(game_items, 'is-downloaded', 'status-text', 'size-text', 'name')
+        notify_items(variant_items, 'is-downloaded', 'size-text', 'name')
+
+        # Look discs up by (game rom_id, disc name) instead of walking the tree
+        disc_items = [disc_item for key in pending_discs for disc_item in disc_items_by_key.get(key)]
+        # This will call the update functions in bind_size_cell and bind_status_cell
+        notify_items(disc_items, 'is-downloaded', 'size-text')
+
+        # Also queue a redraw to ensure visual updates
+        if disc_items:
+            self._queue_redraw()
+        return False
 
-            # If no selected collection or not found, update all instances
-            if not updated_any:
-                for i in range(model.get_n_items() if model else 0):
-                    tree_item = model.get_item(i)
-                    if tree_item and tree_item.get_depth() == 1:
-                        item = tree_item.get_item()
-                        if isinstance(item, GameItem) and item.game_data.get('rom_id') == rom_id:
-                            item.notify('is-downloaded')
-                            item.notify('status-text')
-                            item.notify('size-text')
-                            item.notify('name')
-
-            # Also check child items (regional variants) for matching rom_id
-            for i in range(model.get_n_items() if model else 0):
-                tree_item = model.get_item(i)
-                if tree_item and tree_item.get_depth() == 0:  # Platform level
-                    platform_item = tree_item.get_item()
-                    if isinstance(platform_item, PlatformItem):
-                        # Look through games
-                        for j in range(platform_item.child_store.get_n_items()):
-                            game_item = platform_item.child_store.get_item(j)
-                            if isinstance(game_item, GameItem):
-                                # Check if game has regional variants
-                                if hasattr(game_item, 'child_store') and game_item.child_store:
-                                    for k in range(game_item.child_store.get_n_items()):
-                                        child_item = game_item.child_store.get_item(k)
-                                        if isinstance(child_item, DiscItem):
-                                            child_rom_id = child_item.disc_data.get('rom_id')
-                                            # Check if this child's ROM ID matches
-                                            if child_rom_id == rom_id:
-                                                child_item.notify('is-downloaded')
-                                                child_item.notify('size-text')
-                                                child_item.notify('name')
-                                                updated_any = True
+    def _queue_redraw(self):
+        """Schedule one column_view redraw for however many disc updates land before it runs"""
+        if self._redraw_scheduled or self.column_view is None:
+            return
+        self._redraw_scheduled = True
 
+        def redraw():
+            self._redraw_scheduled = False
+            self.column_view.queue_draw()
             return False
-
-        GLib.idle_add(update_cells)
+        GLib.idle_add(redraw, priority=GLib.PRIORITY_LOW)
 
     def update_disc_progress(self, rom_id, disc_name, progress_info):
         """Update progress for a specific disc in a multi-disc game"""
@@ -3279,47 +3826,18 @@ class EnhancedLibrarySection:
 
         if progress_info:
             # Store disc progress separately
-            if not hasattr(self, 'disc_progress'):
-                self.disc_progress = {}
             self.disc_progress[disc_key] = progress_info
-        elif hasattr(self, 'disc_progress') and disc_key in self.disc_progress:
-            del self.disc_progress[disc_key]
+        else:
+            self.disc_progress.pop(disc_key, None)
 
         # Find and update the specific disc item
         self._update_disc_status_display(rom_id, disc_name)
 
     def _update_disc_status_display(self, rom_id, disc_name):
-        """Update disc status display by directly updating cells"""
-        def update_cells():
-            model = self.library_model.tree_model
-
-            # Find the game item first
-            for i in range(model.get_n_items() if model else 0):
-                tree_item = model.get_item(i)
-                if tree_item and tree_item.get_depth() == 0:  # Platform level
-                    platform_item = tree_item.get_item()
-                    if isinstance(platform_item, PlatformItem):
-                        # Look through child items (games)
-                        for j in range(platform_item.child_store.get_n_items()):
-                            game_item = platform_item.child_store.get_item(j)
-                            if isinstance(game_item, GameItem) and game_item.game_data.get('rom_id') == rom_id:
-                                # Found the game, now look through its discs
-                                if hasattr(game_item, 'child_store') and game_item.child_store:
-                                    for k in range(game_item.child_store.get_n_items()):
-                                        disc_item = game_item.child_store.get_item(k)
-                                        if isinstance(disc_item, DiscItem) and disc_item.disc_data.get('name') == disc_name:
-                                            # Trigger property notifications to update UI
-                                            # This will call the update functions in bind_size_cell and bind_status_cell
-                                            disc_item.notify('is-downloaded')
-                                            disc_item.notify('size-text')
-
-                                            # Also queue a redraw to ensure visual updates
-                                            if hasattr(self, 'column_view'):
-                                                self.column_view.queue_draw()
-                                            return False
-            return False
-
-        GLib.idle_add(update_cells)
+        """Update disc status display by directly updating cells (batched like game rows)"""
+        with self._progress_update_lock:
+            self._pending_disc_updates.add((rom_id, disc_name))
+            self._schedule_progress_drain()
 
     def on_open_in_romm_clicked(self, button):
         """Opens the selected game or platform page in the default web browser."""
@@ -3344,13 +3862,10 @@ class EnhancedLibrarySection:
         else:
             # Check if platform is selected via tree selection
             selection_model = self.column_view.get_model()
-            selected_positions = []
-            for i in range(selection_model.get_n_items()):
-                if selection_model.is_selected(i):
-                    selected_positions.append(i)
-            
-            if len(selected_positions) == 1:
-                tree_item = selection_model.get_item(selected_positions[0])
+            selected_position = single_selected_position(selection_model)
+
+            if selected_position is not None:
+                tree_item = selection_model.get_item(selected_position)
                 item = tree_item.get_item()
                 
                 if isinstance(item, PlatformItem):
@@ -3938,9 +4453,7 @@ class EnhancedLibrarySection:
             return
             
         # Get platforms that have results
-        platforms_with_results = set()
-        for game in filtered_games:
-            platforms_with_results.add(game.get('platform', 'Unknown'))
+        platforms_with_results = {game.get('platform', 'Unknown') for game in filtered_games}
         
         def expand_matching_platforms():
             model = self.library_model.tree_model
@@ -3962,6 +4475,7 @@ class EnhancedLibrarySection:
 
     def update_games_library(self, games):
         """Update the tree view with enhanced stable expansion preservation"""
+        self._library_version += 1
         multi_count = sum(1 for g in games if g.get('is_multi_disc', False))
 
         # Debug: show stack trace to see who's calling this
@@ -3982,18 +4496,8 @@ class EnhancedLibrarySection:
             timer.checkpoint(f"apply_filters: {time.time() - filter_start:.2f}s")
             self.filtered_games = games
 
-            # Apply current platform filter
-            plat_filter_start = time.time()
-            selected_index = self.platform_filter.get_selected()
-            if selected_index != Gtk.INVALID_LIST_POSITION:
-                string_list = self.platform_filter.get_model()
-                if string_list:
-                    selected_platform = string_list.get_string(selected_index)
-                    if selected_platform != "All Platforms":
-                        games = [game for game in games if game.get('platform', 'Unknown') == selected_platform]
-            timer.checkpoint(f"platform filter: {time.time() - plat_filter_start:.2f}s")
-
-            self.filtered_games = games
+            # apply_filters already narrowed to the selected platform via the
+            # per-platform index, so no second scan is needed here
 
             # Save scroll position
             scroll_position = 0
@@ -4005,15 +4509,11 @@ class EnhancedLibrarySection:
                         scroll_position = vadj.get_value()
 
             def do_update():
-                update_start = time.time()
                 self.library_model.update_library(games)
 
-                group_filter_start = time.time()
-                self.update_group_filter(games)  # Use filtered games, not all games
-
-                if games:
-                    downloaded_count = sum(1 for g in games if g.get('is_downloaded'))
-                    total_count = len(games)
+                # Let the tree render first; the dropdown can repopulate once idle
+                # (use filtered games, not all games)
+                GLib.idle_add(self.update_group_filter, games, priority=GLib.PRIORITY_DEFAULT_IDLE)
 
             # Update with selection preservation
             preserve_start = time.time()
@@ -4034,13 +4534,12 @@ class EnhancedLibrarySection:
 
     def refresh_all_platform_checkboxes(self):
         """Force refresh all platform checkbox states to match current selections"""
-        model = self.library_model.tree_model
-        for i in range(model.get_n_items()):
-            tree_item = model.get_item(i)
-            if tree_item and tree_item.get_depth() == 0:  # Platform level
-                item = tree_item.get_item()
-                if isinstance(item, PlatformItem):
-                    self.update_platform_checkbox_for_game({'platform': item.platform_name})
+        # Platform rows are exactly root_store; skip the flattened tree walk
+        root_store = self.library_model.root_store
+        for i in range(root_store.get_n_items()):
+            item = root_store.get_item(i)
+            if isinstance(item, PlatformItem):
+                self.update_platform_checkbox_for_game({'platform': item.platform_name})
 
     def _restore_tree_state_immediate(self, tree_state):
         """Restore tree state immediately for smoother transitions"""
@@ -4074,77 +4573,130 @@ class EnhancedLibrarySection:
         selection_model = self.column_view.get_model()
 
         # Get row selections
-        for i in range(selection_model.get_n_items()):
-            if selection_model.is_selected(i):
-                tree_item = selection_model.get_item(i)
-                if tree_item and tree_item.get_depth() == 1:
-                    item = tree_item.get_item()
-                    if isinstance(item, GameItem):
-                        selected_games.append(item.game_data)
-
-        # Add checkbox selections
-        for rom_id in self.selected_rom_ids:
-            for game in self.parent.available_games:
-                if game.get('rom_id') == rom_id and game not in selected_games:
+        for i in iter_selected_positions(selection_model):
+            tree_item = selection_model.get_item(i)
+            if tree_item and tree_item.get_depth() == 1:
+                item = tree_item.get_item()
+                if isinstance(item, GameItem):
+                    selected_games.append(item.game_data)
+
+        # Add checkbox selections (one rom_id index instead of a scan per ROM)
+        if self.selected_rom_ids:
+            games_by_rom_id = self._index_available_games()
+            seen_rom_ids = {game.get('rom_id') for game in selected_games}
+            for rom_id in self.selected_rom_ids:
+                game = games_by_rom_id.get(rom_id)
+                if game is not None and rom_id not in seen_rom_ids:
                     selected_games.append(game)
-                    break
+                    seen_rom_ids.add(rom_id)
 
         return selected_games
 
+    def _collect_checked_games(self):
+        """Games whose checkbox is checked in the current view, in library order"""
+        selected_games = []
+        selected_keys = self.selected_game_keys
+
+        # FIX: Use correct games source based on view mode
+        if self.current_view_mode == 'collection':
+            # Collection rows are keyed collection:{rom_id}:{collection}; the
+            # rom_ids in the selection prefilter games before any key is built
+            selected_ids = set()
+            for key in selected_keys:
+                if key.startswith('collection:'):
+                    head = key[11:].partition(':')[0]
+                    if head.isdigit():
+                        selected_ids.add(int(head))
+            if selected_ids:
+                for game in getattr(self, 'collections_games', []):
+                    rom_id = game.get('rom_id')
+                    if rom_id in selected_ids:
+                        collection_name = game.get('collection', '')
+                        if collection_name and f"collection:{rom_id}:{collection_name}" in selected_keys:
+                            selected_games.append(game)
+        else:
+            # Standard platform mode logic (get_game_identifier inlined: rom_id, else name|platform).
+            # name|platform keys are only looked up when such a key is actually selected.
+            selected_rom_ids = self.selected_rom_ids
+            has_name_keys = any(not key.startswith(('disc:', 'collection:')) for key in selected_keys)
+            if selected_rom_ids or has_name_keys:
+                for game in self.parent.available_games:
+                    rom_id = game.get('rom_id')
+                    if rom_id:
+                        if rom_id in selected_rom_ids:
+                            selected_games.append(game)
+                    elif has_name_keys and game_key_of(game) in selected_keys:
+                        selected_games.append(game)
+        return selected_games
+
+    def _index_available_games(self):
+        """rom_id -> first matching game in available_games"""
+        games_by_rom_id = {}
+        for game in self.parent.available_games:
+            rom_id = game.get('rom_id')
+            if rom_id is not None and rom_id not in games_by_rom_id:
+                games_by_rom_id[rom_id] = game
+        return games_by_rom_id
+
     def get_selected_discs(self):
         """Get selected discs from multi-disc games and regional variants"""
         selected_discs = []
+        games_by_rom_id = None
         for key in self.selected_game_keys:
-            if key.startswith('disc:'):
-                # Parse disc key: disc:{rom_id}:{disc_name}
-                parts = key.split(':', 2)
-                if len(parts) == 3:
-                    rom_id = int(parts[1])
-                    disc_name = parts[2]
-
-                    # Find the game and disc (multi-disc games)
-                    for game in self.parent.available_games:
-                        if game.get('rom_id') == rom_id and game.get('is_multi_disc'):
-                            for disc in game.get('discs', []):
-                                if disc.get('name') == disc_name:
-                                    selected_discs.append({
-                                        'game': game,
-                                        'disc': disc
-                                    })
-                                    break
-                            break
-                        # Also check for regional variants
-                        elif game.get('rom_id') == rom_id and game.get('_sibling_files'):
-                            # Build regional variant items to match against
-                            from pathlib import Path
-                            for sibling in game.get('_sibling_files', []):
-                                full_fs_name = sibling.get('fs_name') or sibling.get('name', 'Unknown')
-                                variant_name = Path(full_fs_name).stem if full_fs_name != 'Unknown' else 'Unknown'
-                                if variant_name == disc_name:
-                                    # Check if this variant is downloaded
-                                    parent_local_path = game.get('local_path')
-                                    parent_is_downloaded = game.get('is_downloaded', False)
-                                    variant_is_downloaded = False
-                                    if parent_is_downloaded and parent_local_path:
-                                        parent_path = Path(parent_local_path)
-                                        if parent_path.is_dir():
-                                            variant_file_path = parent_path / full_fs_name
-                                            variant_is_downloaded = variant_file_path.exists()
-
-                                    variant_data = {
-                                        'name': variant_name,
-                                        'full_fs_name': full_fs_name,
-                                        'rom_id': sibling.get('id'),
-                                        'is_downloaded': variant_is_downloaded,
-                                        'size': sibling.get('fs_size_bytes', 0),
-                                        'is_regional_variant': True
-                                    }
-                                    selected_discs.append({
-                                        'game': game,
-                                        'disc': variant_data
-                                    })
-                                    break
-                            break
+            if not key.startswith('disc:'):
+                continue
+            # Parse disc key: disc:{rom_id}:{disc_name} (one partition past the prefix)
+            rom_id_str, sep, disc_name = key[5:].partition(':')
+            if not sep:
+                continue
+            rom_id = int(rom_id_str)
+
+            if games_by_rom_id is None:
+                games_by_rom_id = self._index_available_games()
+            game = games_by_rom_id.get(rom_id)
+            if game is None:
+                continue
+
+            # Find the disc (multi-disc games)
+            if game.get('is_multi_disc'):
+                for disc in game.get('discs', []):
+                    if disc.get('name') == disc_name:
+                        selected_discs.append({
+                            'game': game,
+                            'disc': disc
+                        })
+                        break
+            # Also check for regional variants
+            elif game.get('_sibling_files'):
+                # Build regional variant items to match against
+                from pathlib import Path
+                for sibling in game.get('_sibling_files', []):
+                    full_fs_name = sibling.get('fs_name') or sibling.get('name', 'Unknown')
+                    variant_name = Path(full_fs_name).stem if full_fs_name != 'Unknown' else 'Unknown'
+                    if variant_name == disc_name:
+                        # Check if this variant is downloaded
+                        parent_local_path = game.get('local_path')
+                        parent_is_downloaded = game.get('is_downloaded', False)
+                        variant_is_downloaded = False
+                        if parent_is_downloaded and parent_local_path:
+                            parent_path = Path(parent_local_path)
+                            if parent_path.is_dir():
+                                variant_file_path = parent_path / full_fs_name
+                                variant_is_downloaded = variant_file_path.exists()
+
+                        variant_data = {
+                            'name': variant_name,
+                            'full_fs_name': full_fs_name,
+                            'rom_id': sibling.get('id'),
+                            'is_downloaded': variant_is_downloaded,
+                            'size': sibling.get('fs_size_bytes', 0),
+                            'is_regional_variant': True
+                        }
+                        selected_discs.append({
+                            'game': game,
+                            'disc': variant_data
+                        })
+                        break
         return selected_discs
 
     def get_game_identifier(self, game_data):
@@ -4153,12 +4705,14 @@ class EnhancedLibrarySection:
         if rom_id:
             return ('rom_id', rom_id)
         else:
-            name = game_data.get('name', '')
-            platform = game_data.get('platform', '')
-            return ('game_key', f"{name}|{platform}")
+            return ('game_key', game_key_of(game_data))
 
-    def is_game_in_autosync_collection(self, game_data):
-        """Check if a game is in any collection that has autosync enabled"""
+    def is_game_in_autosync_collection(self, game_data, autosync_rom_ids=None):
+        """Check if a game is in any collection that has autosync enabled
+
+        Callers testing many games can pass one _get_autosync_rom_ids() result
+        instead of re-validating the index per game.
+        """
         rom_id = game_data.get('rom_id')
 
         # If no rom_id, check the current collection only
@@ -4167,14 +4721,24 @@ class EnhancedLibrarySection:
             return collection_name in self.actively_syncing_collections
 
         # Check all collections that contain this rom_id
-        if hasattr(self, 'collections_games'):
-            for collection_game in self.collections_games:
-                if collection_game.get('rom_id') == rom_id:
-                    collection_name = collection_game.get('collection', '')
-                    if collection_name in self.actively_syncing_collections:
-                        return True
-
-        return False
+        if autosync_rom_ids is None:
+            autosync_rom_ids = self._get_autosync_rom_ids()
+        return rom_id in autosync_rom_ids
+
+    def _get_autosync_rom_ids(self):
+        """ROM IDs in actively syncing collections, rebuilt only when either side changes"""
+        games = getattr(self, 'collections_games', None) or []
+        active = self.actively_syncing_collections
+        # actively_syncing_collections is rebound and mutated in many places,
+        # so the cache is keyed on a snapshot of it rather than invalidated
+        key = (id(games), len(games), self._library_version, frozenset(active))
+        if key != self._autosync_index_key:
+            self._autosync_rom_ids = {
+                game.get('rom_id') for game in games
+                if game.get('collection', '') in active
+            }
+            self._autosync_index_key = key
+        return self._autosync_rom_ids
 
     def _block_selection_updates(self, block=True):
         """Temporarily block selection updates during dialogs"""
@@ -4182,23 +4746,23 @@ class EnhancedLibrarySection:
 
     def update_platform_checkbox_states(self):
         """Update platform checkbox states based on their games' selection"""
-        model = self.library_model.tree_model
-        for i in range(model.get_n_items()):
-            tree_item = model.get_item(i)
-            if tree_item and tree_item.get_depth() == 0:  # Platform level items
-                item = tree_item.get_item()
-                if isinstance(item, PlatformItem):
-                    # Check how many games in this platform are selected
-                    selected_games_in_platform = [
-                        game_item for game_item in self.selected_checkboxes 
-                        if game_item.game_data in item.games
-                    ]
-                    
-                    # Platform should be checked if all games are selected
-                    should_be_checked = len(selected_games_in_platform) == len(item.games) and len(item.games) > 0
-                    
-                    # This will trigger a UI refresh for the platform checkbox
-                    # The bind_checkbox_cell method will handle the visual update
+        root_store = self.library_model.root_store
+        for i in range(root_store.get_n_items()):
+            item = root_store.get_item(i)
+            if isinstance(item, PlatformItem):
+                # Check how many games in this platform are selected (hash
+                # lookups by identity instead of a list scan with dict ==)
+                game_ids = {id(game) for game in item.games}
+                selected_in_platform = sum(
+                    1 for game_item in self.selected_checkboxes
+                    if id(game_item.game_data) in game_ids
+                )
+                
+                # Platform should be checked if all games are selected
+                should_be_checked = selected_in_platform == len(game_ids) and len(game_ids) > 0
+                
+                # This will trigger a UI refresh for the platform checkbox
+                # The bind_checkbox_cell method will handle the visual update
 
     def update_bulk_action_buttons(self):
         """Update action button states based on selection (no separate bulk buttons)"""
@@ -4227,11 +4791,16 @@ class EnhancedLibrarySection:
         selected_games = self.get_selected_games()
         
         # Filter to only downloaded games
-        downloaded_games = [g for g in selected_games if g.get('is_downloaded', False)]
+        downloaded_games = downloaded_games_of(selected_games)
         
         if downloaded_games and hasattr(self.parent, 'delete_multiple_games'):
             self.parent.delete_multiple_games(downloaded_games)
 
+    def _add_games_to_selection(self, games):
+        """Partition games into the rom_id / game_key selection sets (same keys as get_game_identifier)"""
+        self.selected_rom_ids.update({game['rom_id'] for game in games if game.get('rom_id')})
+        self.selected_game_keys.update({game_key_of(game) for game in games if not game.get('rom_id')})
+
     def on_select_all(self, button):
         """Select all game items (not platforms)"""
         self.selected_checkboxes.clear()
@@ -4239,12 +4808,7 @@ class EnhancedLibrarySection:
         self.selected_game_keys.clear()
         
         # Add all games to selection tracking
-        for game in self.parent.available_games:
-            identifier_type, identifier_value = self.get_game_identifier(game)
-            if identifier_type == 'rom_id':
-                self.selected_rom_ids.add(identifier_value)
-            elif identifier_type == 'game_key':
-                self.selected_game_keys.add(identifier_value)
+        self._add_games_to_selection(self.parent.available_games)
         
         self.sync_selected_checkboxes()
         self.update_action_buttons()
@@ -4260,13 +4824,7 @@ class EnhancedLibrarySection:
         self.selected_game_keys.clear()
         
         # Add only downloaded games to selection tracking
-        for game in self.parent.available_games:
-            if game.get('is_downloaded', False):
-                identifier_type, identifier_value = self.get_game_identifier(game)
-                if identifier_type == 'rom_id':
-                    self.selected_rom_ids.add(identifier_value)
-                elif identifier_type == 'game_key':
-                    self.selected_game_keys.add(identifier_value)
+        self._add_games_to_selection(downloaded_games_of(self.parent.available_games))
         
         self.sync_selected_checkboxes()
         self.update_action_buttons()
@@ -4430,6 +4988,7 @@ class EnhancedLibrarySection:
         checkbox_factory = Gtk.SignalListItemFactory()
         checkbox_factory.connect('setup', self.setup_checkbox_cell)
         checkbox_factory.connect('bind', self.bind_checkbox_cell)
+        checkbox_factory.connect('unbind', self.unbind_checkbox_cell)
         checkbox_column = Gtk.ColumnViewColumn.new("", checkbox_factory)
         checkbox_column.set_fixed_width(75)  # Increased width to accommodate both switch and steam button
         self.column_view.append_column(checkbox_column)
@@ -4438,6 +4997,7 @@ class EnhancedLibrarySection:
         name_factory = Gtk.SignalListItemFactory()
         name_factory.connect('setup', self.setup_name_cell)
         name_factory.connect('bind', self.bind_name_cell)
+        name_factory.connect('unbind', self.unbind_cell)
         name_column = Gtk.ColumnViewColumn.new("Name", name_factory)
         name_column.set_expand(True)
         self.column_view.append_column(name_column)
@@ -4446,6 +5006,7 @@ class EnhancedLibrarySection:
         status_factory = Gtk.SignalListItemFactory()
         status_factory.connect('setup', self.setup_status_cell)
         status_factory.connect('bind', self.bind_status_cell)
+        status_factory.connect('unbind', self.unbind_cell)
         status_column = Gtk.ColumnViewColumn.new("Status", status_factory)
         status_column.set_fixed_width(80)
         self.column_view.append_column(status_column)
@@ -4454,6 +5015,7 @@ class EnhancedLibrarySection:
         sync_status_factory = Gtk.SignalListItemFactory()
         sync_status_factory.connect('setup', self.setup_sync_status_cell)
         sync_status_factory.connect('bind', self.bind_sync_status_cell)
+        sync_status_factory.connect('unbind', self.unbind_cell)
         self.sync_status_column = Gtk.ColumnViewColumn.new("Sync", sync_status_factory)
         self.sync_status_column.set_fixed_width(50)
         self.sync_status_column.set_visible(False)  # Hidden by default (platform view)
@@ -4463,12 +5025,30 @@ class EnhancedLibrarySection:
         size_factory = Gtk.SignalListItemFactory()
         size_factory.connect('setup', self.setup_size_cell)
         size_factory.connect('bind', self.bind_size_cell)
+        size_factory.connect('unbind', self.unbind_cell)
         size_column = Gtk.ColumnViewColumn.new("Size", size_factory)  # Fixed the typo here
         size_column.set_fixed_width(150)
         self.column_view.append_column(size_column)
         
         scrolled.set_child(self.column_view)
-        return scrolled
+
+        # Spinner shown over the (empty) tree while collections load, instead
+        # of inserting placeholder rows that are thrown away a moment later
+        overlay = Gtk.Overlay()
+        overlay.set_child(scrolled)
+        self.collections_spinner = Gtk.Spinner()
+        self.collections_spinner.set_halign(Gtk.Align.CENTER)
+        self.collections_spinner.set_valign(Gtk.Align.CENTER)
+        self.collections_spinner.set_size_request(32, 32)
+        self.collections_spinner.set_visible(False)
+        overlay.add_overlay(self.collections_spinner)
+        return overlay
+
+    def _set_collections_loading(self, loading):
+        """Show/hide the collections loading spinner"""
+        self.collections_spinner.set_spinning(loading)
+        self.collections_spinner.set_visible(loading)
+        return False
 
     def on_row_activated(self, column_view, position):
         """Handle row activation (double-click)"""
@@ -4507,21 +5087,14 @@ class EnhancedLibrarySection:
         if not selection_model:
             return
 
-        selected_indices = set()
-        expanded_items = set()
-
-        # Save both selections and expanded states
-        for i in range(selection_model.get_n_items()):
-            tree_item = selection_model.get_item(i)
-            if tree_item:
-                # Save selection
-                if selection_model.is_selected(i):
-                    selected_indices.add(i)
-                # Save expanded state for top-level items (platforms/collections)
-                if tree_item.get_depth() == 0 and tree_item.get_expanded():
-                    item = tree_item.get_item()
-                    if isinstance(item, PlatformItem):
-                        expanded_items.add(item.platform_name)
+        # Save selection from the selection bitset
+        selected_indices = set(iter_selected_positions(selection_model))
+        # Save expanded state for top-level items (platforms/collections)
+        expanded_items = {
+            platform.platform_name
+            for platform, row in self.library_model._platform_rows()
+            if row.get_expanded()
+        }
 
         if self.current_view_mode == 'platform':
             self.platform_view_selection = selected_indices
@@ -4538,6 +5111,30 @@ class EnhancedLibrarySection:
             self.collection_view_selected_game = self.selected_game
             self.collection_view_expanded = expanded_items
 
+    def _schedule_ui_refresh(self):
+        """Coalesce selection label + action button refreshes into one idle callback"""
+        if self._ui_refresh_pending:
+            return
+        self._ui_refresh_pending = True
+        GLib.idle_add(self._flush_ui_refresh, priority=GLib.PRIORITY_DEFAULT_IDLE)
+
+    def _flush_ui_refresh(self):
+        self._ui_refresh_pending = False
+        self.update_selection_label()
+        self.update_action_buttons()
+        return False
+
+    def _restore_selection_after_switch(self):
+        """idle_add callback for view switches: restore selection, then sync checkboxes once
+
+        Rows realized later are handled at bind time (bind_checkbox_cell
+        already sets their state), so one pass over the realized rows in the
+        same idle tick suffices — no retry timers or second idle source.
+        """
+        self.restore_saved_selection()
+        self.force_checkbox_sync()
+        return False
+
     def restore_saved_selection(self):
         """Restore saved row selections, checkbox states, and expanded states based on view mode"""
         selection_model = self.column_view.get_model()
@@ -4561,14 +5158,7 @@ class EnhancedLibrarySection:
 
         # Restore expanded state for platforms/collections ONLY if they were expanded before
         if saved_expanded:
-            n_items = selection_model.get_n_items()
-            for i in range(n_items):
-                tree_item = selection_model.get_item(i)
-                if tree_item and tree_item.get_depth() == 0:
-                    item = tree_item.get_item()
-                    if isinstance(item, PlatformItem):
-                        if item.platform_name in saved_expanded:
-                            tree_item.set_expanded(True)
+            self.library_model.expand_platforms(saved_expanded)
 
         # Restore row selection for saved indices
         if saved_selection:
@@ -4578,8 +5168,7 @@ class EnhancedLibrarySection:
                     selection_model.select_item(index, False)  # False = don't unselect others
 
         # Update UI to reflect restored selections
-        self.update_selection_label()
-        self.update_action_buttons()
+        self._schedule_ui_refresh()
 
     def on_platforms_toggle(self, toggle_button):
         """Handle Platforms button toggle"""
@@ -4591,80 +5180,38 @@ class EnhancedLibrarySection:
         if toggle_button.get_active():
             self.switch_to_collection_view()
 
-    def switch_to_collection_view(self):
-        """Switch to collection view"""
-        # Save current selection before switching
-        self.save_current_selection()
-
-        # Increment generation counter to invalidate any pending background loads
-        self.view_mode_generation += 1
-
-        self.current_view_mode = 'collection'
-
-        # Hide platform filter in collections view
-        if hasattr(self, 'platform_filter'):
-            self.platform_filter.set_visible(False)
-
-        # IMMEDIATELY clear the tree to remove platform view data
-        self.library_model.root_store.remove_all()
-
-        # Clear all selections when switching views
-        selection_model = self.column_view.get_model()
-        if selection_model:
-            selection_model.unselect_all()
-        self.selected_checkboxes.clear()
-        self.selected_rom_ids.clear()
-        self.selected_game_keys.clear()
-        self.selected_game = None
-        self.selected_disc = None
-        self.selected_collection = None
-        # Update UI immediately to reflect cleared selections
-        self.update_selection_label()
-        self.update_action_buttons()
-
-        # Force GTK to render the empty tree NOW
-        context = GLib.MainContext.default()
-        while context.pending():
-            context.iteration(False)
-
-        # Collection sync controls removed - using toggle switches now
-
-        # Show sync status column (only for collections)
-        if hasattr(self, 'sync_status_column'):
-            self.sync_status_column.set_visible(True)
-
-        self.load_collections_view()
-
-        # Restore saved selection and refresh checkboxes after the view is loaded
-        def restore_and_refresh():
-            self.restore_saved_selection()
-            # Sync currently-realized checkboxes after the selection state is
-            # restored. Rows realized later are handled at bind time
-            # (bind_checkbox_cell already sets their state), so a single
-            # idle-time pass suffices — no staggered retry timers needed.
-            GLib.idle_add(self.force_checkbox_sync)
-            return False
-        GLib.idle_add(restore_and_refresh)
+    def switch_to_collection_view(self):
+        """Switch to collection view"""
+        self._switch_view('collection')
 
     def switch_to_platform_view(self):
         """Switch to platform view"""
+        self._switch_view('platform')
+
+    def on_view_mode_toggled(self, toggle_button):
+        """Switch between platform and collection view"""
+        if toggle_button.get_active():
+            self._switch_view('collection')
+        else:
+            toggle_button.set_label("Collections")
+            self._switch_view('platform')
+
+    def _switch_view(self, mode):
+        """Common view switch: save/clear selections, toggle columns, then load the new view"""
         # Save current selection before switching
         self.save_current_selection()
 
         # Increment generation counter to invalidate any pending background loads
         self.view_mode_generation += 1
 
-        self.current_view_mode = 'platform'
-
-        # Show platform filter in platform view
-        if hasattr(self, 'platform_filter'):
-            self.platform_filter.set_visible(True)
-
-        # Collection sync controls removed - using toggle switches now
+        self.current_view_mode = mode
 
-        # Hide sync status column (not needed for platforms)
-        if hasattr(self, 'sync_status_column'):
-            self.sync_status_column.set_visible(False)
+        # Platform filter only applies to the platform view; the sync status
+        # column only to collections
+        if self.platform_filter is not None:
+            self.platform_filter.set_visible(mode == 'platform')
+        if self.sync_status_column is not None:
+            self.sync_status_column.set_visible(mode == 'collection')
 
         # Clear all selections when switching views
         selection_model = self.column_view.get_model()
@@ -4674,113 +5221,38 @@ class EnhancedLibrarySection:
         self.selected_rom_ids.clear()
         self.selected_game_keys.clear()
         self.selected_game = None
+        self.selected_disc = None
         self.selected_collection = None
-        # Update UI immediately to reflect cleared selections
-        self.update_selection_label()
-        self.update_action_buttons()
 
-        original_games = self.parent.available_games.copy()
-        self.library_model.update_library(original_games, group_by='platform')
+        enter_mode = {
+            'platform': self._enter_platform_mode,
+            'collection': self._enter_collection_mode,
+        }
+        enter_mode[mode]()
 
         # Restore saved selection and refresh checkboxes after the view is loaded
-        def restore_and_refresh():
-            self.restore_saved_selection()
-            # Sync currently-realized checkboxes after the selection state is
-            # restored. Rows realized later are handled at bind time
-            # (bind_checkbox_cell already sets their state), so a single
-            # idle-time pass suffices — no staggered retry timers needed.
-            GLib.idle_add(self.force_checkbox_sync)
-            return False
-        GLib.idle_add(restore_and_refresh)
-
-    def on_view_mode_toggled(self, toggle_button):
-        """Switch between platform and collection view"""
-        # Save current selection before switching
-        self.save_current_selection()
-
-        # Increment generation counter to invalidate any pending background loads
-        self.view_mode_generation += 1
-
-        if toggle_button.get_active():
-            # Collections view
-            self.current_view_mode = 'collection'
-
-            # IMMEDIATELY clear the tree to remove platform view data
-            self.library_model.root_store.remove_all()
-
-            # Clear all selections when switching views
-            selection_model = self.column_view.get_model()
-            if selection_model:
-                selection_model.unselect_all()
-            self.selected_checkboxes.clear()
-            self.selected_rom_ids.clear()
-            self.selected_game_keys.clear()
-            self.selected_game = None
-            self.selected_collection = None
-            # Update UI immediately to reflect cleared selections
-            self.update_selection_label()
-            self.update_action_buttons()
+        GLib.idle_add(self._restore_selection_after_switch)
+        # Queued after the restore, so its own refresh request folds into this one
+        self._schedule_ui_refresh()
 
-            # Force GTK to render the empty tree NOW
-            context = GLib.MainContext.default()
-            while context.pending():
-                context.iteration(False)
-
-            # Collection sync controls removed - using toggle switches now
+    def _enter_platform_mode(self):
+        self._set_collections_loading(False)
+        original_games = self.parent.available_games.copy()
+        self.library_model.update_library(original_games, group_by='platform')
 
-            # Show sync status column (only for collections)
-            if hasattr(self, 'sync_status_column'):
-                self.sync_status_column.set_visible(True)
+    def _enter_collection_mode(self):
+        # IMMEDIATELY clear the tree to remove platform view data. Continue
+        # from a default-priority idle, which runs after GDK's redraw, so the
+        # empty tree is painted without draining the main context here
+        self.library_model.root_store.remove_all()
+        GLib.idle_add(self._continue_view_switch, self.view_mode_generation,
+                      priority=GLib.PRIORITY_DEFAULT_IDLE)
 
+    def _continue_view_switch(self, generation):
+        """idle_add callback: load collections unless the view was switched again meanwhile"""
+        if generation == self.view_mode_generation and self.current_view_mode == 'collection':
             self.load_collections_view()
-
-            # Restore saved selection and refresh checkboxes after the view is loaded
-            def restore_and_refresh():
-                self.restore_saved_selection()
-                # Sync currently-realized checkboxes after the selection state is
-                # restored. Rows realized later are handled at bind time
-                # (bind_checkbox_cell already sets their state), so a single
-                # idle-time pass suffices — no staggered retry timers needed.
-                GLib.idle_add(self.force_checkbox_sync)
-                return False
-            GLib.idle_add(restore_and_refresh)
-        else:
-            # Platform view
-            toggle_button.set_label("Collections")
-            self.current_view_mode = 'platform'
-
-            # Collection sync controls removed - using toggle switches now
-
-            # Hide sync status column (not needed for platforms)
-            if hasattr(self, 'sync_status_column'):
-                self.sync_status_column.set_visible(False)
-
-            # Clear all selections when switching views
-            selection_model = self.column_view.get_model()
-            if selection_model:
-                selection_model.unselect_all()
-            self.selected_checkboxes.clear()
-            self.selected_rom_ids.clear()
-            self.selected_game_keys.clear()
-            self.selected_game = None
-            self.selected_collection = None
-            # Update UI immediately to reflect cleared selections
-            self.update_selection_label()
-            self.update_action_buttons()
-
-            original_games = self.parent.available_games.copy()
-            self.library_model.update_library(original_games, group_by='platform')
-
-            # Restore saved selection and refresh checkboxes after the view is loaded
-            def restore_and_refresh():
-                self.restore_saved_selection()
-                # Sync currently-realized checkboxes after the selection state is
-                # restored. Rows realized later are handled at bind time
-                # (bind_checkbox_cell already sets their state), so a single
-                # idle-time pass suffices — no staggered retry timers needed.
-                GLib.idle_add(self.force_checkbox_sync)
-                return False
-            GLib.idle_add(restore_and_refresh)
+        return False
 
     def load_collections_view(self):
         """Load and display custom collections only"""
@@ -4792,14 +5264,6 @@ class EnhancedLibrarySection:
         import time
         current_time = time.time()
 
-        # Initialize cache attributes if missing
-        if not hasattr(self, 'collections_games'):
-            self.collections_games = []
-        if not hasattr(self, 'collections_cache_time'):
-            self.collections_cache_time = 0
-        if not hasattr(self, 'collections_cache_duration'):
-            self.collections_cache_duration = 300
-
         cache_valid = (
             self.collections_games and  # Has cached data
             current_time - self.collections_cache_time < self.collections_cache_duration
@@ -4807,48 +5271,30 @@ class EnhancedLibrarySection:
 
         # If cache is valid, show it immediately without placeholder (no flicker)
         if cache_valid:
-            # Build sync status map for cached data
-            cached_sync_status = {}
-            collection_games_map = {}  # Group games by collection
-
-            # Group games by collection
+            # Build sync status map for cached data: one counting pass, no
+            # per-collection lists (update_library does its own grouping)
+            active = self.actively_syncing_collections
+            total_counts = defaultdict(int)
+            missing_counts = defaultdict(int)
             for game in self.collections_games:
                 collection_name = game.get('collection', 'Unknown')
-                if collection_name not in collection_games_map:
-                    collection_games_map[collection_name] = []
-                collection_games_map[collection_name].append(game)
-
-            # Calculate sync status for each collection
-            for collection_name, games in collection_games_map.items():
-                is_syncing = collection_name in self.actively_syncing_collections
-                if is_syncing:
-                    # Check if all games are downloaded
-                    downloaded_count = sum(1 for game in games if game.get('is_downloaded', False))
-                    total_count = len(games)
-                    all_downloaded = downloaded_count == total_count
-                    cached_sync_status[collection_name] = 'synced' if all_downloaded else 'syncing'
-                else:
-                    cached_sync_status[collection_name] = 'disabled'
+                total_counts[collection_name] += 1
+                if collection_name in active and not game.get('is_downloaded', False):
+                    missing_counts[collection_name] += 1
+
+            cached_sync_status = {
+                name: ('disabled' if name not in active
+                       else 'syncing' if missing_counts[name] else 'synced')
+                for name in total_counts
+            }
 
             self.library_model.update_library(self.collections_games, group_by='collection', sync_status_map=cached_sync_status)
             return
 
-        # Show loading placeholder for cases where we need to load data
+        # Show the loading spinner over an empty tree while the data loads
         self.parent.log_message("Loading collections...")
-        placeholder_games = [{
-            'name': 'Loading...',
-            'rom_id': 'placeholder_loading',
-            'collection': 'Loading collections...',
-            'is_downloaded': False,
-            'platform': '',
-            'file_name': ''
-        }]
-        self.library_model.update_library(placeholder_games, group_by='collection', loading=True)
-
-        # CRITICAL: Force GTK to process pending events and render the placeholder
-        context = GLib.MainContext.default()
-        while context.pending():
-            context.iteration(False)
+        self.library_model.root_store.remove_all()
+        self._set_collections_loading(True)
 
         # Capture the current generation to check if this load is still valid when it completes
         expected_generation = self.view_mode_generation
@@ -4859,71 +5305,62 @@ class EnhancedLibrarySection:
                 all_collections = self.parent.romm_client.get_collections()
 
                 # Filter to only custom collections
-                custom_collections = []
-                for collection in all_collections:
-                    is_custom = (
-                        not collection.get('is_auto_generated', False) and
-                        collection.get('type') != 'auto' and
-                        'auto' not in collection.get('name', '').lower()
-                    )
-                    if is_custom:
-                        custom_collections.append(collection)
+                custom_collections = [c for c in all_collections if is_custom_collection(c)]
 
                 if not custom_collections:
                     GLib.idle_add(lambda: self.parent.log_message("No custom collections found"))
                     GLib.idle_add(lambda: self.library_model.update_library([], group_by='collection'))
+                    GLib.idle_add(self._set_collections_loading, False)
                     return
 
-                # Update placeholders with actual collection names (still loading games)
-                def show_collection_placeholders():
-                    # Create placeholder for each collection with real name
-                    placeholder_games = []
-                    for collection in custom_collections:
-                        placeholder_game = {
-                            'name': 'Loading...',
-                            'rom_id': f'placeholder_{collection.get("id")}',
-                            'collection': collection.get('name', 'Unknown Collection'),
-                            'is_downloaded': False,
-                            'platform': '',
-                            'file_name': ''
-                        }
-                        placeholder_games.append(placeholder_game)
-
-                    # Update tree with named placeholders (shows "Loading..." in status/size)
-                    self.library_model.update_library(placeholder_games, group_by='collection', loading=True)
-                    return False
-
-                GLib.idle_add(show_collection_placeholders)
-
                 # Create lookup map of existing games by ROM ID for download status
+                # plus the local paths already known to be downloaded, so sync
+                # status checks only stat ROMs the library hasn't seen (one pass)
                 existing_games_map = {}
+                downloaded_paths = set()
                 for game in self.parent.available_games:
                     rom_id = game.get('rom_id')
                     if rom_id:
                         existing_games_map[rom_id] = game
+                    if game.get('is_downloaded') and game.get('local_path'):
+                        downloaded_paths.add(str(game['local_path']))
+                download_dir = Path(self.parent.rom_dir_row.get_text())
+                platform_dirs = {}  # platform slug -> download_dir / slug
+                # rom_id -> process_single_rom result, before per-collection fields
+                processed_by_rom_id = {}
                 
                 all_collection_games = []
                 collection_sync_status = {}  # Map collection name to sync status
 
-                for collection in custom_collections:
-                    collection_id = collection.get('id')
-                    collection_name = collection.get('name', 'Unknown Collection')
+                # Network-bound: fetch every collection's ROM list in parallel,
+                # then do the CPU-side processing serially on this thread
+                with ThreadPoolExecutor(max_workers=8) as executor:
+                    fetched_roms = list(executor.map(
+                        lambda c: self.parent.romm_client.get_collection_roms(c.get('id')),
+                        custom_collections))
 
-                    collection_roms = self.parent.romm_client.get_collection_roms(collection_id)
+                if self.view_mode_generation != expected_generation:
+                    return  # View switched while fetching; update_collections_data would discard it
+
+                for collection, collection_roms in zip(custom_collections, fetched_roms):
+                    collection_name = collection.get('name', 'Unknown Collection')
 
                     # Determine sync status for this collection
                     is_syncing = collection_name in self.actively_syncing_collections
                     if is_syncing:
                         # Check if fully synced
                         downloaded_count = 0
-                        download_dir = Path(self.parent.rom_dir_row.get_text())
 
                         for rom in collection_roms:
                             platform_slug = rom.get('platform_slug', 'Unknown')
                             file_name = rom.get('fs_name') or f"{rom.get('name', 'unknown')}.rom"
-                            platform_dir = download_dir / platform_slug
+                            platform_dir = platform_dirs.get(platform_slug)
+                            if platform_dir is None:
+                                platform_dir = platform_dirs[platform_slug] = download_dir / platform_slug
                             local_path = platform_dir / file_name
-                            if self.parent.is_path_validly_downloaded(local_path):
+                            if str(local_path) in downloaded_paths:
+                                downloaded_count += 1
+                            elif rom.get('id') not in existing_games_map and self.parent.is_path_validly_downloaded(local_path):
                                 downloaded_count += 1
 
                         if downloaded_count == len(collection_roms) and len(collection_roms) > 0:
@@ -4951,8 +5388,16 @@ class EnhancedLibrarySection:
                         if not rom.get('fs_extension', '') and rom.get('files', []):
                             continue
 
-                        # First process the ROM normally
-                        processed_game = self.parent.process_single_rom(rom, Path(self.parent.rom_dir_row.get_text()))
+                        # First process the ROM normally (once per load: ROMs shared
+                        # by several collections reuse the first result)
+                        rom_id = rom.get('id')
+                        cached_game = processed_by_rom_id.get(rom_id) if rom_id else None
+                        if cached_game is not None:
+                            processed_game = cached_game.copy()
+                        else:
+                            processed_game = self.parent.process_single_rom(rom, download_dir)
+                            if rom_id:
+                                processed_by_rom_id[rom_id] = processed_game.copy()
 
                         # Inject parent-ROM reference so the 404 fallback can find
                         # the folder ROM without scanning siblings at download time.
@@ -4962,7 +5407,6 @@ class EnhancedLibrarySection:
                             processed_game['_fs_extension'] = rom.get('fs_extension', '')
 
                         # Then merge with existing game data to preserve download status
-                        rom_id = rom.get('id')
                         if rom_id and rom_id in existing_games_map:
                             existing_game = existing_games_map[rom_id]
                             # Preserve critical download info from existing game
@@ -4974,10 +5418,8 @@ class EnhancedLibrarySection:
                         processed_game['collection'] = collection_name
                         all_collection_games.append(processed_game)
                 
-                # Store collections games separately AND update the instance variable
-                all_collection_games_copy = []
-                for game in all_collection_games:
-                    all_collection_games_copy.append(game.copy())
+                # Every dict above was built by this load (process_single_rom or a
+                # copy of its memoized result), so it is published as-is
 
                 def update_collections_data():
                     # Check if this load is still valid (view mode hasn't changed)
@@ -4991,7 +5433,8 @@ class EnhancedLibrarySection:
                         return False
 
                     import time
-                    self.collections_games = all_collection_games_copy
+                    self._set_collections_loading(False)
+                    self.collections_games = all_collection_games
                     self.collections_cache_time = time.time()  # Update cache timestamp
                     self.library_model.update_library(self.collections_games, group_by='collection', sync_status_map=collection_sync_status)
                     self.parent.log_message(f"Loaded {len(custom_collections)} custom collections with {len(all_collection_games)} games")
@@ -5003,6 +5446,7 @@ class EnhancedLibrarySection:
                 def log_error():
                     # Only log error if still in the same view generation
                     if self.view_mode_generation == expected_generation:
+                        self._set_collections_loading(False)
                         self.parent.log_message(f"Failed to load collections: {e}")
                     return False
                 GLib.idle_add(log_error)
@@ -5020,234 +5464,209 @@ class EnhancedLibrarySection:
         label = box.get_last_child()
         icon = expander.get_child()
         
+        # Indentation comes from the TreeExpander itself
         expander.set_list_row(tree_item)
-        depth = tree_item.get_depth()
-        box.set_margin_start(depth * 0)
-        
-        if isinstance(item, PlatformItem):
-            icon.set_from_icon_name("folder-symbolic")
-
-            if hasattr(self, 'current_view_mode') and self.current_view_mode == 'collection':
-                # Dynamic label update for collections - just show the name, status dots will show the state
-                def update_collection_label(*args):
-                    collection_name = item.platform_name
-                    label.set_text(collection_name)
-
-                # Connect to name property changes to trigger label updates
-                item.connect('notify::name', update_collection_label)
-                update_collection_label()  # Initial update
+        # Handlers/bindings made below, undone in unbind_cell so rows
+        # recycled while scrolling don't pile up handlers on their old items
+        undo = box._cell_unbind = []
+
+        bind = self._bind_name_dispatch.get(type(item))
+        if bind:
+            bind(item, icon, label, undo)
+
+    def _bind_name_platform(self, item, icon, label, undo):
+        icon.set_from_icon_name("folder-symbolic")
+
+        # The name property is platform_name for both platforms and collections
+        # (status dots show collection state), so a plain binding covers both views
+        undo.append(item.bind_property('name', label, 'label', GObject.BindingFlags.SYNC_CREATE).unbind)
+
+    def _bind_name_disc(self, item, icon, label, undo):
+        # For disc items, show media-optical icon
+        icon.set_from_icon_name("media-optical-symbolic")
+        undo.append(item.bind_property('name', label, 'label', GObject.BindingFlags.SYNC_CREATE).unbind)
+
+    def _bind_name_game(self, item, icon, label, undo):
+        # For games, set up dynamic icon updates
+        def update_icon_and_name(*args):
+            # Update icon based on download status or multi-disc
+            if item.game_data.get('is_multi_disc', False):
+                # Multi-disc game - show optical disc icon
+                icon.set_from_icon_name("media-optical-symbolic")
+            elif item.game_data.get('is_downloaded', False):
+                icon.set_from_icon_name("object-select-symbolic")
             else:
-                # For platforms view, use simple binding
-                item.bind_property('name', label, 'label', GObject.BindingFlags.SYNC_CREATE)
-        elif isinstance(item, DiscItem):
-            # For disc items, show media-optical icon
-            icon.set_from_icon_name("media-optical-symbolic")
+                icon.set_from_icon_name("folder-download-symbolic")
 
-            def update_disc_label(*args):
-                label.set_text(item.name)
-
-            item.connect('notify::name', update_disc_label)
-            update_disc_label()
-        else:
-            # For games (GameItem), set up dynamic icon updates
-            def update_icon_and_name(*args):
-                # Update icon based on download status or multi-disc
-                if item.game_data.get('is_multi_disc', False):
-                    # Multi-disc game - show optical disc icon
-                    icon.set_from_icon_name("media-optical-symbolic")
-                elif item.game_data.get('is_downloaded', False):
-                    icon.set_from_icon_name("object-select-symbolic")
-                else:
-                    icon.set_from_icon_name("folder-download-symbolic")
+            # Update label
+            label.set_text(item.name)
 
-                # Update label
-                label.set_text(item.name)
+        # Connect to property changes that might affect the icon
+        undo.append(partial(item.disconnect, item.connect('notify::name', update_icon_and_name)))
+        undo.append(partial(item.disconnect, item.connect('notify::is-downloaded', update_icon_and_name)))
 
-            # Connect to property changes that might affect the icon
-            item.connect('notify::name', update_icon_and_name)
-            item.connect('notify::is-downloaded', update_icon_and_name)
+        # Initial update
+        update_icon_and_name()
 
-            # Initial update
-            update_icon_and_name()
+    def unbind_cell(self, factory, list_item):
+        """Shared 'unbind' handler: drop the handlers/bindings the bind_*_cell made for this row"""
+        child = list_item.get_child()
+        for undo in getattr(child, '_cell_unbind', ()):
+            undo()
+        child._cell_unbind = []
 
     def bind_status_cell(self, factory, list_item):
         """Show percentage/icons using Cairo drawing"""
         tree_item = list_item.get_item()
         item = tree_item.get_item()
         box = list_item.get_child()
+        undo = box._cell_unbind = []  # undone in unbind_cell
 
         # Get the drawing area and label from the box
         drawing_area = box.get_first_child()
         label = drawing_area.get_next_sibling()
 
-        if isinstance(item, PlatformItem):
-            # For platforms, show text status
+        bind = self._bind_status_dispatch.get(type(item))
+        if bind:
+            bind(item, drawing_area, label, undo)
+
+    def _bind_status_platform(self, item, drawing_area, label, undo):
+        # For platforms, show text status
+        drawing_area.set_visible(False)
+        label.set_visible(True)
+        undo.append(item.bind_property('status-text', label, 'label', GObject.BindingFlags.SYNC_CREATE).unbind)
+
+    def _bind_status_disc(self, item, drawing_area, label, undo):
+        # For discs, show download status with progress support
+        label.set_visible(False)
+        drawing_area.set_visible(True)
+
+        # disc_key never changes for a disc, so build it once per item
+        disc_key = disc_key_for(item)
+        dp_get = self.disc_progress.get
+
+        def update_disc_status(*args):
+            # Check for disc download progress
+            progress_info = None
+            # First check disc_progress (for multi-disc game downloads)
+            if disc_key:
+                progress_info = dp_get(disc_key)
+
+            # Also check game_progress for regional variants using their own ROM ID
+            if not progress_info:
+                disc_rom_id = item.disc_data.get('rom_id')
+                if disc_rom_id:
+                    progress_info = self.parent.download_progress.get(disc_rom_id)
+
+            if progress_info and progress_info.get('downloading'):
+                # Show percentage using Cairo (orange)
+                progress = progress_info.get('progress', 0.0)
+                self.parent.draw_download_status_icon(drawing_area, 'downloading', progress)
+            elif progress_info and progress_info.get('completed'):
+                # Show green checkmark icon
+                self.parent.draw_download_status_icon(drawing_area, 'completed')
+            elif item.is_downloaded:
+                # Downloaded disc
+                self.parent.draw_download_status_icon(drawing_area, 'downloaded')
+            else:
+                # Not downloaded
+                self.parent.draw_download_status_icon(drawing_area, 'not_downloaded')
+
+        # Connect to property changes
+        undo.append(partial(item.disconnect, item.connect('notify::is-downloaded', update_disc_status)))
+        update_disc_status()
+
+    def _bind_status_game(self, item, drawing_area, label, undo):
+        sibling_files = item.game_data.get('_sibling_files', [])
+        has_regional_variants = bool(sibling_files)
+
+        if has_regional_variants:
             drawing_area.set_visible(False)
             label.set_visible(True)
-            item.bind_property('status-text', label, 'label', GObject.BindingFlags.SYNC_CREATE)
-        elif isinstance(item, DiscItem):
-            # For discs, show download status with progress support
-            label.set_visible(False)
-            drawing_area.set_visible(True)
+            undo.append(item.bind_property('status-text', label, 'label', GObject.BindingFlags.SYNC_CREATE).unbind)
+            return
 
-            def update_disc_status(*args):
-                # Check for disc download progress
-                rom_id = item.parent_game.get('rom_id') if item.parent_game else None
-                disc_name = item.disc_data.get('name')
-                disc_key = f"{rom_id}:{disc_name}" if rom_id and disc_name else None
-
-                progress_info = None
-                # First check disc_progress (for multi-disc game downloads)
-                if disc_key and hasattr(self, 'disc_progress'):
-                    progress_info = self.disc_progress.get(disc_key)
-
-                # Also check game_progress for regional variants using their own ROM ID
-                if not progress_info:
-                    disc_rom_id = item.disc_data.get('rom_id')
-                    if disc_rom_id:
-                        progress_info = self.parent.download_progress.get(disc_rom_id)
-
-                if progress_info and progress_info.get('downloading'):
-                    # Show percentage using Cairo (orange)
-                    progress = progress_info.get('progress', 0.0)
-                    self.parent.draw_download_status_icon(drawing_area, 'downloading', progress)
-                elif progress_info and progress_info.get('completed'):
-                    # Show green checkmark icon
-                    self.parent.draw_download_status_icon(drawing_area, 'completed')
-                elif item.is_downloaded:
-                    # Downloaded disc
-                    self.parent.draw_download_status_icon(drawing_area, 'downloaded')
-                else:
-                    # Not downloaded
-                    self.parent.draw_download_status_icon(drawing_area, 'not_downloaded')
+        def update_status(*args):
+            rom_id = item.game_data.get('rom_id')
+            progress_info = self.parent.download_progress.get(rom_id)
 
-            # Connect to property changes
-            item.connect('notify::is-downloaded', update_disc_status)
-            update_disc_status()
-        elif isinstance(item, GameItem):
-            sibling_files = item.game_data.get('_sibling_files', [])
-            has_regional_variants = bool(sibling_files)
+            label.set_visible(False)
+            drawing_area.set_visible(True)
 
-            if has_regional_variants:
-                drawing_area.set_visible(False)
-                label.set_visible(True)
-                item.bind_property('status-text', label, 'label', GObject.BindingFlags.SYNC_CREATE)
+            if progress_info and progress_info.get('downloading'):
+                progress = progress_info.get('progress', 0.0)
+                self.parent.draw_download_status_icon(drawing_area, 'downloading', progress)
+            elif progress_info and progress_info.get('completed'):
+                self.parent.draw_download_status_icon(drawing_area, 'completed')
+            elif progress_info and progress_info.get('failed'):
+                self.parent.draw_download_status_icon(drawing_area, 'failed')
             else:
-                def update_status(*args):
-                    rom_id = item.game_data.get('rom_id')
-                    progress_info = self.parent.download_progress.get(rom_id) if rom_id else None
-
-                    label.set_visible(False)
-                    drawing_area.set_visible(True)
-
-                    if progress_info and progress_info.get('downloading'):
-                        progress = progress_info.get('progress', 0.0)
-                        self.parent.draw_download_status_icon(drawing_area, 'downloading', progress)
-                    elif progress_info and progress_info.get('completed'):
-                        self.parent.draw_download_status_icon(drawing_area, 'completed')
-                    elif progress_info and progress_info.get('failed'):
-                        self.parent.draw_download_status_icon(drawing_area, 'failed')
-                    else:
-                        status_type = 'downloaded' if item.is_downloaded else 'not_downloaded'
-                        self.parent.draw_download_status_icon(drawing_area, status_type)
+                status_type = 'downloaded' if item.is_downloaded else 'not_downloaded'
+                self.parent.draw_download_status_icon(drawing_area, status_type)
 
-                item.connect('notify::name', update_status)
-                update_status()
+        undo.append(partial(item.disconnect, item.connect('notify::name', update_status)))
+        update_status()
 
     def bind_size_cell(self, factory, list_item):
         """Show download info with compact format"""
         tree_item = list_item.get_item()
         item = tree_item.get_item()
         label = list_item.get_child()
-        
-        if isinstance(item, PlatformItem):
-            item.bind_property('size-text', label, 'label', GObject.BindingFlags.SYNC_CREATE)
-        elif isinstance(item, DiscItem):
-            # For discs, show size with progress support
-            def update_disc_size(*args):
-                rom_id = item.parent_game.get('rom_id') if item.parent_game else None
-                disc_name = item.disc_data.get('name')
-                disc_key = f"{rom_id}:{disc_name}" if rom_id and disc_name else None
-
-                progress_info = None
-                # First check disc_progress (for multi-disc game downloads)
-                if disc_key and hasattr(self, 'disc_progress'):
-                    progress_info = self.disc_progress.get(disc_key)
-
-                # Also check game_progress for regional variants using their own ROM ID
-                if not progress_info:
-                    disc_rom_id = item.disc_data.get('rom_id')
-                    if disc_rom_id:
-                        progress_info = self.parent.download_progress.get(disc_rom_id)
-
-                if progress_info and progress_info.get('downloading'):
-                    downloaded = progress_info.get('downloaded', 0)
-                    total = progress_info.get('total', 0)
-                    speed = progress_info.get('speed', 0)
-
-                    def format_size_compact(bytes_val):
-                        if bytes_val >= 1000**3:
-                            return f"{bytes_val / (1000**3):.1f}G"
-                        elif bytes_val >= 1000**2:
-                            return f"{bytes_val / (1000**2):.0f}M"
-                        else:
-                            return f"{bytes_val / 1000:.0f}K"
-
-                    if total > 0:
-                        size_text = f"{format_size_compact(downloaded)}/{format_size_compact(total)}"
-                    else:
-                        size_text = format_size_compact(downloaded)
-
-                    if speed > 0:
-                        speed_str = format_size_compact(speed)
-                        final_text = f"{size_text} @{speed_str}/s"
-                    else:
-                        final_text = f"{size_text} ..."
+        undo = label._cell_unbind = []  # undone in unbind_cell
+        label._last_text = None  # see set_label_text
+
+        bind = self._bind_size_dispatch.get(type(item))
+        if bind:
+            bind(item, label, undo)
+
+    def _bind_size_platform(self, item, label, undo):
+        undo.append(item.bind_property('size-text', label, 'label', GObject.BindingFlags.SYNC_CREATE).unbind)
+
+    def _bind_size_disc(self, item, label, undo):
+        # For discs, show size with progress support
+        # disc_key never changes for a disc, so build it once per item
+        disc_key = disc_key_for(item)
+        dp_get = self.disc_progress.get
+
+        def update_disc_size(*args):
+            progress_info = None
+            # First check disc_progress (for multi-disc game downloads)
+            if disc_key:
+                progress_info = dp_get(disc_key)
+
+            # Also check game_progress for regional variants using their own ROM ID
+            if not progress_info:
+                disc_rom_id = item.disc_data.get('rom_id')
+                if disc_rom_id:
+                    progress_info = self.parent.download_progress.get(disc_rom_id)
+
+            if progress_info and progress_info.get('downloading'):
+                set_label_text(label, format_progress_compact(
+                    progress_info.get('downloaded', 0),
+                    progress_info.get('total', 0),
+                    progress_info.get('speed', 0)))
+            else:
+                set_label_text(label, item.size_text)
 
-                    label.set_text(final_text)
-                else:
-                    size_text = item.size_text
-                    label.set_text(size_text)
+        undo.append(partial(item.disconnect, item.connect('notify::size-text', update_disc_size)))
+        undo.append(partial(item.disconnect, item.connect('notify::is-downloaded', update_disc_size)))
+        update_disc_size()  # Initial update
 
-            item.connect('notify::size-text', update_disc_size)
-            item.connect('notify::is-downloaded', update_disc_size)
-            update_disc_size()  # Initial update
-        elif isinstance(item, GameItem):
-            def update_size(*args):
-                rom_id = item.game_data.get('rom_id')
-                progress_info = self.parent.download_progress.get(rom_id) if rom_id else None
-                
-                if progress_info and progress_info.get('downloading'):
-                    downloaded = progress_info.get('downloaded', 0)
-                    total = progress_info.get('total', 0)
-                    speed = progress_info.get('speed', 0)
-                    
-                    def format_size_compact(bytes_val):
-                        if bytes_val >= 1000**3:
-                            return f"{bytes_val / (1000**3):.1f}G"
-                        elif bytes_val >= 1000**2:
-                            return f"{bytes_val / (1000**2):.0f}M"
-                        else:
-                            return f"{bytes_val / 1000:.0f}K"
-                    
-                    if total > 0:
-                        size_text = f"{format_size_compact(downloaded)}/{format_size_compact(total)}"
-                    else:
-                        size_text = format_size_compact(downloaded)
-                    
-                    if speed > 0:
-                        speed_str = format_size_compact(speed)
-                        final_text = f"{size_text} @{speed_str}/s"
-                    else:
-                        final_text = f"{size_text} ..."
-                        
-                    label.set_text(final_text)
-                else:
-                    size_text = item.size_text
-                    label.set_text(size_text)
+    def _bind_size_game(self, item, label, undo):
+        def update_size(*args):
+            rom_id = item.game_data.get('rom_id')
+            progress_info = self.parent.download_progress.get(rom_id)
             
-            item.connect('notify::name', update_size)
-            update_size()  # Initial update
+            if progress_info and progress_info.get('downloading'):
+                set_label_text(label, format_progress_compact(
+                    progress_info.get('downloaded', 0),
+                    progress_info.get('total', 0),
+                    progress_info.get('speed', 0)))
+            else:
+                set_label_text(label, item.size_text)
+        
+        undo.append(partial(item.disconnect, item.connect('notify::name', update_size)))
+        update_size()  # Initial update
 
     def setup_status_cell(self, factory, list_item):
         """Cairo-drawn status icons for download status"""
@@ -5285,13 +5704,14 @@ class EnhancedLibrarySection:
         box.set_halign(Gtk.Align.CENTER)
         box.set_valign(Gtk.Align.CENTER)
 
-        # Create a drawing area for the colored dot
-        drawing_area = Gtk.DrawingArea()
-        drawing_area.set_size_request(10, 10)
-        drawing_area.set_halign(Gtk.Align.CENTER)
-        drawing_area.set_valign(Gtk.Align.CENTER)
+        # The colored dot is a CSS-styled box (.sync-dot), colored by a status class
+        dot = Gtk.Box()
+        dot.add_css_class('sync-dot')
+        dot.set_halign(Gtk.Align.CENTER)
+        dot.set_valign(Gtk.Align.CENTER)
+        dot._status_class = None
 
-        box.append(drawing_area)
+        box.append(dot)
         list_item.set_child(box)
 
     def bind_sync_status_cell(self, factory, list_item):
@@ -5299,38 +5719,22 @@ class EnhancedLibrarySection:
         tree_item = list_item.get_item()
         item = tree_item.get_item()
         box = list_item.get_child()
-        drawing_area = box.get_first_child()
-
-        if isinstance(item, PlatformItem):
-            def update_status(*args):
-                status = item.sync_status_text
-
-                def draw_func(area, cr, width, height):
-                    # Determine color based on status
-                    if status == 'synced':
-                        cr.set_source_rgb(0.29, 0.86, 0.50)  # Green (#4ade80)
-                    elif status == 'syncing':
-                        cr.set_source_rgb(0.98, 0.57, 0.24)  # Orange (#fb923c)
-                    elif status == 'disabled':
-                        cr.set_source_rgb(0.42, 0.45, 0.50)  # Grey (#6b7280)
-                    elif status == 'loading':
-                        cr.set_source_rgb(0.6, 0.6, 0.6)  # Light grey
-                    else:
-                        return  # Don't draw anything for empty status
+        undo = box._cell_unbind = []  # undone in unbind_cell
+        dot = box.get_first_child()
 
-                    # Draw a filled circle
-                    radius = min(width, height) / 2.0
-                    cr.arc(width / 2.0, height / 2.0, radius - 1, 0, 2 * 3.14159)
-                    cr.fill()
+        bind = self._bind_sync_status_dispatch.get(type(item))
+        if bind:
+            bind(item, dot, undo)
+        else:
+            # Games and discs don't have sync status - no dot
+            set_sync_dot_status(dot, None)
 
-                drawing_area.set_draw_func(draw_func)
-                drawing_area.queue_draw()
+    def _bind_sync_status_platform(self, item, dot, undo):
+        def update_dot(*args):
+            set_sync_dot_status(dot, item.sync_status_text)
 
-            item.connect('notify::sync-status-text', update_status)
-            update_status()  # Initial draw
-        elif isinstance(item, GameItem):
-            # Games don't have sync status - don't draw anything
-            drawing_area.set_draw_func(lambda *args: None)
+        undo.append(partial(item.disconnect, item.connect('notify::sync-status-text', update_dot)))
+        update_dot()
 
     def create_action_bar(self):
         action_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=6)
@@ -5343,6 +5747,11 @@ class EnhancedLibrarySection:
         # Download/Launch button - now handles multiple selections
         self.action_button = Gtk.Button(label="Download")
         self.action_button.add_css_class('warning')  # Start with warning style for Download
+        # Current label/style class, so update_action_buttons only touches the widget on changes
+        self._action_button_label = "Download"
+        self._action_button_style = 'warning'
+        # (action, delete, open in RomM) sensitivity, see _set_button_sensitivity
+        self._button_sensitivity = (False, False, False)
         self.action_button.set_sensitive(False)
         self.action_button.set_size_request(125, -1)  # Fixed width for text
         self.action_button.set_hexpand(False)
@@ -5360,21 +5769,7 @@ class EnhancedLibrarySection:
 
         # --- Create button with RomM Logo ---
         self.open_in_romm_button = Gtk.Button()
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-
-        # Try multiple icon locations for AppImage compatibility
-        icon_locations = [
-            os.path.join(script_dir, 'romm_icon.png'),  # AppImage location
-            os.path.join(script_dir, '..', 'assets', 'icons', 'romm_icon.png'),  # Regular install
-            'romm_icon.png'  # Fallback
-        ]
-
-        romm_icon_path = None
-        for location in icon_locations:
-            if os.path.exists(location):
-                romm_icon_path = location
-                break
-
+        romm_icon_path = find_romm_icon_path()
         if romm_icon_path:
             image = Gtk.Image.new_from_file(romm_icon_path)
             image.set_pixel_size(16)
@@ -5466,40 +5861,63 @@ class EnhancedLibrarySection:
         single = len(getattr(self, 'selected_game_keys', set())) <= 1
         self.history_button.set_sensitive(bool(connected and rom_id and downloaded and single))
 
+    def _set_action_button_style(self, style):
+        """Switch the action button's style class, touching the CSS node only on a change"""
+        if self._action_button_style == style:
+            return
+        if self._action_button_style:
+            self.action_button.remove_css_class(self._action_button_style)
+        if style:
+            self.action_button.add_css_class(style)
+        self._action_button_style = style
+
+    def _set_button_sensitivity(self, action, delete, open_in_romm):
+        """Apply the action/delete/open-in-RomM sensitivities, crossing into GTK only on a change"""
+        state = (bool(action), bool(delete), bool(open_in_romm))
+        if state == self._button_sensitivity:
+            return
+        old, self._button_sensitivity = self._button_sensitivity, state
+        for button, was, now in zip((self.action_button, self.delete_button, self.open_in_romm_button), old, state):
+            if was != now:
+                button.set_sensitive(now)
+
+    def _set_action_button_label(self, label):
+        """Set the action button's label, skipping the relayout when it is unchanged"""
+        if self._action_button_label != label:
+            self.action_button.set_label(label)
+            self._action_button_label = label
+
     def update_action_buttons(self):
         """Update action buttons based on selected game(s) or platform"""
         # Allow button updates during bulk downloads to show Cancel state
         # but still block during other dialogs
-        is_bulk_download = self.parent._bulk_download_in_progress if hasattr(self, 'parent') else False
+        parent = self.parent
+        download_progress = parent.download_progress
+        is_bulk_download = parent._bulk_download_in_progress
         if getattr(self, '_selection_blocked', False) and not is_bulk_download:
             return
 
         self._update_history_button()
+        is_connected = parent.romm_client and parent.romm_client.authenticated
 
         # Priority 0: Check for selected discs first
         selected_discs = self.get_selected_discs()
         if selected_discs:
             # Check if any disc is not downloaded
             not_downloaded_discs = [d for d in selected_discs if not d['disc'].get('is_downloaded', False)]
-            is_connected = self.parent.romm_client and self.parent.romm_client.authenticated
-
-            # Clear all button style classes first
-            self.action_button.remove_css_class('warning')
-            self.action_button.remove_css_class('suggested-action')
-            self.action_button.remove_css_class('destructive-action')
 
             if not_downloaded_discs and is_connected:
-                self.action_button.set_label(f"Download ({len(not_downloaded_discs)})")
-                self.action_button.add_css_class('warning')
-                self.action_button.set_sensitive(True)
+                self._set_action_button_label(f"Download ({len(not_downloaded_discs)})")
+                self._set_action_button_style('warning')
+                action_sensitive = True
             else:
-                self.action_button.set_label("Download")
-                self.action_button.set_sensitive(False)
+                self._set_action_button_label("Download")
+                self._set_action_button_style(None)
+                action_sensitive = False
 
             # Enable delete if any disc is downloaded
             downloaded_discs = [d for d in selected_discs if d['disc'].get('is_downloaded', False)]
-            self.delete_button.set_sensitive(len(downloaded_discs) > 0)
-            self.open_in_romm_button.set_sensitive(False)
+            self._set_button_sensitivity(action_sensitive, len(downloaded_discs) > 0, False)
             return  # Exit early
 
         # ADD THIS BLOCK HERE:
@@ -5509,111 +5927,66 @@ class EnhancedLibrarySection:
             if self.selected_disc:
                 # Individual disc selected - show Launch button if downloaded
                 is_disc_downloaded = self.selected_disc.get('is_downloaded', False)
-                is_connected = self.parent.romm_client and self.parent.romm_client.authenticated
                 is_regional_variant = self.selected_disc.get('is_regional_variant', False)
 
-                # Clear all button style classes first
-                self.action_button.remove_css_class('warning')
-                self.action_button.remove_css_class('suggested-action')
-                self.action_button.remove_css_class('destructive-action')
-
                 if is_disc_downloaded:
-                    self.action_button.set_label("Launch")
-                    self.action_button.add_css_class('suggested-action')
-                    self.action_button.set_sensitive(True)
+                    self._set_action_button_label("Launch")
+                    self._set_action_button_style('suggested-action')
+                    action_sensitive = True
                 else:
                     # Regional variants CAN be downloaded individually, multi-disc games cannot
                     if is_regional_variant and is_connected:
-                        self.action_button.set_label("Download")
-                        self.action_button.add_css_class('warning')
-                        self.action_button.set_sensitive(True)
+                        self._set_action_button_label("Download")
+                        self._set_action_button_style('warning')
+                        action_sensitive = True
                     else:
                         # Multi-disc game - cannot download individual discs
-                        self.action_button.set_label("Download")
-                        self.action_button.set_sensitive(False)
+                        self._set_action_button_label("Download")
+                        self._set_action_button_style(None)
+                        action_sensitive = False
 
                 # Enable delete for downloaded regional variants, disable for multi-disc games
-                if is_regional_variant and is_disc_downloaded:
-                    self.delete_button.set_sensitive(True)
-                else:
-                    self.delete_button.set_sensitive(False)
-                self.open_in_romm_button.set_sensitive(False)
+                self._set_button_sensitivity(action_sensitive, is_regional_variant and is_disc_downloaded, False)
                 return  # Exit early
 
             # Game selected (not a disc)
             is_downloaded = self.selected_game.get('is_downloaded', False)
-            is_connected = self.parent.romm_client and self.parent.romm_client.authenticated
             rom_id = self.selected_game.get('rom_id')
 
             # Check if download is in progress FOR THIS SPECIFIC GAME
-            is_downloading = (rom_id and rom_id in self.parent.download_progress and
-                            self.parent.download_progress[rom_id].get('downloading', False))
-
-            # Check if this is part of a bulk download
-            is_bulk_download = self.parent._bulk_download_in_progress
-
-            # Clear all button style classes first
-            self.action_button.remove_css_class('warning')
-            self.action_button.remove_css_class('suggested-action')
-            self.action_button.remove_css_class('destructive-action')
+            progress_info = download_progress.get(rom_id)
+            is_downloading = bool(progress_info and progress_info.get('downloading', False))
 
             if is_downloading:
                 # Always show "Cancel" for single row selection
                 # (bulk downloads are handled in the multiple checkbox selection case)
-                self.action_button.set_label("Cancel")
-                self.action_button.add_css_class('destructive-action')
+                self._set_action_button_label("Cancel")
+                self._set_action_button_style('destructive-action')
             elif is_downloaded:
-                self.action_button.set_label("Launch")
-                self.action_button.add_css_class('suggested-action')
+                self._set_action_button_label("Launch")
+                self._set_action_button_style('suggested-action')
             else:
-                self.action_button.set_label("Download")
-                self.action_button.add_css_class('warning')
+                self._set_action_button_label("Download")
+                self._set_action_button_style('warning')
 
-            self.action_button.set_sensitive(True)
+            action_sensitive = True
             # Check if game is in autosync collection - disable delete if so
             is_in_autosync = self.is_game_in_autosync_collection(self.selected_game)
-            self.delete_button.set_sensitive(is_downloaded and not is_in_autosync)
-            self.open_in_romm_button.set_sensitive(is_connected and self.selected_game.get('rom_id'))
+            self._set_button_sensitivity(action_sensitive, is_downloaded and not is_in_autosync,
+                                         is_connected and self.selected_game.get('rom_id'))
             return  # Exit early, don't check other selections
-        
-        selected_games = self.get_selected_games()
-        
-        is_connected = self.parent.romm_client and self.parent.romm_client.authenticated
-        
-        # Priority 2: Check for checkbox selections first (to determine priority)
-        selected_games = []
 
-        # FIX: Use correct games source based on view mode
-        if hasattr(self, 'current_view_mode') and self.current_view_mode == 'collection':
-            games_to_check = getattr(self, 'collections_games', [])
-        else:
-            games_to_check = self.parent.available_games
+        # Priority 2: Check for checkbox selections first (to determine priority)
+        is_collection_view = self.current_view_mode == 'collection'
+        selected_games = self._collect_checked_games()
 
-        for game in games_to_check:  # CHANGED: was self.parent.available_games
-            # Handle collection mode differently
-            if hasattr(self, 'current_view_mode') and self.current_view_mode == 'collection':
-                rom_id = game.get('rom_id')
-                collection_name = game.get('collection', '')
-                if rom_id and collection_name:
-                    collection_key = f"collection:{rom_id}:{collection_name}"
-                    if collection_key in self.selected_game_keys:
-                        selected_games.append(game)
-            else:
-                # Standard platform mode logic
-                identifier_type, identifier_value = self.get_game_identifier(game)
-                if identifier_type == 'rom_id' and identifier_value in self.selected_rom_ids:
-                    selected_games.append(game)
-                elif identifier_type == 'game_key' and identifier_value in self.selected_game_keys:
-                    selected_games.append(game)
-        
         # Priority 2: Handle checkbox selections (takes precedence when present)
         if selected_games:
-            downloaded_games = [g for g in selected_games if g.get('is_downloaded', False)]
+            downloaded_games = downloaded_games_of(selected_games)
             # Exclude games that are currently downloading from not_downloaded list
-            # Snapshot items: a worker thread may add/remove keys concurrently,
-            # so iterate a copy and read the value from it (no re-indexing).
-            downloading_rom_ids = set(rid for rid, p in dict(self.parent.download_progress).items()
-                                     if p.get('downloading', False))
+            # Snapshot of the map's active set: no walk over download_progress,
+            # and shared with the multi-selection Cancel count below
+            downloading_rom_ids = download_progress.active_keys()
             not_downloaded_games = [g for g in selected_games
                                    if not g.get('is_downloaded', False)
                                    and g.get('rom_id') not in downloading_rom_ids]
@@ -5625,92 +5998,76 @@ class EnhancedLibrarySection:
                 rom_id = game.get('rom_id')
 
                 # ADD THIS CHECK for collections view:
-                if hasattr(self, 'current_view_mode') and self.current_view_mode == 'collection':
-                    # In collections, ensure we check the actual download status
-                    if rom_id:
-                        # Cross-reference with main games list for accurate download status
-                        for main_game in self.parent.available_games:
-                            if main_game.get('rom_id') == rom_id:
-                                is_downloaded = main_game.get('is_downloaded', False)
-                                break
+                if is_collection_view and rom_id:
+                    # In collections, cross-reference the main games list for accurate download status
+                    main_game = next((g for g in parent.available_games if g.get('rom_id') == rom_id), None)
+                    if main_game is not None:
+                        is_downloaded = main_game.get('is_downloaded', False)
 
                 # Check if download is in progress FOR THIS SPECIFIC GAME
-                is_downloading = (rom_id and rom_id in self.parent.download_progress and
-                                self.parent.download_progress[rom_id].get('downloading', False))
-
-                # Check if this is part of a bulk download
-                is_bulk_download = self.parent._bulk_download_in_progress
-
-                # Clear all button style classes first
-                self.action_button.remove_css_class('warning')
-                self.action_button.remove_css_class('suggested-action')
-                self.action_button.remove_css_class('destructive-action')
+                progress_info = download_progress.get(rom_id)
+                is_downloading = bool(progress_info and progress_info.get('downloading', False))
 
                 if is_downloading:
                     # Always show "Cancel" for single selection
                     # (bulk downloads are handled in the multiple selection case)
-                    self.action_button.set_label("Cancel")
-                    self.action_button.add_css_class('destructive-action')
+                    self._set_action_button_label("Cancel")
+                    self._set_action_button_style('destructive-action')
                 elif is_downloaded:
-                    self.action_button.set_label("Launch")
-                    self.action_button.add_css_class('suggested-action')
+                    self._set_action_button_label("Launch")
+                    self._set_action_button_style('suggested-action')
                 else:
-                    self.action_button.set_label("Download")
-                    self.action_button.add_css_class('warning')
+                    self._set_action_button_label("Download")
+                    self._set_action_button_style('warning')
 
-                self.action_button.set_sensitive(True)
+                action_sensitive = True
                 # Check if game is in autosync collection - disable delete if so
                 is_in_autosync = self.is_game_in_autosync_collection(game)
-                self.delete_button.set_sensitive(is_downloaded and not is_in_autosync)
-                self.open_in_romm_button.set_sensitive(is_connected and game.get('rom_id'))
+                self._set_button_sensitivity(action_sensitive, is_downloaded and not is_in_autosync,
+                                             is_connected and game.get('rom_id'))
             else:
                 # Multiple checkbox selections
-                # Check if this is part of a bulk download
-                is_bulk_download = self.parent._bulk_download_in_progress
-
                 # Check if any selected games are currently downloading
                 downloading_games = [g for g in selected_games
-                                   if g.get('rom_id') and g.get('rom_id') in self.parent.download_progress
-                                   and self.parent.download_progress[g.get('rom_id')].get('downloading', False)]
-
-                # Clear all button style classes first
-                self.action_button.remove_css_class('warning')
-                self.action_button.remove_css_class('suggested-action')
-                self.action_button.remove_css_class('destructive-action')
+                                   if g.get('rom_id') in downloading_rom_ids]
 
+                action_sensitive = self._button_sensitivity[0]  # unchanged if no case below applies
                 # Prioritize bulk download state - show Cancel All even if individual downloads haven't started yet
                 if is_bulk_download:
-                    self.action_button.set_label("Cancel All")
-                    self.action_button.add_css_class('destructive-action')
-                    self.action_button.set_sensitive(True)
+                    self._set_action_button_label("Cancel All")
+                    self._set_action_button_style('destructive-action')
+                    action_sensitive = True
                 elif downloading_games:
                     # Multiple individual downloads (not part of bulk)
-                    self.action_button.set_label(f"Cancel ({len(downloading_games)})")
-                    self.action_button.add_css_class('destructive-action')
-                    self.action_button.set_sensitive(True)
+                    self._set_action_button_label(f"Cancel ({len(downloading_games)})")
+                    self._set_action_button_style('destructive-action')
+                    action_sensitive = True
                 elif not_downloaded_games:
-                    self.action_button.set_label(f"Download ({len(not_downloaded_games)})")
-                    self.action_button.add_css_class('warning')
-                    self.action_button.set_sensitive(True)
+                    self._set_action_button_label(f"Download ({len(not_downloaded_games)})")
+                    self._set_action_button_style('warning')
+                    action_sensitive = True
                 elif downloaded_games:
-                    self.action_button.set_label("Launch")
-                    self.action_button.set_sensitive(False)
+                    self._set_action_button_label("Launch")
+                    self._set_action_button_style(None)
+                    action_sensitive = False
 
                 # Check if any selected games are in autosync collections
-                has_autosync_game = any(self.is_game_in_autosync_collection(g) for g in selected_games)
-                self.delete_button.set_sensitive(len(downloaded_games) > 0 and not has_autosync_game)
-                self.open_in_romm_button.set_sensitive(False)  # Disable for multi-selection
+                # (only matters when there is something to delete)
+                has_autosync_game = False
+                if downloaded_games:
+                    autosync_rom_ids = self._get_autosync_rom_ids()
+                    has_autosync_game = any(self.is_game_in_autosync_collection(g, autosync_rom_ids)
+                                            for g in selected_games)
+                # Open in RomM is disabled for multi-selection
+                self._set_button_sensitivity(action_sensitive, len(downloaded_games) > 0 and not has_autosync_game, False)
             return
 
         # Priority 3: Check for single platform row selection (only if no checkboxes and no game row selected)
         selection_model = self.column_view.get_model()
-        selected_positions = []
-        for i in range(selection_model.get_n_items()):
-            if selection_model.is_selected(i):
-                selected_positions.append(i)
-        
-        if len(selected_positions) == 1:
-            tree_item = selection_model.get_item(selected_positions[0])
+        selected_position = single_selected_position(selection_model)
+
+        if selected_position is not None:
+            tree_item = selection_model.get_item(selected_position)
             item = tree_item.get_item()
 
             if isinstance(item, PlatformItem):
@@ -5721,30 +6078,21 @@ class EnhancedLibrarySection:
                     # Collection selected - enable delete button
                     collection_name = item.platform_name
                     has_downloaded_games = any(g.get('is_downloaded', False) for g in item.games)
-                    self.action_button.set_sensitive(False)
-                    self.delete_button.set_sensitive(has_downloaded_games)
+                    self._set_button_sensitivity(False, has_downloaded_games, is_connected)
                     self.delete_button.set_tooltip_text(f"Delete downloaded games from '{collection_name}'")
-                    self.open_in_romm_button.set_sensitive(is_connected)
                     # Store the selected collection for delete handler
                     self.selected_collection = collection_name
                     return
                 else:
                     # Platform selected - disable delete
-                    self.action_button.set_sensitive(False)
-                    self.delete_button.set_sensitive(False)
-                    self.open_in_romm_button.set_sensitive(is_connected)
+                    self._set_button_sensitivity(False, False, is_connected)
                     self.selected_collection = None
                     return
 
         # No selections - disable all buttons
-        # Clear all button style classes first
-        self.action_button.remove_css_class('warning')
-        self.action_button.remove_css_class('suggested-action')
-        self.action_button.remove_css_class('destructive-action')
-        self.action_button.set_sensitive(False)
-        self.action_button.set_label("Download")
-        self.delete_button.set_sensitive(False)
-        self.open_in_romm_button.set_sensitive(False)
+        self._set_action_button_label("Download")
+        self._set_action_button_style(None)
+        self._set_button_sensitivity(False, False, False)
 
     def update_group_filter(self, games, group_by='platform'):
         """Update filter dropdown for platforms or collections"""
@@ -5780,15 +6128,12 @@ class EnhancedLibrarySection:
     
     def on_selection_changed(self, selection_model, position, n_items):
         """Handle selection changes for both single and multi-selection"""
-        # Find selected positions
-        selected_positions = []
-        for i in range(selection_model.get_n_items()):
-            if selection_model.is_selected(i):
-                selected_positions.append(i)
+        # Only a single selected row matters here, which the bitset size answers
+        selected_position = single_selected_position(selection_model)
 
-        if len(selected_positions) == 1:
+        if selected_position is not None:
             # Single item selected
-            tree_item = selection_model.get_item(selected_positions[0])
+            tree_item = selection_model.get_item(selected_position)
             item = tree_item.get_item()
 
             if isinstance(item, GameItem):
@@ -5844,31 +6189,9 @@ class EnhancedLibrarySection:
         # Count selected discs
         disc_count = len(self.get_selected_discs())
 
-        # Count selected games using the same logic as action buttons
-        selected_count = 0
-
-        # FIX: Use correct games source based on view mode
-        if hasattr(self, 'current_view_mode') and self.current_view_mode == 'collection':
-            games_to_check = getattr(self, 'collections_games', [])
-        else:
-            games_to_check = self.parent.available_games
-
-        for game in games_to_check:  # CHANGED: was self.parent.available_games
-            # Handle collection mode differently
-            if hasattr(self, 'current_view_mode') and self.current_view_mode == 'collection':
-                rom_id = game.get('rom_id')
-                collection_name = game.get('collection', '')
-                if rom_id and collection_name:
-                    collection_key = f"collection:{rom_id}:{collection_name}"
-                    if collection_key in self.selected_game_keys:
-                        selected_count += 1
-            else:
-                # Standard platform mode logic
-                identifier_type, identifier_value = self.get_game_identifier(game)
-                if identifier_type == 'rom_id' and identifier_value in self.selected_rom_ids:
-                    selected_count += 1
-                elif identifier_type == 'game_key' and identifier_value in self.selected_game_keys:
-                    selected_count += 1
+        # Count checked games with the same collector as the action buttons,
+        # so the label and the button counts always agree
+        selected_count = len(self._collect_checked_games())
 
         # Rest of the method unchanged...
         if disc_count > 0:
@@ -6075,28 +6398,7 @@ class EnhancedLibrarySection:
         if self.selected_game:
             selected_games = [self.selected_game]
         else:
-            # FIX: Use correct games source based on view mode
-            if hasattr(self, 'current_view_mode') and self.current_view_mode == 'collection':
-                games_to_check = getattr(self, 'collections_games', [])
-            else:
-                games_to_check = self.parent.available_games
-            
-            for game in games_to_check:  # CHANGED: was self.parent.available_games
-                # Handle collection mode differently
-                if hasattr(self, 'current_view_mode') and self.current_view_mode == 'collection':
-                    rom_id = game.get('rom_id')
-                    collection_name = game.get('collection', '')
-                    if rom_id and collection_name:
-                        collection_key = f"collection:{rom_id}:{collection_name}"
-                        if collection_key in self.selected_game_keys:
-                            selected_games.append(game)
-                else:
-                    # Standard platform mode logic
-                    identifier_type, identifier_value = self.get_game_identifier(game)
-                    if identifier_type == 'rom_id' and identifier_value in self.selected_rom_ids:
-                        selected_games.append(game)
-                    elif identifier_type == 'game_key' and identifier_value in self.selected_game_keys:
-                        selected_games.append(game)
+            selected_games = self._collect_checked_games()
             
             if not selected_games:
                 self.parent.log_message("No games selected")
@@ -6181,30 +6483,9 @@ class EnhancedLibrarySection:
         if self.selected_game:
             selected_games = [self.selected_game]
         else:
-            # FIX: Use correct games source based on view mode
-            if hasattr(self, 'current_view_mode') and self.current_view_mode == 'collection':
-                games_to_check = getattr(self, 'collections_games', [])
-            else:
-                games_to_check = self.parent.available_games
-
-            for game in games_to_check:  # CHANGED: was self.parent.available_games
-                # Handle collection mode differently
-                if hasattr(self, 'current_view_mode') and self.current_view_mode == 'collection':
-                    rom_id = game.get('rom_id')
-                    collection_name = game.get('collection', '')
-                    if rom_id and collection_name:
-                        collection_key = f"collection:{rom_id}:{collection_name}"
-                        if collection_key in self.selected_game_keys:
-                            selected_games.append(game)
-                else:
-                    # Standard platform mode logic
-                    identifier_type, identifier_value = self.get_game_identifier(game)
-                    if identifier_type == 'rom_id' and identifier_value in self.selected_rom_ids:
-                        selected_games.append(game)
-                    elif identifier_type == 'game_key' and identifier_value in self.selected_game_keys:
-                        selected_games.append(game)
+            selected_games = self._collect_checked_games()
 
-        downloaded_games = [g for g in selected_games if g.get('is_downloaded', False)]
+        downloaded_games = downloaded_games_of(selected_games)
 
         if not downloaded_games:
             return
@@ -6226,7 +6507,7 @@ class EnhancedLibrarySection:
         """Delete downloaded games from a collection with safety checks"""
         # Get all games in this collection
         collection_games = [g for g in self.collections_games if g.get('collection') == collection_name]
-        downloaded_games = [g for g in collection_games if g.get('is_downloaded', False)]
+        downloaded_games = downloaded_games_of(collection_games)
 
         if not downloaded_games:
             self.parent.log_message(f"No downloaded games in '{collection_name}' to delete")
@@ -6373,6 +6654,7 @@ class EnhancedLibrarySection:
     def update_single_game(self, updated_game_data, skip_platform_update=False):
         """Update a single game in the tree without rebuilding - preserves expansion state"""
         rom_id = updated_game_data.get('rom_id')
+        self._library_version += 1
 
         # Update master list
         for i, game in enumerate(self.parent.available_games):
@@ -6498,6 +6780,12 @@ class EnhancedLibrarySection:
         # since we need to know if it's a collection or a game
         list_item.set_child(box)
 
+    def unbind_checkbox_cell(self, factory, list_item):
+        """Drop the row's checkbox/switch, which holds its item and tree row plus their handlers"""
+        box = list_item.get_child()
+        while box.get_first_child():
+            box.remove(box.get_first_child())
+
     def bind_checkbox_cell(self, factory, list_item):
         tree_item = list_item.get_item()
         item = tree_item.get_item()
@@ -6818,9 +7106,8 @@ class EnhancedLibrarySection:
                 selection_model.unselect_all()
                 
                 # Double-check by manually clearing any remaining selections
-                for i in range(selection_model.get_n_items()):
-                    if selection_model.is_selected(i):
-                        selection_model.unselect_item(i)
+                for i in list(iter_selected_positions(selection_model)):
+                    selection_model.unselect_item(i)
             except Exception as e:
                 print(f"Error clearing row selection: {e}")
         
@@ -6856,8 +7143,8 @@ class EnhancedLibrarySection:
                         if collection.get('name') == collection_name:
                             collection_id = collection.get('id')
                             collection_roms = self.parent.romm_client.get_collection_roms(collection_id)
-                            cache_key = f'_collection_roms_{collection_name}'
-                            setattr(self, cache_key, {rom.get('id') for rom in collection_roms if rom.get('id')})
+                            self._collection_rom_ids[collection_name] = {
+                                rom_id for rom in collection_roms if (rom_id := rom.get('id'))}
                 except Exception as e:
                     print(f"Error initializing collection cache: {e}")
 
@@ -7043,7 +7330,7 @@ class EnhancedLibrarySection:
                     not widget.is_platform):  # It's a game checkbox
                     
                     game = widget.game_item.game_data
-                    game_key = f"{game.get('name', '')}|{game.get('platform', '')}"
+                    game_key = game_key_of(game)
                     
                     if game_key in platform_game_keys:
                         widget._updating = True
@@ -7271,7 +7558,8 @@ class SyncWindow(Gtk.ApplicationWindow):
         # Timestamps for efficient polling with updated_after parameter
         self._last_full_fetch_time = None  # ISO 8601 datetime of last full data fetch
 
-        self.download_progress = {}
+        self.download_progress = DownloadProgressMap()
+        self.downloads_idle_event = self.download_progress.idle_event  # Set when no downloads are tracked
         self._last_progress_update = {}  # rom_id -> timestamp
         self._progress_update_interval = 0.1  # Update UI every 100ms max
 
@@ -7423,74 +7711,19 @@ class SyncWindow(Gtk.ApplicationWindow):
                         'completed' (green checkmark), 'failed' (red X), 'downloading' (percentage)
             progress: Progress value (0.0 to 1.0) for downloading status
         """
-        def draw_func(area, cr, width, height):
-            center_x = width / 2.0
-            center_y = height / 2.0
-
-            if status_type in ['downloaded', 'completed']:
-                # Green checkmark
-                cr.set_source_rgb(0.29, 0.86, 0.50)  # Green #4ade80
-                cr.set_line_width(2.0)
-                cr.set_line_cap(1)  # Round caps
-                cr.set_line_join(1)  # Round joins
-
-                # Draw checkmark path
-                cr.move_to(center_x - 4, center_y)
-                cr.line_to(center_x - 1, center_y + 3)
-                cr.line_to(center_x + 4, center_y - 3)
-                cr.stroke()
-
-            elif status_type == 'not_downloaded':
-                # Blue down arrow
-                cr.set_source_rgb(0.37, 0.51, 0.98)  # Blue #5e82fa
-                cr.set_line_width(2.0)
-                cr.set_line_cap(1)  # Round caps
-                cr.set_line_join(1)  # Round joins
-
-                # Draw arrow shaft
-                cr.move_to(center_x, center_y - 4)
-                cr.line_to(center_x, center_y + 3)
-                cr.stroke()
-
-                # Draw arrow head
-                cr.move_to(center_x - 3, center_y)
-                cr.line_to(center_x, center_y + 3)
-                cr.line_to(center_x + 3, center_y)
-                cr.stroke()
-
-            elif status_type == 'failed':
-                # Red X
-                cr.set_source_rgb(0.97, 0.44, 0.44)  # Red #f87171
-                cr.set_line_width(2.0)
-                cr.set_line_cap(1)  # Round caps
-
-                # Draw X
-                cr.move_to(center_x - 4, center_y - 4)
-                cr.line_to(center_x + 4, center_y + 4)
-                cr.stroke()
-
-                cr.move_to(center_x + 4, center_y - 4)
-                cr.line_to(center_x - 4, center_y + 4)
-                cr.stroke()
-
-            elif status_type == 'downloading' and progress is not None:
-                # Orange percentage text
-                cr.set_source_rgb(0.98, 0.57, 0.24)  # Orange #fb923c
-
-                # Draw percentage text
-                percentage_text = f"{progress*100:.0f}%"
-                cr.select_font_face("Sans", 0, 0)  # Normal, Non Bold
-                cr.set_font_size(15)
-
-                # Get text extents to center it
-                extents = cr.text_extents(percentage_text)
-                text_x = center_x - extents.width / 2 - extents.x_bearing
-                text_y = center_y - extents.height / 2 - extents.y_bearing
-
-                cr.move_to(text_x, text_y)
-                cr.show_text(percentage_text)
+        # Only the shown whole percentage matters for a redraw
+        percent = round(progress * 100) if status_type == 'downloading' and progress is not None else None
+        state = (status_type, percent)
+        # Rows are re-notified far more often than their icon changes
+        if getattr(drawing_area, '_status_state', None) == state:
+            return
+        drawing_area._status_state = state
+        drawing_area._status_percent = percent
 
-        drawing_area.set_draw_func(draw_func)
+        draw_func = _STATUS_DRAW_FUNCS.get(status_type, _draw_status_nothing)
+        if getattr(drawing_area, '_status_draw_func', None) is not draw_func:
+            drawing_area._status_draw_func = draw_func
+            drawing_area.set_draw_func(draw_func)
         drawing_area.queue_draw()
 
     def _enable_row_subtitle_markup(self, row):
@@ -7898,6 +8131,7 @@ class SyncWindow(Gtk.ApplicationWindow):
                 # Update platform display name from mapping if available
                 if platform_slug and self.game_cache.platform_mapping:
                     game_copy['platform'] = self.game_cache.get_platform_name(platform_slug)
+                    drop_derived_keys(game_copy)
                 game_copy['is_downloaded'] = True
                 game_copy['local_path'] = str(local_path)
                 game_copy['local_size'] = self.get_actual_file_size(local_path)
@@ -7950,19 +8184,18 @@ class SyncWindow(Gtk.ApplicationWindow):
         Returns:
             bool: True if path is validly downloaded (folder with content or file with size > 1024)
         """
-        path = Path(path)
-        if not path.exists():
+        # One stat answers exists/is_dir/is_file/size
+        try:
+            st = os.stat(path)
+        except (OSError, ValueError):
             return False
 
-        if path.is_dir():
+        if stat.S_ISDIR(st.st_mode):
             # For folders, check if directory has content
-            try:
-                return any(path.iterdir())
-            except (PermissionError, OSError):
-                return False
-        elif path.is_file():
+            return dir_has_content(path)
+        elif stat.S_ISREG(st.st_mode):
             # For files, check if file has reasonable size
-            return path.stat().st_size > 1024
+            return st.st_size > 1024
 
         return False
 
@@ -8241,7 +8474,9 @@ class SyncWindow(Gtk.ApplicationWindow):
             'is_downloaded': is_downloaded,
             'local_path': str(local_path) if is_downloaded else None,
             'local_size': self.get_actual_file_size(local_path) if is_downloaded else 0,
-            'romm_data': essential_romm_data  # Much smaller object
+            'romm_data': essential_romm_data,  # Much smaller object
+            '_name_lc': (display_name or '').lower(),
+            '_platform_lc': (platform_display_name or '').lower()
         }
 
         # Add discs if this is a multi-disc game (only if there are multiple discs)
@@ -8594,6 +8829,16 @@ class SyncWindow(Gtk.ApplicationWindow):
                 margin: -8px;
             }
 
+            /* Collection sync status dots (see set_sync_dot_status) */
+            .sync-dot {
+                min-width: 8px;
+                min-height: 8px;
+                border-radius: 50%;
+            }
+            .sync-dot.synced { background: #4ade80; }
+            .sync-dot.syncing { background: #fb923c; }
+            .sync-dot.disabled { background: #6b7280; }
+
             /* Steam button in collection view - ensure proper padding to prevent truncation */
             button.flat.compact-switch {
                 padding: 4px;
@@ -10104,8 +10349,8 @@ class SyncWindow(Gtk.ApplicationWindow):
                 'speed': progress_info['speed'],
                 'downloaded': progress_info['downloaded'],
                 'total': progress_info['total'],
-                'downloading': True
             })
+            self.download_progress.set_downloading(rom_id, True)
         
         # Throttled tree view updates only
         if (current_time - last_update >= self._progress_update_interval or
@@ -10403,7 +10648,7 @@ class SyncWindow(Gtk.ApplicationWindow):
 
             # Save cache in background with original ungrouped count
             content_hash = hash(str(len(games)) + str(games[0].get('rom_id', '') if games else ''))
-            threading.Thread(target=lambda: self.game_cache.save_games_data(games, original_total=total_count), daemon=True).start()
+            threading.Thread(target=lambda: self.game_cache.save_games_data(games_for_cache(games), original_total=total_count), daemon=True).start()
 
             # Clear collections cache after main library refresh
             if hasattr(self, 'library_section'):
@@ -10481,7 +10726,7 @@ class SyncWindow(Gtk.ApplicationWindow):
             self._last_full_fetch_time = datetime.datetime.now(timezone.utc).isoformat()
 
             # Save updated cache in background
-            threading.Thread(target=lambda: self.game_cache.save_games_data(updated_games), daemon=True).start()
+            threading.Thread(target=lambda: self.game_cache.save_games_data(games_for_cache(updated_games)), daemon=True).start()
 
         except Exception as e:
             self.log_message(f"Incremental sync error: {e}")
@@ -11053,7 +11298,7 @@ class SyncWindow(Gtk.ApplicationWindow):
 
                         # Save cache to persist deletion status
                         if hasattr(self, 'game_cache'):
-                            threading.Thread(target=lambda: self.game_cache.save_games_data(self.available_games), daemon=True).start()
+                            threading.Thread(target=lambda: self.game_cache.save_games_data(games_for_cache(self.available_games)), daemon=True).start()
 
                         # Update UI - rebuild_children will check file existence for each variant
                         def update_ui():
@@ -11528,7 +11773,7 @@ class SyncWindow(Gtk.ApplicationWindow):
 
                         # Mark download as failed for child only
                         if child_rom_id and child_rom_id in self.download_progress:
-                            self.download_progress[child_rom_id]['downloading'] = False
+                            self.download_progress.set_downloading(child_rom_id, False)
                             GLib.idle_add(lambda rid=child_rom_id: self.library_section.update_game_progress(rid, self.download_progress[rid])
                                         if hasattr(self, 'library_section') else None)
 
@@ -12097,15 +12342,16 @@ class SyncWindow(Gtk.ApplicationWindow):
                                     # ADD THIS: Force property updates on affected collection platform items
                                     def force_collection_updates():
                                         model = self.library_section.library_model.tree_model
+                                        affected = []
                                         for i in range(model.get_n_items() if model else 0):
                                             tree_item = model.get_item(i)
                                             if tree_item and tree_item.get_depth() == 0:  # Collection level
                                                 platform_item = tree_item.get_item()
                                                 if isinstance(platform_item, PlatformItem):
                                                     if platform_item.platform_name in updated_collections:
-                                                        # Force property notifications to update Status/Size
-                                                        platform_item.notify('status-text')
-                                                        platform_item.notify('size-text')
+                                                        affected.append(platform_item)
+                                        # Force property notifications to update Status/Size
+                                        notify_items(affected, 'status-text', 'size-text')
                                         return False
                                     
                                     GLib.timeout_add(150, force_collection_updates)                          